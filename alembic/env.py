@@ -1,8 +1,10 @@
+import os
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from sql_app.models import Base  # Update this import based on your project structure
+from sql_app.config import settings
 from alembic import context
 
 # this is the Alembic Config object, which provides
@@ -14,6 +16,10 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+# Migrate the same database the app connects to when DATABASE_URL is set
+if os.getenv("DATABASE_URL"):
+    config.set_main_option("sqlalchemy.url", settings.url)
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # from myapp import mymodel
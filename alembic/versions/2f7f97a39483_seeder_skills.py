@@ -24,9 +24,9 @@ def upgrade() -> None:
     bind = op.get_bind()
     session = Session(bind=bind, autocommit=False, autoflush=True)
 
-    # Call the seed function
+    # Call the seed function; skills.name is not unique yet at this revision
     from seeder.skills import seed_skills
-    seed_skills(session)
+    seed_skills(session, upsert=False)
     # ### end Alembic commands ###
 
 
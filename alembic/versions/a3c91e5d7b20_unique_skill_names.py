@@ -0,0 +1,45 @@
+"""unique-skill-names
+
+Revision ID: a3c91e5d7b20
+Revises: 5346b08351d1
+Create Date: 2026-10-18 10:12:41.208311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91e5d7b20'
+down_revision: Union[str, None] = '5346b08351d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fold duplicate skill names into the oldest row before making name unique,
+    # so the ON CONFLICT (name) upsert in sql_app.crud has an arbiter index.
+    for link_table in ('profile_skills', 'project_skills'):
+        op.execute(f"""
+            UPDATE {link_table} SET skill_id = dup.keep_id
+            FROM (
+                SELECT id, min(id) OVER (PARTITION BY name) AS keep_id
+                FROM skills WHERE name IS NOT NULL
+            ) AS dup
+            WHERE {link_table}.skill_id = dup.id AND dup.id <> dup.keep_id
+        """)
+    op.execute("""
+        DELETE FROM skills
+        USING (
+            SELECT id, min(id) OVER (PARTITION BY name) AS keep_id
+            FROM skills WHERE name IS NOT NULL
+        ) AS dup
+        WHERE skills.id = dup.id AND dup.id <> dup.keep_id
+    """)
+    op.create_index(op.f('ix_skills_name'), 'skills', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_skills_name'), table_name='skills')
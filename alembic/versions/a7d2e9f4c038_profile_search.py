@@ -0,0 +1,59 @@
+"""profile-search
+
+Revision ID: a7d2e9f4c038
+Revises: f2a8d3c61b97
+Create Date: 2026-10-18 18:12:36.904157
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d2e9f4c038'
+down_revision: Union[str, None] = 'f2a8d3c61b97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Full-text indexes for /search/profiles. The expressions must stay identical to
+# the ones sql_app/search.py queries with, 'simple' config included.
+SEARCH_INDEXES = [
+    ('ix_profile_search_document', 'profile_search', "to_tsvector('simple', document)"),
+    ('ix_projects_title_search', 'projects', "to_tsvector('simple', title)"),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'profile_search',
+        sa.Column('profile_id', sa.Integer(), sa.ForeignKey('profiles.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('document', sa.String(), nullable=False),
+    )
+    # Same text as sql_app.search.document_expression(); large tables can
+    # instead be filled in batches with `python -m sql_app.search`
+    op.execute("""
+        INSERT INTO profile_search (profile_id, document)
+        SELECT p.id, concat_ws(' ', p.full_name, p.profile_type, p.address_area,
+            (SELECT string_agg(coalesce(pr.title, '') || ' ' || coalesce(pr.description, ''), ' ') FROM projects pr WHERE pr.profile_id = p.id),
+            (SELECT string_agg(coalesce(e.title, '') || ' ' || coalesce(e.company, ''), ' ') FROM job_experiences e WHERE e.profile_id = p.id),
+            (SELECT string_agg(s.name, ' ') FROM profile_skills ps JOIN skills s ON s.id = ps.skill_id WHERE ps.profile_id = p.id),
+            (SELECT string_agg(s.name, ' ') FROM projects pr JOIN project_skills ps ON ps.project_id = pr.id
+                JOIN skills s ON s.id = ps.skill_id WHERE pr.profile_id = p.id))
+        FROM profiles p
+    """)
+
+    with op.get_context().autocommit_block():
+        for name, table, expression in SEARCH_INDEXES:
+            op.create_index(
+                name, table, [sa.text(expression)], unique=False,
+                postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, expression in SEARCH_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    op.drop_table('profile_search')
@@ -0,0 +1,77 @@
+"""case-insensitive-names
+
+Revision ID: b1e5f7a9c2d4
+Revises: a7d2e9f4c038
+Create Date: 2026-10-19 09:41:17.530284
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b1e5f7a9c2d4'
+down_revision: Union[str, None] = 'a7d2e9f4c038'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Skill and institution names are unique ignoring case, the same rule the name
+# caches in sql_app/cache.py key by. Rows whose names differ only in case are
+# folded into the oldest one first.
+DUPLICATES = """
+    SELECT id, min(id) OVER (PARTITION BY lower(name)) AS keep_id
+    FROM {table} WHERE name IS NOT NULL
+"""
+
+
+def fold_skills() -> None:
+    for link_table, owner in (('profile_skills', 'profile_id'), ('project_skills', 'project_id')):
+        # Relink to the kept skill; an owner linked to several spellings keeps one link
+        op.execute(f"""
+            INSERT INTO {link_table} ({owner}, skill_id)
+            SELECT DISTINCT {link_table}.{owner}, dup.keep_id
+            FROM {link_table} JOIN ({DUPLICATES.format(table='skills')}) AS dup ON {link_table}.skill_id = dup.id
+            WHERE dup.id <> dup.keep_id
+            ON CONFLICT DO NOTHING
+        """)
+        op.execute(f"""
+            DELETE FROM {link_table}
+            USING ({DUPLICATES.format(table='skills')}) AS dup
+            WHERE {link_table}.skill_id = dup.id AND dup.id <> dup.keep_id
+        """)
+    op.execute(f"""
+        DELETE FROM skills
+        USING ({DUPLICATES.format(table='skills')}) AS dup
+        WHERE skills.id = dup.id AND dup.id <> dup.keep_id
+    """)
+
+
+def fold_institutions() -> None:
+    op.execute(f"""
+        UPDATE educations SET institution_id = dup.keep_id
+        FROM ({DUPLICATES.format(table='institutions')}) AS dup
+        WHERE educations.institution_id = dup.id AND dup.id <> dup.keep_id
+    """)
+    op.execute(f"""
+        DELETE FROM institutions
+        USING ({DUPLICATES.format(table='institutions')}) AS dup
+        WHERE institutions.id = dup.id AND dup.id <> dup.keep_id
+    """)
+
+
+def upgrade() -> None:
+    fold_skills()
+    fold_institutions()
+    op.drop_index('ix_skills_name', table_name='skills')
+    op.create_index('ix_skills_name_lower', 'skills', [sa.text('lower(name)')], unique=True)
+    op.drop_constraint('institutions_name_key', 'institutions', type_='unique')
+    op.create_index('ix_institutions_name_lower', 'institutions', [sa.text('lower(name)')], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_institutions_name_lower', table_name='institutions')
+    op.create_unique_constraint('institutions_name_key', 'institutions', ['name'])
+    op.drop_index('ix_skills_name_lower', table_name='skills')
+    op.create_index('ix_skills_name', 'skills', ['name'], unique=True)
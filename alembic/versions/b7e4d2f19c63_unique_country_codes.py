@@ -0,0 +1,41 @@
+"""unique-country-codes
+
+Revision ID: b7e4d2f19c63
+Revises: a3c91e5d7b20
+Create Date: 2026-10-18 11:03:52.914027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4d2f19c63'
+down_revision: Union[str, None] = 'a3c91e5d7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop countries duplicated by earlier seeder runs, keeping the oldest row
+    op.execute("""
+        DELETE FROM countries
+        USING countries AS kept
+        WHERE countries.code = kept.code AND countries.id > kept.id
+    """)
+    op.drop_index(op.f('ix_countries_code'), table_name='countries')
+    op.create_index(op.f('ix_countries_code'), 'countries', ['code'], unique=True)
+
+    # Re-run the seeder as an upsert to refresh names from seeder/data/countries.csv
+    bind = op.get_bind()
+    session = Session(bind=bind, autocommit=False, autoflush=True)
+    from seeder.country import seed_countries
+    seed_countries(session)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_countries_code'), table_name='countries')
+    op.create_index(op.f('ix_countries_code'), 'countries', ['code'], unique=False)
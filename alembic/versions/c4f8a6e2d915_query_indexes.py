@@ -0,0 +1,82 @@
+"""query-indexes
+
+Revision ID: c4f8a6e2d915
+Revises: b7e4d2f19c63
+Create Date: 2026-10-18 12:20:07.633418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8a6e2d915'
+down_revision: Union[str, None] = 'b7e4d2f19c63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# ix_<table>_id indexes duplicating the primary key index
+REDUNDANT_ID_INDEXES = [
+    'countries', 'skills', 'users', 'profiles', 'projects', 'job_experiences',
+    'institutions', 'educations', 'certificates',
+]
+
+# Foreign keys the routes in src/users.py filter or join on
+FOREIGN_KEY_INDEXES = [
+    ('projects', 'profile_id'),
+    ('job_experiences', 'profile_id'),
+    ('educations', 'user_id'),
+    ('certificates', 'profile_id'),
+    ('profile_skills', 'skill_id'),
+    ('project_skills', 'skill_id'),
+]
+
+# Link tables turned into association tables keyed by (owner, skill)
+LINK_TABLES = [
+    ('profile_skills', 'profile_id'),
+    ('project_skills', 'project_id'),
+]
+
+
+def upgrade() -> None:
+    # Link rows that cannot satisfy the new primary key: orphans and duplicates
+    for table, owner in LINK_TABLES:
+        op.execute(f"DELETE FROM {table} WHERE {owner} IS NULL OR skill_id IS NULL")
+        op.execute(f"""
+            DELETE FROM {table} AS duplicate USING {table} AS kept
+            WHERE duplicate.{owner} = kept.{owner} AND duplicate.skill_id = kept.skill_id
+            AND duplicate.id > kept.id
+        """)
+        op.drop_column(table, 'id')
+        op.alter_column(table, owner, existing_type=sa.Integer(), nullable=False)
+        op.alter_column(table, 'skill_id', existing_type=sa.Integer(), nullable=False)
+
+    # Index builds must not block writes on a live database
+    with op.get_context().autocommit_block():
+        for table in REDUNDANT_ID_INDEXES:
+            op.drop_index(op.f(f'ix_{table}_id'), table_name=table, postgresql_concurrently=True, if_exists=True)
+        for table, column in FOREIGN_KEY_INDEXES:
+            op.create_index(op.f(f'ix_{table}_{column}'), table, [column], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        for table, owner in LINK_TABLES:
+            op.create_index(f'{table}_pkey', table, [owner, 'skill_id'], unique=True, postgresql_concurrently=True, if_not_exists=True)
+
+    # Promote the prebuilt unique indexes, which only takes a brief lock
+    for table, owner in LINK_TABLES:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY USING INDEX {table}_pkey")
+
+
+def downgrade() -> None:
+    for table, owner in LINK_TABLES:
+        op.drop_constraint(f'{table}_pkey', table, type_='primary')
+        op.execute(f"ALTER TABLE {table} ADD COLUMN id SERIAL PRIMARY KEY")
+        op.alter_column(table, owner, existing_type=sa.Integer(), nullable=True)
+        op.alter_column(table, 'skill_id', existing_type=sa.Integer(), nullable=True)
+        op.create_index(op.f(f'ix_{table}_id'), table, ['id'], unique=False)
+
+    with op.get_context().autocommit_block():
+        for table, column in FOREIGN_KEY_INDEXES:
+            op.drop_index(op.f(f'ix_{table}_{column}'), table_name=table, postgresql_concurrently=True, if_exists=True)
+        for table in REDUNDANT_ID_INDEXES:
+            op.create_index(op.f(f'ix_{table}_id'), table, ['id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
@@ -0,0 +1,41 @@
+"""keyset-indexes
+
+Revision ID: d9a3b7c15e42
+Revises: c4f8a6e2d915
+Create Date: 2026-10-18 15:02:44.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a3b7c15e42'
+down_revision: Union[str, None] = 'c4f8a6e2d915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Paginated lists read WHERE owner = ? AND id > ? ORDER BY id LIMIT n; an
+# (owner, id) index answers that without sorting the owner's rows and still
+# serves plain foreign key lookups, so it replaces the single column index.
+KEYSET_INDEXES = [
+    ('projects', 'profile_id'),
+    ('job_experiences', 'profile_id'),
+    ('educations', 'user_id'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, owner in KEYSET_INDEXES:
+            op.create_index(f'ix_{table}_{owner}_id', table, [owner, 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index(op.f(f'ix_{table}_{owner}'), table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, owner in KEYSET_INDEXES:
+            op.create_index(op.f(f'ix_{table}_{owner}'), table, [owner], unique=False, postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index(f'ix_{table}_{owner}_id', table_name=table, postgresql_concurrently=True, if_exists=True)
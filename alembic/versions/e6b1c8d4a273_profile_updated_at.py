@@ -0,0 +1,32 @@
+"""profile-updated-at
+
+Revision ID: e6b1c8d4a273
+Revises: d9a3b7c15e42
+Create Date: 2026-10-18 16:21:07.530914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b1c8d4a273'
+down_revision: Union[str, None] = 'd9a3b7c15e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # now() is evaluated once for the ALTER, so existing rows are not rewritten
+    # and all start with the migration time as their watermark
+    op.add_column('profiles', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_profiles_updated_at'), 'profiles', ['updated_at'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_profiles_updated_at'), table_name='profiles', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('profiles', 'updated_at')
@@ -0,0 +1,37 @@
+"""institution-name-trigram
+
+Revision ID: f2a8d3c61b97
+Revises: e6b1c8d4a273
+Create Date: 2026-10-18 17:04:52.216481
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8d3c61b97'
+down_revision: Union[str, None] = 'e6b1c8d4a273'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# GIN trigram index for /institutions/autocomplete: serves name ILIKE '%q%' and
+# similarity() ranking. It is kept out of sql_app/models.py so create_all keeps
+# working on databases without pg_trgm (SQLite falls back to a LIKE scan).
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_institutions_name_trgm', 'institutions', ['name'], unique=False,
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_institutions_name_trgm', table_name='institutions', postgresql_concurrently=True, if_exists=True)
@@ -24,9 +24,9 @@ def upgrade() -> None:
     bind = op.get_bind()
     session = Session(bind=bind, autocommit=False, autoflush=True)
 
-    # Call the seed function
+    # Call the seed function; countries.code is not unique yet at this revision
     from seeder.country import seed_countries
-    seed_countries(session)
+    seed_countries(session, upsert=False)
     # ### end Alembic commands ###
 
 
@@ -0,0 +1,133 @@
+# Cold start benchmark for main:app
+#
+# Starts fresh interpreters that import main and run the app's lifespan startup
+# (pool, caches, compiled queries, see src/startup.py), the work a new worker
+# does before it takes traffic. Reports the median time to ready with the
+# startup phases, and an import-time breakdown from one extra `-X importtime`
+# run, by package and for the app's own modules.
+#
+#   python -m benchmarks.cold_start --runs 5 --budget-ms 2500 --out cold_start.json
+#
+# Exits with status 1 when the median cold start is over --budget-ms, so CI can
+# keep it from creeping up. Without --database-url a throwaway SQLite file is used.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+APP_PACKAGES = ("main", "src", "sql_app")
+
+# Imports the app and runs its lifespan startup and shutdown once
+CHILD = """
+import asyncio, json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def start():
+    async with main.app.router.lifespan_context(main.app):
+        pass
+
+asyncio.run(start())
+print(json.dumps({"import_ms": (imported - started) * 1000, "phases": main.startup_report}))
+"""
+
+CREATE_TABLES = "from sql_app import database, models; database.Base.metadata.create_all(database.engine)"
+
+
+def run_child(env, import_time=False):
+    command = [sys.executable] + (["-X", "importtime"] if import_time else []) + ["-c", CHILD]
+    started = time.perf_counter()
+    result = subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+    elapsed = (time.perf_counter() - started) * 1000
+    return elapsed, json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def parse_import_time(stderr):
+    # "import time: self [us] | cumulative | imported package" lines
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def import_breakdown(modules, top):
+    by_package = defaultdict(int)
+    for name, self_us, _ in modules:
+        by_package[name.split(".")[0]] += self_us
+    packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+    app_modules = sorted(
+        (module for module in modules if module[0].split(".")[0] in APP_PACKAGES), key=lambda module: module[2], reverse=True
+    )[:top]
+    return {
+        "total_ms": round(sum(self_us for _, self_us, _ in modules) / 1000, 2),
+        "packages_ms": {name: round(self_us / 1000, 2) for name, self_us in packages},
+        "app_modules_cumulative_ms": {name: round(cumulative_us / 1000, 2) for name, _, cumulative_us in app_modules},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the cold start of main:app")
+    parser.add_argument("--database-url", help="database the app starts against (default: temporary SQLite file)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="packages and app modules listed in the import breakdown")
+    parser.add_argument("--budget-ms", type=float, help="fail when the median cold start takes longer")
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    temporary_db = None
+    if args.database_url:
+        env["DATABASE_URL"] = args.database_url
+    else:
+        handle, temporary_db = tempfile.mkstemp(prefix="cold-start-", suffix=".db")
+        os.close(handle)
+        env["DATABASE_URL"] = "sqlite:///{}".format(temporary_db)
+        subprocess.run([sys.executable, "-c", CREATE_TABLES], env=env, check=True)
+
+    try:
+        runs = [run_child(env)[:2] for _ in range(args.runs)]
+        _, _, import_time_stderr = run_child(env, import_time=True)
+    finally:
+        if temporary_db:
+            os.remove(temporary_db)
+
+    cold_start = [elapsed for elapsed, _ in runs]
+    median = statistics.median(cold_start)
+    phases = defaultdict(list)
+    for _, report in runs:
+        phases["import"].append(report["import_ms"])
+        for name, value in report["phases"].items():
+            if name != "import":
+                phases[name].append(value)
+
+    report = {
+        "runs": args.runs,
+        "cold_start_ms": {"median": round(median, 2), "min": round(min(cold_start), 2), "max": round(max(cold_start), 2)},
+        "phases_median_ms": {name: round(statistics.median(values), 2) for name, values in phases.items()},
+        "imports": import_breakdown(parse_import_time(import_time_stderr), args.top),
+        "budget_ms": args.budget_ms,
+    }
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as report_file:
+            report_file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.budget_ms is not None and median > args.budget_ms:
+        print("cold start {:.0f} ms is over the {:.0f} ms budget".format(median, args.budget_ms), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# Index coverage check for the queries issued by the routers in src/
+#
+# EXPLAINs every lookup the routes make and exits with status 1 when one of
+# them needs a full table scan, or an explicit sort for the keyset pages. On
+# PostgreSQL sequential scans are disabled for the session first, so the
+# planner only falls back to one when no usable index exists; on SQLite
+# EXPLAIN QUERY PLAN must report SEARCH, not SCAN, and no temp B-tree.
+# Search, export and autocomplete statements come from the builders their
+# routes use, so a change to those queries is checked here too.
+#
+#   python -m benchmarks.explain_queries --database-url postgresql://.../network
+#
+# Without --database-url the schema is created from sql_app.models in a
+# throwaway SQLite file. tests/test_query_plans.py runs the same check.
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+
+# Plan steps some queries cannot avoid, by query name. "group" is a sort done
+# for a GROUP BY over the rows already found through an index.
+EXPECTED_STEPS = {
+    # AND over skills groups the matching profile_skills rows by profile
+    "search by skills": {"group"},
+    # Counts can only be ordered once they are counted
+    "search skill facets": {"group", "sort"},
+    # Full exports stream every profile in id order; the join order must not need a sort
+    "export projects": {"full scan of profiles"},
+    "export profile skills": {"full scan of profile_skills"},
+    # GIN matches come back unordered and are ranked or paged afterwards
+    "search by text": {"sort"},
+    "search by project title": {"sort"},
+    "institution autocomplete": {"sort"},
+}
+
+
+def router_queries(dialect_name):
+    from sqlalchemy import func, select
+    from sql_app.crud import institution_search_statement
+    from sql_app.models import (
+        Certificate, Education, Experience, Institution, Profile, ProfileSkills, Project, ProjectSkills, Skills, User,
+    )
+    from sql_app.search import (
+        every_skill_condition, full_text_condition, matching_ids_condition, project_title_condition, skill_facet_statement,
+    )
+    from src.export import profile_skill_statement, project_statement
+
+    def search_page(*conditions):
+        # As keyset_page() pages a search after its first page
+        return select(Profile).where(*conditions, Profile.id > 100).order_by(Profile.id).limit(51)
+
+    by_skills = select(Profile).where(every_skill_condition({1, 2}), Profile.experience >= 3)
+    queries = {
+        "user by email": select(User).where(User.email == "user@example.com"),
+        "user by id": select(User).where(User.id == 1),
+        "profiles by user": select(Profile).where(Profile.user_id == 1),
+        "profile by id": select(Profile).where(Profile.id == 1),
+        "project by id": select(Project).where(Project.id == 1),
+        "projects by profile": select(Project).where(Project.profile_id == 1),
+        "experiences by profile": select(Experience).where(Experience.profile_id == 1),
+        "projects page": select(Project).where(Project.profile_id == 1, Project.id > 100).order_by(Project.id).limit(51),
+        "experiences page": select(Experience).where(Experience.profile_id == 1, Experience.id > 100).order_by(Experience.id).limit(51),
+        "educations page": (
+            select(Education).join(Institution).where(Education.user_id == 1, Education.id > 100).order_by(Education.id).limit(51)
+        ),
+        "certificates by profile": select(Certificate).where(Certificate.profile_id == 1),
+        "educations by user": select(Education).join(Institution).where(Education.user_id == 1),
+        "institutions by name": select(Institution.id, Institution.name).where(func.lower(Institution.name).in_(["mit"])),
+        "skills by name": select(Skills.id, Skills.name).where(func.lower(Skills.name).in_(["python", "sql"])),
+        "profile skills": select(Skills).join(ProfileSkills).where(ProfileSkills.profile_id == 1),
+        "project skills": select(Skills).join(ProjectSkills).where(ProjectSkills.project_id.in_([1, 2])),
+        "profiles by skill": select(ProfileSkills.profile_id).where(ProfileSkills.skill_id == 1),
+        "search by skills": search_page(every_skill_condition({1, 2}), Profile.experience >= 3),
+        "search skill facets": skill_facet_statement(by_skills),
+        "export projects": project_statement(),
+        "export profile skills": profile_skill_statement(),
+    }
+    if dialect_name == "postgresql":
+        # Served by the GIN indexes the migrations create; without them (SQLite)
+        # text is matched in process and titles and names are scanned with LIKE
+        queries.update({
+            "search by text": search_page(full_text_condition("data engineer")),
+            "search by project title": search_page(project_title_condition("compiler", True)),
+            "institution autocomplete": institution_search_statement("mit", dialect_name),
+        })
+    else:
+        queries["search by text"] = search_page(matching_ids_condition({1, 2, 3}))
+    return queries
+
+
+def postgresql_scans(connection, sql):
+    from sqlalchemy import text
+    plan = connection.execute(text("EXPLAIN (FORMAT JSON) " + sql)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    scans = []
+
+    def walk(node, parent_type=None):
+        if node["Node Type"] == "Seq Scan":
+            scans.append("full scan of " + node["Relation Name"])
+        elif node["Node Type"] == "Sort":
+            scans.append("group" if parent_type == "Aggregate" else "sort")
+        for child in node.get("Plans", ()):
+            walk(child, node["Node Type"])
+
+    walk(plan[0]["Plan"])
+    return scans
+
+
+def sqlite_scans(connection, sql):
+    from sqlalchemy import text
+    details = [row[-1] for row in connection.execute(text("EXPLAIN QUERY PLAN " + sql))]
+    scans = ["full scan of " + detail.split()[1] for detail in details if detail.startswith("SCAN ")]
+    return scans + [
+        "group" if detail.endswith("GROUP BY") else "sort" for detail in details if detail.startswith("USE TEMP B-TREE")
+    ]
+
+
+def unindexed_queries(engine):
+    # {query name: unexpected full scans and sorts} for every router query
+    from sqlalchemy import text
+    plans = {}
+    with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            connection.execute(text("SET LOCAL enable_seqscan = off"))
+        for name, query in router_queries(engine.dialect.name).items():
+            sql = str(query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+            scans = postgresql_scans(connection, sql) if engine.dialect.name == "postgresql" else sqlite_scans(connection, sql)
+            plans[name] = [scan for scan in scans if scan not in EXPECTED_STEPS.get(name, ())]
+        connection.rollback()
+    return plans
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that router queries are served by indexes")
+    parser.add_argument("--database-url", help="migrated database to check (default: temporary SQLite file)")
+    args = parser.parse_args(argv)
+
+    temporary_db = None
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        handle, temporary_db = tempfile.mkstemp(prefix="explain-", suffix=".db")
+        os.close(handle)
+        os.environ["DATABASE_URL"] = "sqlite:///{}".format(temporary_db)
+
+    from sql_app import database, models  # noqa: F401
+
+    try:
+        if temporary_db:
+            database.Base.metadata.create_all(database.engine)
+        plans = unindexed_queries(database.engine)
+    finally:
+        if temporary_db:
+            os.remove(temporary_db)
+
+    failures = [name for name, scans in plans.items() if scans]
+    for name, scans in plans.items():
+        print("{:<26} {}".format(name, ", ".join(scans) if scans else "index"))
+    if failures:
+        print("{} queries not served by an index: {}".format(len(failures), ", ".join(failures)), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# Profile search benchmark
+#
+# Seeds a synthetic dataset with seeder.bulk, builds the search documents and
+# times sql_app.search.search_profiles() for typical recruiter queries, with
+# latency percentiles, result counts and SQL statements per search.
+#
+#   python -m benchmarks.search --database-url postgresql://localhost/search_bench --users 1000000 --out search.json
+#
+# 1M profiles is the target size and needs PostgreSQL (full-text and GIN
+# indexes, so run the alembic migrations on the database first). Without
+# --database-url a throwaway SQLite file and the in-process inverted index are
+# used; keep --users small there.
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.users_router import percentile
+
+
+def build_scenarios(args, rng):
+    # name -> factory returning the ProfileQuery of one search
+    from sql_app.search import ProfileQuery
+    from seeder.synthetic import COMPANIES, LOCATIONS, PROFILE_TYPES
+
+    def skill():
+        return "Skill {}".format(rng.randrange(1, args.skills + 1))
+
+    def project_title():
+        return "Project {}".format(rng.randrange(1, args.users * args.projects_per_profile + 1))
+
+    return {
+        "text": lambda: ProfileQuery(text="{} {}".format(rng.choice(COMPANIES), rng.choice(PROFILE_TYPES).title())),
+        "skills_all_of_2": lambda: ProfileQuery(skills=(skill(), skill())),
+        "skills_and_experience": lambda: ProfileQuery(skills=(skill(), skill()), min_experience=3),
+        "project_title": lambda: ProfileQuery(project_title=project_title()),
+        "combined": lambda: ProfileQuery(
+            text=rng.choice(LOCATIONS), skills=(skill(),), min_experience=3, profile_type=rng.choice(PROFILE_TYPES),
+        ),
+    }
+
+
+def run_scenario(factory, iterations, facets):
+    from sqlalchemy import event
+    from sql_app import database
+    from sql_app.keyset import PageRequest
+    from sql_app.search import search_profiles
+
+    counter = [0]
+
+    def count_statement(*args):
+        counter[0] += 1
+
+    latencies = []
+    statements = []
+    results = []
+    event.listen(database.engine, "before_cursor_execute", count_statement)
+    try:
+        for _ in range(iterations):
+            query = factory()
+            counter[0] = 0
+            with database.SessionLocal() as db:
+                started = time.perf_counter()
+                _, _, total, _ = search_profiles(db, query, PageRequest(include_total=True), facets)
+                latencies.append((time.perf_counter() - started) * 1000)
+            statements.append(counter[0])
+            results.append(total)
+    finally:
+        event.remove(database.engine, "before_cursor_execute", count_statement)
+
+    return {
+        "iterations": iterations,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 3),
+            "p50": round(percentile(latencies, 50), 3),
+            "p95": round(percentile(latencies, 95), 3),
+            "p99": round(percentile(latencies, 99), 3),
+        },
+        "mean_matches": round(sum(results) / len(results), 1),
+        "queries_per_search": round(sum(statements) / len(statements), 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark profile search")
+    parser.add_argument("--database-url", help="database to seed and benchmark (default: temporary SQLite file)")
+    parser.add_argument("--users", type=int, default=1000000)
+    parser.add_argument("--projects-per-profile", type=int, default=3)
+    parser.add_argument("--skills", type=int, default=500)
+    parser.add_argument("--skills-per-profile", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=50, help="measured searches per scenario")
+    parser.add_argument("--no-facets", action="store_true", help="skip the skill facet query")
+    parser.add_argument("--skip-seed", action="store_true", help="reuse the data already in --database-url")
+    parser.add_argument("--scenarios", nargs="*", help="subset of scenario names to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    # sql_app.database builds its engines at import time, so the URL must be set first
+    temporary_db = None
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        handle, temporary_db = tempfile.mkstemp(prefix="search-bench-", suffix=".db")
+        os.close(handle)
+        os.environ["DATABASE_URL"] = "sqlite:///{}".format(temporary_db)
+
+    try:
+        from seeder.bulk import run_seed
+        import seeder.synthetic  # noqa: F401
+        from sql_app import database
+        from sql_app.search import rebuild_all_documents
+
+        if not args.skip_seed:
+            database.Base.metadata.create_all(database.engine)
+            options = {
+                "users": args.users,
+                "projects_per_profile": args.projects_per_profile,
+                "skills": args.skills,
+                "skills_per_profile": args.skills_per_profile,
+                "skills_per_project": 2,
+                "experiences_per_profile": 2,
+            }
+            for result in run_seed(database.engine, options, seed=args.seed):
+                print("{:<16} {:>10} rows {:>8.2f}s".format(result.source, result.rows, result.seconds), file=sys.stderr)
+            started = time.perf_counter()
+            with database.SessionLocal() as db:
+                rebuilt = rebuild_all_documents(db)
+            print("{:<16} {:>10} rows {:>8.2f}s".format("profile_search", rebuilt, time.perf_counter() - started), file=sys.stderr)
+
+        rng = random.Random(args.seed)
+        scenarios = build_scenarios(args, rng)
+        results = {}
+        for name in args.scenarios or list(scenarios):
+            # One unmeasured search loads caches (and the inverted index on SQLite)
+            run_scenario(scenarios[name], 1, not args.no_facets)
+            results[name] = run_scenario(scenarios[name], args.iterations, not args.no_facets)
+            print("{:<24} p50 {:>9.2f} ms  p95 {:>9.2f} ms  {:>10.1f} matches  {:>4.1f} queries".format(
+                name, results[name]["latency_ms"]["p50"], results[name]["latency_ms"]["p95"],
+                results[name]["mean_matches"], results[name]["queries_per_search"],
+            ), file=sys.stderr)
+    finally:
+        if temporary_db:
+            os.remove(temporary_db)
+
+    report = {
+        "meta": {
+            "database": database.engine.dialect.name,
+            "users": args.users,
+            "projects_per_profile": args.projects_per_profile,
+            "skills": args.skills,
+            "facets": not args.no_facets,
+        },
+        "scenarios": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as report_file:
+            report_file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
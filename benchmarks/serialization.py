@@ -0,0 +1,149 @@
+# Response encoding micro-benchmark
+#
+# Loads one large profile aggregate and the countries list into memory, then
+# times only the encoding of the response body for three paths:
+#
+#   jsonable_encoder  - raw ORM objects in a dict, FastAPI's fallback encoder and
+#                       JSONResponse (how the routes worked before response models)
+#   response_model    - validation into Envelope[...] from attributes, pydantic-core
+#                       serialization and FastJSONResponse (the routes today)
+#   model_dump_json   - Envelope[...] validated and dumped to JSON in one pass
+#                       (the pre-encoded profile documents)
+#
+#   python -m benchmarks.serialization --projects 200 --iterations 200 --out serialization.json
+#
+# Uses a throwaway SQLite file, so no external services are needed.
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+from typing import List
+
+
+def measure(func, iterations):
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return round((time.perf_counter() - started) / iterations * 1000, 4)
+
+
+def seed_profile(db, args):
+    from sqlalchemy import insert
+    from sql_app.models import Certificate, Experience, Profile, Project, ProjectSkills, ProfileSkills, Skills, User
+
+    user = User(email="serialization-benchmark@example.com", name="Benchmark")
+    db.add(user)
+    db.flush()
+    profile = Profile(user_id=user.id, profile_type="developer", full_name="Benchmark Profile", email=user.email)
+    db.add(profile)
+    db.flush()
+
+    skill_ids = db.scalars(
+        insert(Skills).returning(Skills.id), [{"name": "Benchmark skill {}".format(n)} for n in range(args.skills)]
+    ).all()
+    project_ids = db.scalars(insert(Project).returning(Project.id), [
+        {"profile_id": profile.id, "title": "Project {}".format(n), "description": "Description of project {}".format(n),
+         "start_date": date(2020, 1, 1), "end_date": date(2021, 1, 1), "image": "projects/{}.png".format(n)}
+        for n in range(args.projects)
+    ]).all()
+    db.execute(insert(ProjectSkills), [
+        {"project_id": project_id, "skill_id": skill_ids[(position + n) % len(skill_ids)]}
+        for position, project_id in enumerate(project_ids) for n in range(args.skills_per_project)
+    ])
+    db.execute(insert(ProfileSkills), [{"profile_id": profile.id, "skill_id": skill_id} for skill_id in skill_ids])
+    db.execute(insert(Experience), [
+        {"profile_id": profile.id, "title": "Role {}".format(n), "company": "Company {}".format(n), "location": "Remote",
+         "start_date": date(2015, 1, 1), "end_date": date(2016, 1, 1), "description": "Worked on things"}
+        for n in range(args.experiences)
+    ])
+    db.execute(insert(Certificate), [
+        {"profile_id": profile.id, "name": "Certificate {}".format(n), "issuer": "Issuer", "issue_date": date(2019, 1, 1)}
+        for n in range(args.certificates)
+    ])
+    db.commit()
+    return profile.id
+
+
+def encode_paths(schema, content, message):
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    from pydantic import TypeAdapter
+    from sql_app.schemas import Envelope
+    from src.responses import FastJSONResponse
+
+    model = Envelope[schema]
+    adapter = TypeAdapter(model)
+    envelope = {"data": content, "status": True, "message": message}
+
+    def response_model():
+        # What FastAPI does for a route with response_model
+        validated = adapter.validate_python(envelope, from_attributes=True)
+        return FastJSONResponse(adapter.dump_python(validated, mode="json")).body
+
+    return {
+        "jsonable_encoder": lambda: JSONResponse(jsonable_encoder(envelope)).body,
+        "response_model": response_model,
+        "model_dump_json": lambda: model.model_validate(envelope, from_attributes=True).model_dump_json().encode("utf-8"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark response encoding for large payloads")
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--skills", type=int, default=50)
+    parser.add_argument("--skills-per-project", type=int, default=5)
+    parser.add_argument("--experiences", type=int, default=50)
+    parser.add_argument("--certificates", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    handle, path = tempfile.mkstemp(prefix="serialization-bench-", suffix=".db")
+    os.close(handle)
+    os.environ["DATABASE_URL"] = "sqlite:///{}".format(path)
+    try:
+        from sqlalchemy import select
+        from sql_app import database
+        from sql_app.crud import get_profile_detail
+        from sql_app.models import Country
+        from sql_app.schemas import CountryResponse, ProfileDetail
+        from seeder.country import seed_countries
+
+        database.Base.metadata.create_all(database.engine)
+        with database.SessionLocal() as db:
+            seed_countries(db)
+            profile = get_profile_detail(db, seed_profile(db, args))
+            countries = db.scalars(select(Country).order_by(Country.id)).all()
+
+            payloads = {
+                "profile": encode_paths(ProfileDetail, profile, "Profile fetched successfully"),
+                "countries": encode_paths(List[CountryResponse], countries, "Countries fetched successfully"),
+            }
+            results = {}
+            for payload, paths in payloads.items():
+                results[payload] = {"bytes": len(paths["response_model"]())}
+                for name, encode in paths.items():
+                    results[payload][name + "_ms"] = measure(encode, args.iterations)
+                baseline = results[payload]["jsonable_encoder_ms"]
+                print("{:<10} {:>8} bytes  ".format(payload, results[payload]["bytes"]) + "  ".join(
+                    "{} {:.3f} ms ({:.1f}x)".format(name, results[payload][name + "_ms"], baseline / results[payload][name + "_ms"])
+                    for name in paths
+                ), file=sys.stderr)
+    finally:
+        os.remove(path)
+
+    output = json.dumps({"iterations": args.iterations, "projects": args.projects, "payloads": results}, indent=2)
+    if args.out:
+        with open(args.out, "w") as report_file:
+            report_file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Access token micro-benchmark
+#
+# Compares tokens/sec for encode and decode between python-jose HS256 (the
+# previous implementation, skipped when not installed) and src.tokens with
+# HS256, EdDSA and ES256 keys (the last two need `cryptography`).
+#
+#   python -m benchmarks.tokens --iterations 20000 --out tokens.json
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+
+SECRET = "benchmark-secret"
+
+
+def measure(func, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - started
+    return round(iterations / elapsed, 1)
+
+
+def claims():
+    return {"sub": "seed-user-1@example.com", "exp": datetime.utcnow() + timedelta(minutes=60)}
+
+
+def jose_backend():
+    try:
+        from jose import jwt
+    except ImportError:
+        return None
+    return (
+        lambda: jwt.encode(claims(), SECRET, algorithm="HS256"),
+        lambda token: jwt.decode(token, SECRET, algorithms=["HS256"]),
+    )
+
+
+def token_service_backend(key):
+    from src.tokens import TokenService
+    service = TokenService(key)
+    return lambda: service.encode(claims()), service.decode
+
+
+def asymmetric_key(algorithm):
+    try:
+        from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+    except ImportError:
+        return None
+    from src.tokens import ES256Key, Ed25519Key
+    if algorithm == "EdDSA":
+        return Ed25519Key("bench", private_key=ed25519.Ed25519PrivateKey.generate())
+    return ES256Key("bench", private_key=ec.generate_private_key(ec.SECP256R1()))
+
+
+def main(argv=None):
+    from src.tokens import HMACKey
+
+    parser = argparse.ArgumentParser(description="Benchmark access token encode/decode throughput")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    backends = {
+        "python-jose HS256": jose_backend(),
+        "src.tokens HS256": token_service_backend(HMACKey("bench", SECRET)),
+    }
+    for algorithm in ("EdDSA", "ES256"):
+        key = asymmetric_key(algorithm)
+        backends["src.tokens " + algorithm] = token_service_backend(key) if key else None
+
+    results = {}
+    for name, backend in backends.items():
+        if backend is None:
+            print("{:<20} skipped (dependency not installed)".format(name), file=sys.stderr)
+            continue
+        encode, decode = backend
+        token = encode()
+        results[name] = {
+            "encode_per_sec": measure(encode, args.iterations),
+            "decode_per_sec": measure(lambda: decode(token), args.iterations),
+        }
+        print("{:<20} encode {:>10,.0f}/s  decode {:>10,.0f}/s".format(
+            name, results[name]["encode_per_sec"], results[name]["decode_per_sec"]
+        ), file=sys.stderr)
+
+    output = json.dumps({"iterations": args.iterations, "backends": results}, indent=2)
+    if args.out:
+        with open(args.out, "w") as report_file:
+            report_file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
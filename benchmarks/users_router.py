@@ -0,0 +1,264 @@
+# Load-test benchmark for the users router
+#
+# Seeds a synthetic dataset with seeder.bulk, drives main:app in-process through
+# an ASGI client at a fixed concurrency and writes throughput, latency
+# percentiles and SQL statements per request for every endpoint as JSON.
+#
+#   python -m benchmarks.users_router --users 500 --concurrency 16 --requests 400 \
+#       --out bench.json --compare benchmarks/baseline.json
+#
+# Without --database-url a throwaway SQLite file is used, so no external
+# services are needed. Exits with status 1 when --compare finds a regression.
+
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+# Statements executed on behalf of the request running in the current context;
+# copied into the threadpool together with the rest of the request context.
+statement_counter = contextvars.ContextVar("statement_counter", default=None)
+
+
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    counter = statement_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def build_scenarios(ids, token, rng):
+    # name -> factory returning (method, url, json body, headers)
+    auth = {"Authorization": "Bearer {}".format(token)}
+
+    def login():
+        user_id = rng.choice(ids["users"])
+        return "POST", "/login", {"email": "seed-user-{}@example.com".format(user_id), "password": "password"}, None
+
+    def get_profile():
+        return "GET", "/profile/{}".format(rng.choice(ids["profiles"])), None, None
+
+    def get_projects():
+        return "GET", "/projects?profile_id={}".format(rng.choice(ids["profiles"])), None, auth
+
+    def add_project():
+        body = {
+            "title": "Benchmark project",
+            "description": "Created by benchmarks.users_router",
+            "start_date": "2023-01-01",
+            "end_date": "2023-06-30",
+            "image": "",
+            "skills": rng.sample(ids["skill_names"], min(5, len(ids["skill_names"]))),
+            "profile_id": rng.choice(ids["profiles"]),
+        }
+        return "POST", "/add_project", body, None
+
+    def get_countries():
+        return "GET", "/countries/", None, None
+
+    return {
+        "POST /login": login,
+        "GET /profile/{profile_id}": get_profile,
+        "GET /projects": get_projects,
+        "POST /add_project": add_project,
+        "GET /countries/": get_countries,
+    }
+
+
+async def run_endpoint(client, factory, total, concurrency):
+    latencies = []
+    statements = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            method, url, body, headers = factory()
+            counter = [0]
+            token = statement_counter.set(counter)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body, headers=headers)
+            finally:
+                statement_counter.reset(token)
+            latencies.append((time.perf_counter() - started) * 1000)
+            statements.append(counter[0])
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": total,
+        "errors": errors,
+        "seconds": round(elapsed, 4),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50), 3),
+            "p95": round(percentile(latencies, 95), 3),
+            "p99": round(percentile(latencies, 99), 3),
+        },
+        "queries_per_request": round(sum(statements) / len(statements), 2) if statements else 0.0,
+    }
+
+
+def seed_dataset(args):
+    from sqlalchemy import select
+    from seeder.bulk import run_seed
+    import seeder.synthetic  # noqa: F401
+    from seeder.country import seed_countries
+    from sql_app import database
+    from sql_app.models import Country, Profile, Skills, User
+
+    database.Base.metadata.create_all(database.engine)
+    options = {
+        "users": args.users,
+        "projects_per_profile": args.projects_per_profile,
+        "skills": args.skills,
+        "skills_per_profile": args.skills_per_project,
+        "skills_per_project": args.skills_per_project,
+        "experiences_per_profile": 2,
+    }
+    run_seed(database.engine, options, seed=args.seed)
+
+    with database.SessionLocal() as db:
+        if not db.scalar(select(Country.id).limit(1)):
+            seed_countries(db)
+        users = db.scalars(select(User.id).where(User.email.like("seed-user-%")).order_by(User.id.desc()).limit(args.users)).all()
+        profiles = db.scalars(select(Profile.id).where(Profile.user_id.in_(users))).all()
+        skill_names = db.scalars(select(Skills.name).order_by(Skills.id.desc()).limit(args.skills)).all()
+    return {"users": users, "profiles": profiles, "skill_names": skill_names}
+
+
+async def run_benchmark(args, ids):
+    import httpx
+    from sqlalchemy import event
+    from sql_app import database
+    from src.users import create_access_token
+    import main
+
+    engines = [database.engine]
+    if database.async_engine is not None:
+        engines.append(database.async_engine.sync_engine)
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+    rng = random.Random(args.seed)
+    token = create_access_token({"sub": "seed-user-{}@example.com".format(ids["users"][0])}, timedelta(hours=1))
+    scenarios = build_scenarios(ids, token, rng)
+    selected = args.endpoints or list(scenarios)
+
+    results = {}
+    transport = httpx.ASGITransport(app=main.app)
+    async with main.app.router.lifespan_context(main.app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for name in selected:
+                # Warm up connections and caches before measuring
+                await run_endpoint(client, scenarios[name], min(args.concurrency, args.requests), args.concurrency)
+                total = args.login_requests if name == "POST /login" else args.requests
+                results[name] = await run_endpoint(client, scenarios[name], total, args.concurrency)
+                print("{:<28} {:>8.1f} req/s  p50 {:>8.2f} ms  p95 {:>8.2f} ms  p99 {:>8.2f} ms  {:>5.1f} queries".format(
+                    name, results[name]["throughput_rps"], results[name]["latency_ms"]["p50"],
+                    results[name]["latency_ms"]["p95"], results[name]["latency_ms"]["p99"],
+                    results[name]["queries_per_request"],
+                ), file=sys.stderr)
+    return results
+
+
+def compare(report, baseline, tolerance):
+    regressions = []
+    for name, base in baseline["endpoints"].items():
+        current = report["endpoints"].get(name)
+        if current is None:
+            continue
+        if current["queries_per_request"] > base["queries_per_request"]:
+            regressions.append("{}: queries/request {} > baseline {}".format(name, current["queries_per_request"], base["queries_per_request"]))
+        limit = base["latency_ms"]["p95"] * (1 + tolerance)
+        if current["latency_ms"]["p95"] > limit:
+            regressions.append("{}: p95 {} ms > baseline {} ms (+{:.0%})".format(name, current["latency_ms"]["p95"], base["latency_ms"]["p95"], tolerance))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the users router in-process")
+    parser.add_argument("--database-url", help="database to seed and benchmark (default: temporary SQLite file)")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--projects-per-profile", type=int, default=5)
+    parser.add_argument("--skills", type=int, default=100)
+    parser.add_argument("--skills-per-project", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400, help="measured requests per endpoint")
+    parser.add_argument("--login-requests", type=int, default=64, help="measured requests for POST /login (bcrypt bound)")
+    parser.add_argument("--endpoints", nargs="*", help="subset of endpoint names to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 slowdown against the baseline")
+    args = parser.parse_args(argv)
+
+    # sql_app.database builds its engines at import time, so the URL must be set first
+    temporary_db = None
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        handle, path = tempfile.mkstemp(prefix="users-bench-", suffix=".db")
+        os.close(handle)
+        temporary_db = path
+        os.environ["DATABASE_URL"] = "sqlite:///{}".format(path)
+
+    try:
+        ids = seed_dataset(args)
+        endpoints = asyncio.run(run_benchmark(args, ids))
+    finally:
+        if temporary_db:
+            os.remove(temporary_db)
+
+    from sql_app import database
+    report = {
+        "meta": {
+            "database": database.engine.dialect.name,
+            "async_database": database.ASYNC_DATABASE,
+            "python": platform.python_version(),
+            "users": args.users,
+            "projects_per_profile": args.projects_per_profile,
+            "skills": args.skills,
+            "concurrency": args.concurrency,
+        },
+        "endpoints": endpoints,
+    }
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as report_file:
+            report_file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(report, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print("REGRESSION " + regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
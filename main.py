@@ -1,11 +1,41 @@
 # main.py
 
+import time
+
+# Import time of the app is part of the startup report (src/startup.py)
+IMPORT_STARTED = time.perf_counter()
+
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from src.users import router as users_router
+from src.monitoring import admin_router as monitoring_admin_router, router as monitoring_router
+from src.export import router as export_router
+from src.search import router as search_router
+from src.responses import FastJSONResponse
+from src.identity import identity_client
+from src.instrumentation import SQLInstrumentationMiddleware, instrument_engines
+from src.pagination import invalid_cursor_handler
+from src.startup import startup_report, warm_up
 from sql_app import database
+from sql_app.config import instrumentation_settings, profiling_settings
+from sql_app.keyset import InvalidCursor
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Pool, caches and compiled queries are ready before the first request
+    await warm_up()
+    yield
+    await identity_client.aclose()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+app.add_exception_handler(InvalidCursor, invalid_cursor_handler)
 
 # CORS middleware configuration
 app.add_middleware(
@@ -16,8 +46,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Opt-in profiling; added first so it runs inside the SQL instrumentation and
+# sees each request's statements
+if profiling_settings.enabled:
+    from src.profiling import ProfilingMiddleware, router as profiling_router
+    app.add_middleware(ProfilingMiddleware)
+    app.include_router(profiling_router)
+
+# Per-request SQL statement counts and timings: Server-Timing, /metrics, N+1 warnings
+if instrumentation_settings.enabled:
+    instrument_engines()
+    app.add_middleware(SQLInstrumentationMiddleware)
+
+# In async mode the async routes are matched first and shadow their sync
+# counterparts; the sync router still documents the shared contract.
+if database.ASYNC_DATABASE:
+    from src.users_async import router as users_async_router
+    app.include_router(users_async_router, include_in_schema=False)
+
 # Include the router from users module
 app.include_router(users_router)
+app.include_router(monitoring_router)
+app.include_router(monitoring_admin_router)
+app.include_router(export_router)
+app.include_router(search_router)
 
 # Dependency to get the database session
 def get_db():
@@ -27,3 +79,5 @@ def get_db():
     finally:
         db.close()
 
+
+startup_report["import"] = round((time.perf_counter() - IMPORT_STARTED) * 1000, 2)
@@ -1,26 +1,19 @@
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
+from sql_app.crud import upsert_insert
 from sql_app.models import Skills
-import requests
-from sql_app import database
-from fastapi import Depends, HTTPException, APIRouter, Header, Body
 
 
-def seed_skills(db: Session):
-    skills_data = [
-        {"name": "Python"},
-        {"name": "JavaScript"},
-        {"name": "React"},
-        {"name": "Django"},
-        {"name": "Vue.js"},
-        {"name": "SQL"},
-        {"name": "HTML"},
-        {"name": "CSS"},
-        {"name": "Flask"},
-        {"name": "Angular"},
-    ]
+SKILLS = ["Python", "JavaScript", "React", "Django", "Vue.js", "SQL", "HTML", "CSS", "Flask", "Angular"]
 
-    for skill in skills_data:
-        db_skill = Skills(**skill)
-        db.add(db_skill)
 
-    db.commit()
\ No newline at end of file
+# One multi-row insert. With upsert, names that already exist are left alone;
+# that needs the unique index on lower(skills.name).
+def seed_skills(db: Session, upsert=True):
+    rows = [{"name": name} for name in SKILLS]
+    if upsert:
+        stmt = upsert_insert(db, Skills).values(rows).on_conflict_do_nothing(index_elements=[func.lower(Skills.name)])
+    else:
+        stmt = insert(Skills).values(rows)
+    db.execute(stmt)
+    db.commit()
@@ -0,0 +1,111 @@
+# Synthetic seed sources for load testing, see seeder/bulk.py
+#
+# Every source derives its ids from SeedContext.id_base, so child rows can
+# reference parents generated in the same run without reading them back.
+
+import random
+from datetime import date, timedelta
+
+from seeder.bulk import seed_source
+from src.passwords import get_password_hashing
+from sql_app.models import User, Profile, Project, Experience, Skills, ProfileSkills, ProjectSkills
+
+# Every synthetic user logs in with this password
+SEED_PASSWORD = "password"
+
+PROFILE_TYPES = ["developer", "designer", "manager", "analyst"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+LOCATIONS = ["Ahmedabad", "Berlin", "London", "New York", "Remote"]
+
+_password_hash = None
+
+
+def seed_password_hash():
+    # bcrypt is far too slow to run per row, all users share one hash
+    global _password_hash
+    if _password_hash is None:
+        _password_hash = get_password_hashing().hash(SEED_PASSWORD)
+    return _password_hash
+
+
+def random_period(rng):
+    start = date(2010, 1, 1) + timedelta(days=rng.randrange(4000))
+    return start, start + timedelta(days=rng.randrange(30, 1500))
+
+
+@seed_source("users", User, ["id", "name", "email", "password", "is_verified", "verification_code"])
+def user_rows(context):
+    password = seed_password_hash()
+    base = context.id_base["users"]
+    for user_id in range(base + 1, base + context.option("users") + 1):
+        yield user_id, "User {}".format(user_id), "seed-user-{}@example.com".format(user_id), password, True, 111111
+
+
+@seed_source("profiles", Profile, ["id", "user_id", "profile_type", "experience", "email", "full_name", "address_area"], depends_on=["users"])
+def profile_rows(context):
+    rng = random.Random(context.seed)
+    base, user_base = context.id_base["profiles"], context.id_base["users"]
+    # profiles.user_id is unique, so every seeded user gets exactly one profile
+    for offset in range(1, context.option("users") + 1):
+        user_id = user_base + offset
+        yield (
+            base + offset, user_id, rng.choice(PROFILE_TYPES), rng.randrange(15),
+            "seed-user-{}@example.com".format(user_id), "User {}".format(user_id), rng.choice(LOCATIONS),
+        )
+
+
+@seed_source("projects", Project, ["id", "profile_id", "title", "description", "start_date", "end_date", "image"], depends_on=["profiles"])
+def project_rows(context):
+    rng = random.Random(context.seed + 1)
+    per_profile = context.option("projects_per_profile")
+    project_id = context.id_base["projects"]
+    profile_base = context.id_base["profiles"]
+    for profile_id in range(profile_base + 1, profile_base + context.option("users") + 1):
+        for _ in range(per_profile):
+            project_id += 1
+            start, end = random_period(rng)
+            yield project_id, profile_id, "Project {}".format(project_id), "Synthetic project {}".format(project_id), start, end, ""
+
+
+@seed_source("experiences", Experience, ["id", "profile_id", "title", "company", "location", "start_date", "end_date", "description"], depends_on=["profiles"])
+def experience_rows(context):
+    rng = random.Random(context.seed + 2)
+    per_profile = context.option("experiences_per_profile")
+    experience_id = context.id_base["experiences"]
+    profile_base = context.id_base["profiles"]
+    for profile_id in range(profile_base + 1, profile_base + context.option("users") + 1):
+        for _ in range(per_profile):
+            experience_id += 1
+            start, end = random_period(rng)
+            yield experience_id, profile_id, rng.choice(PROFILE_TYPES).title(), rng.choice(COMPANIES), rng.choice(LOCATIONS), start, end, None
+
+
+@seed_source("skills", Skills, ["id", "name"])
+def skill_rows(context):
+    base = context.id_base["skills"]
+    for skill_id in range(base + 1, base + context.option("skills") + 1):
+        yield skill_id, "Skill {}".format(skill_id)
+
+
+def skill_sample(rng, context, count):
+    base = context.id_base["skills"]
+    return rng.sample(range(base + 1, base + context.option("skills") + 1), min(count, context.option("skills")))
+
+
+@seed_source("profile_skills", ProfileSkills, ["profile_id", "skill_id"], depends_on=["profiles", "skills"], explicit_ids=False)
+def profile_skill_rows(context):
+    rng = random.Random(context.seed + 3)
+    profile_base = context.id_base["profiles"]
+    for profile_id in range(profile_base + 1, profile_base + context.option("users") + 1):
+        for skill_id in skill_sample(rng, context, context.option("skills_per_profile")):
+            yield profile_id, skill_id
+
+
+@seed_source("project_skills", ProjectSkills, ["project_id", "skill_id"], depends_on=["projects", "skills"], explicit_ids=False)
+def project_skill_rows(context):
+    rng = random.Random(context.seed + 4)
+    project_base = context.id_base["projects"]
+    projects = context.option("users") * context.option("projects_per_profile")
+    for project_id in range(project_base + 1, project_base + projects + 1):
+        for skill_id in skill_sample(rng, context, context.option("skills_per_project")):
+            yield project_id, skill_id
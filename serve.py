@@ -0,0 +1,124 @@
+# serve.py
+#
+# Production entry point: a uvicorn supervisor running N worker processes on
+# one listening socket.
+#
+#   python serve.py --workers 4 --port 8000
+#
+# Workers are spawned, not forked, and each imports main itself. Engines, pools,
+# caches and the identity client therefore belong to a single worker, and the
+# lifespan warm-up opens each worker's own connections (src/startup.py, which
+# also replaces pools inherited through a fork, e.g. under gunicorn --preload).
+#
+# On SIGTERM or SIGINT the supervisor stops every worker. Each one stops
+# accepting connections and gives in-flight requests up to
+# SERVER_GRACEFUL_TIMEOUT seconds before its lifespan shutdown runs.
+#
+# DB_MAX_CONNECTIONS caps the connections of all workers together. The worker
+# count is passed to the workers as WEB_CONCURRENCY, so every worker sizes its
+# pools to its share (DatabaseSettings.connection_budget).
+#
+# Settings come from the environment (ServerSettings in sql_app/config.py);
+# the flags below override them.
+
+import argparse
+import importlib.util
+import logging
+import os
+import sys
+
+from sql_app.config import DatabaseSettings, server_settings
+
+logger = logging.getLogger("serve")
+
+# Event loop and HTTP parser implementations, and the module each one needs
+LOOPS = {"auto": None, "asyncio": None, "uvloop": "uvloop"}
+HTTP_PROTOCOLS = {"auto": None, "h11": None, "httptools": "httptools"}
+
+
+def check_installed(kind, choice, modules):
+    module = modules[choice]
+    if module is not None and importlib.util.find_spec(module) is None:
+        raise SystemExit("{}={} needs the {} package installed".format(kind, choice, module))
+
+
+def supervisor_respawns_workers():
+    # uvicorn's multi-process supervisor replaces workers that exit from 0.30.0 on
+    from importlib.metadata import version
+    return tuple(int(part) for part in version("uvicorn").split(".")[:2]) >= (0, 30)
+
+
+def describe_choice(choice, module):
+    # What "auto" resolves to, for the startup log
+    if choice != "auto":
+        return choice
+    return "auto ({})".format(module if importlib.util.find_spec(module) else "fallback")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run main:app with several uvicorn workers")
+    parser.add_argument("--host", default=server_settings.host)
+    parser.add_argument("--port", type=int, default=server_settings.port)
+    parser.add_argument("--workers", type=int, default=server_settings.workers)
+    parser.add_argument("--loop", choices=sorted(LOOPS), default=server_settings.loop)
+    parser.add_argument("--http", choices=sorted(HTTP_PROTOCOLS), default=server_settings.http)
+    parser.add_argument("--backlog", type=int, default=server_settings.backlog)
+    parser.add_argument("--keep-alive", type=int, default=server_settings.keep_alive, help="idle keep-alive timeout in seconds")
+    parser.add_argument("--graceful-timeout", type=int, default=server_settings.graceful_timeout, help="seconds to drain in-flight requests on SIGTERM")
+    parser.add_argument("--limit-concurrency", type=int, default=server_settings.limit_concurrency)
+    parser.add_argument("--max-requests", type=int, default=server_settings.max_requests)
+    parser.add_argument("--forwarded-allow-ips", default=server_settings.forwarded_allow_ips)
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--no-access-log", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s:     %(message)s")
+    if args.workers < 1:
+        raise SystemExit("--workers must be at least 1")
+    check_installed("loop", args.loop, LOOPS)
+    check_installed("http", args.http, HTTP_PROTOCOLS)
+    if args.max_requests and args.workers > 1 and not supervisor_respawns_workers():
+        raise SystemExit("--max-requests with several workers needs uvicorn 0.30 or later, which replaces the workers that exit")
+
+    # The workers read their share of DB_MAX_CONNECTIONS from WEB_CONCURRENCY;
+    # work the plan out here first so a budget that cannot fit fails before any
+    # worker starts
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    try:
+        database = DatabaseSettings.from_env()
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    logger.info(
+        "%d workers x %d engines x (pool_size %d + max_overflow %d) = %d database connections at most%s",
+        args.workers, database.engines_per_worker, database.pool_size, database.max_overflow, database.total_connections(),
+        " (DB_MAX_CONNECTIONS={})".format(database.max_connections) if database.max_connections > 0 else "",
+    )
+    logger.info("loop %s, http %s, backlog %d, keep-alive %ds, graceful timeout %ds",
+                describe_choice(args.loop, "uvloop"), describe_choice(args.http, "httptools"),
+                args.backlog, args.keep_alive, args.graceful_timeout)
+
+    import uvicorn
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=args.loop,
+        http=args.http,
+        backlog=args.backlog,
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        limit_concurrency=args.limit_concurrency or None,
+        limit_max_requests=args.max_requests or None,
+        proxy_headers=True,
+        forwarded_allow_ips=args.forwarded_allow_ips,
+        access_log=not args.no_access_log,
+        log_level=args.log_level,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,503 @@
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import islice
+
+from sqlalchemy import event, func, inspect, or_, select
+from sqlalchemy.orm import Session, object_session
+from sql_app.config import cache_settings
+from sql_app.keyset import PageRequest, cursor_values, encode_cursor
+from sql_app.models import Certificate, Country, Experience, Institution, Profile, ProfileSkills, Project, Skills, User
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    # Thread-safe LRU mapping whose entries also expire after `ttl` seconds
+
+    def __init__(self, maxsize=1024, ttl=300, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > self.timer():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        expires_at = self.timer() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+            return default if entry is _MISSING else entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def keys(self):
+        now = self.timer()
+        with self._lock:
+            return [key for key, (expires_at, _) in self._data.items() if expires_at > now]
+
+    def __len__(self):
+        return len(self.keys())
+
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            "size": len(self),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio(), 4),
+        }
+
+
+def normalize_name(name):
+    # Same folding as SQL lower(), which the unique indexes on skills and
+    # institutions are built on, so a cached key and the database agree on which
+    # names are the same
+    return " ".join(name.split()).lower()
+
+
+class NameCache:
+    # Normalized name -> (id, name) for a table with a unique name column (skills,
+    # institutions), with a sorted key index for prefix lookups
+
+    def __init__(self, model, maxsize, ttl):
+        self.model = model
+        self.entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.warmed_at = None
+        self._index = None
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        return self.entries.get(normalize_name(name))
+
+    def add(self, skill_id, name):
+        self.entries.set(normalize_name(name), (skill_id, name))
+        self._index = None
+
+    def invalidate(self, name=None):
+        if name is None:
+            self.entries.clear()
+            self.warmed_at = None
+        else:
+            self.entries.pop(normalize_name(name))
+        self._index = None
+
+    def fetch(self, db: Session, wanted):
+        # Ids of the rows matching {normalized name: name}, added to the cache
+        model = self.model
+        condition = func.lower(model.name).in_(list(wanted))
+        if db.get_bind().dialect.name == "sqlite":
+            # SQLite's lower() only folds ASCII, match the exact names as well
+            condition = or_(condition, model.name.in_(list(wanted.values())))
+        rows = db.execute(select(model.id, model.name).where(condition).order_by(model.id)).all()
+        ids = {}
+        for row_id, name in rows:
+            key = normalize_name(name)
+            if key in wanted and key not in ids:
+                ids[key] = row_id
+                self.add(row_id, name)
+        return ids
+
+    def warm(self, db: Session):
+        # Newest first, so where names differ only in case the oldest row wins, as in fetch()
+        rows = db.execute(
+            select(self.model.id, self.model.name).where(self.model.name.isnot(None)).order_by(self.model.id.desc())
+        ).all()
+        with self._lock:
+            self.entries.clear()
+            for skill_id, name in rows:
+                self.add(skill_id, name)
+            self.warmed_at = self.entries.timer()
+
+    def ensure_warm(self, db: Session):
+        if self.warmed_at is None or self.entries.timer() - self.warmed_at >= self.entries.ttl:
+            self.warm(db)
+
+    def autocomplete(self, prefix, limit=10):
+        prefix = normalize_name(prefix)
+        index = self._index
+        if index is None:
+            index = self._index = sorted(self.entries.keys())
+
+        matches = []
+        for key in islice(index, bisect_left(index, prefix), None):
+            if not key.startswith(prefix) or len(matches) >= limit:
+                break
+            entry = self.entries.get(key)
+            if entry is not None:
+                matches.append({"id": entry[0], "name": entry[1]})
+        return matches
+
+
+def encode_json(content):
+    # Same bytes as fastapi.responses.JSONResponse, through orjson when it is installed
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def make_etag(body):
+    return '"{}"'.format(hashlib.sha256(body).hexdigest()[:32])
+
+
+class CountryCache:
+    # The countries table only changes when seeder/country.py reruns, so the whole
+    # response is encoded once and served from memory until invalidated.
+
+    message = "Countries fetched successfully"
+
+    def __init__(self):
+        self._snapshot = None
+
+    def load(self, db: Session):
+        rows = db.execute(select(Country.id, Country.name, Country.code).order_by(Country.id)).all()
+        countries = [{"id": id, "name": name, "code": code} for id, name, code in rows]
+        body = self.encode(countries)
+        snapshot = {
+            "countries": countries,
+            "ids": [country["id"] for country in countries],
+            "body": body,
+            "gzip_body": gzip.compress(body, mtime=0),
+            "etag": make_etag(body),
+            "code_index": sorted(((country["code"] or "").casefold(), position) for position, country in enumerate(countries)),
+            "name_index": sorted(((country["name"] or "").casefold(), position) for position, country in enumerate(countries)),
+        }
+        self._snapshot = snapshot
+        return snapshot
+
+    def invalidate(self):
+        self._snapshot = None
+
+    def encode(self, countries, next_cursor=None, total=None):
+        return encode_json({"data": countries, "status": True, "message": self.message, "next_cursor": next_cursor, "total": total})
+
+    @staticmethod
+    def _prefix_matches(index, prefix):
+        prefix = prefix.casefold()
+        positions = set()
+        for key, position in islice(index, bisect_left(index, (prefix,)), None):
+            if not key.startswith(prefix):
+                break
+            positions.add(position)
+        return positions
+
+    # Returns (body, gzip_body, etag); gzip_body is None for filtered results and
+    # partial pages. Pages are keyset ranges over the id ordered snapshot.
+    def render(self, db: Session, code=None, name=None, page: PageRequest = None):
+        snapshot = self._snapshot or self.load(db)
+        countries = snapshot["countries"]
+        whole_list = page is None or (page.after is None and page.limit >= len(countries) and not page.include_total)
+        if code is None and name is None and whole_list:
+            return snapshot["body"], snapshot["gzip_body"], snapshot["etag"]
+
+        positions = range(len(countries))
+        if code is not None or name is not None:
+            matches = set(positions)
+            if code is not None:
+                matches &= self._prefix_matches(snapshot["code_index"], code)
+            if name is not None:
+                matches &= self._prefix_matches(snapshot["name_index"], name)
+            positions = sorted(matches)
+
+        next_cursor = total = None
+        if page is not None:
+            total = len(positions) if page.include_total else None
+            start = 0
+            if page.after is not None:
+                (after_id,) = cursor_values(page, (Country.id,))
+                # First matching position whose id is above the cursor
+                start = bisect_left(positions, bisect_right(snapshot["ids"], after_id))
+            end = start + page.limit
+            if end < len(positions):
+                next_cursor = encode_cursor([countries[positions[end - 1]]["id"]])
+            positions = positions[start:end]
+
+        body = self.encode([countries[position] for position in positions], next_cursor, total)
+        return body, None, make_etag(body)
+
+
+country_cache = CountryCache()
+
+
+skill_cache = NameCache(Skills, maxsize=cache_settings.skill_cache_size, ttl=cache_settings.skill_cache_ttl)
+institution_cache = NameCache(Institution, maxsize=cache_settings.institution_cache_size, ttl=cache_settings.institution_cache_ttl)
+
+
+# Names inserted in a transaction only reach the shared cache once it commits,
+# so a rolled back insert can never leave a dangling id behind.
+PENDING_NAMES = "pending_names"
+
+
+def remember_new_names(db: Session, cache: NameCache, rows):
+    db.info.setdefault(PENDING_NAMES, []).extend((cache, row_id, name) for row_id, name in rows)
+
+
+@event.listens_for(Session, "after_commit")
+def publish_new_names(session):
+    for cache, row_id, name in session.info.pop(PENDING_NAMES, ()):
+        cache.add(row_id, name)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_new_names(session):
+    session.info.pop(PENDING_NAMES, None)
+
+
+@dataclass(frozen=True)
+class Principal:
+    # Session-independent view of the authenticated user, safe to share between requests
+    id: int
+    email: str
+    name: str = None
+    is_verified: bool = None
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(id=user.id, email=user.email, name=user.name, is_verified=user.is_verified)
+
+
+# Token subject (email) -> Principal
+principal_cache = TTLCache(maxsize=cache_settings.principal_cache_size, ttl=cache_settings.principal_cache_ttl)
+
+UPDATED_USERS = "updated_users"
+
+
+@event.listens_for(User, "after_update")
+def remember_updated_user(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(UPDATED_USERS, set()).add(target.email)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_updated_users(session):
+    for email in session.info.pop(UPDATED_USERS, ()):
+        principal_cache.pop(email)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_updated_users(session):
+    session.info.pop(UPDATED_USERS, None)
+
+
+
+class MemoryBackend:
+    # In-process stand-in for a shared cache server, for single worker runs and checks
+
+    def __init__(self, maxsize=100000):
+        self._entries = TTLCache(maxsize=maxsize)
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def set_many(self, mapping, ttl):
+        for key, value in mapping.items():
+            self._entries.set(key, value, ttl)
+
+    def delete(self, keys):
+        for key in keys:
+            self._entries.pop(key)
+
+
+class RedisBackend:
+    # Needs the optional `redis` package
+
+    def __init__(self, url, prefix="profile-cache:"):
+        import redis
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set_many(self, mapping, ttl):
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipeline.set(self.prefix + key, value, ex=ttl)
+        pipeline.execute()
+
+    def delete(self, keys):
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+
+def build_cache_backend(spec):
+    if not spec:
+        return None
+    if spec == "memory":
+        return MemoryBackend()
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend(spec)
+    raise ValueError("Unknown cache backend {!r}".format(spec))
+
+
+# Cached documents per owner: a profile's own documents, and the per-user profile list
+DOCUMENT_KINDS = {
+    "profile": ("profile", "projects", "experiences"),
+    "user": ("user_profiles",),
+}
+
+
+def document_key(kind, owner_id):
+    return "{}:{}".format(kind, owner_id)
+
+
+class ProfileCache:
+    # Pre-encoded response bodies for the profile read endpoints. The local LRU sits
+    # in front of an optional shared backend; a backend outage only costs misses.
+
+    def __init__(self, maxsize, local_ttl, ttl, backend=None):
+        self.local = TTLCache(maxsize=maxsize, ttl=local_ttl)
+        self.ttl = ttl
+        self.backend = backend
+        # Bumped by every invalidation, see set_many()
+        self.generation = 0
+        self._lock = threading.Lock()
+
+    def _backend_call(self, method, *args):
+        try:
+            return getattr(self.backend, method)(*args)
+        except Exception:
+            logger.warning("Profile cache backend %s failed", method, exc_info=True)
+            return None
+
+    def get(self, key):
+        body = self.local.get(key)
+        if body is None and self.backend is not None:
+            body = self._backend_call("get", key)
+            if body is not None:
+                self.local.set(key, body)
+        return body
+
+    def set_many(self, documents, generation):
+        # Documents built from reads that raced with a commit are dropped, so an
+        # invalidation can never be undone by an older copy.
+        with self._lock:
+            if generation != self.generation:
+                return False
+            for key, body in documents.items():
+                self.local.set(key, body)
+            if self.backend is not None:
+                self._backend_call("set_many", documents, self.ttl)
+        return True
+
+    def invalidate(self, owners):
+        # owners: iterable of (kind, id) pairs, e.g. ("profile", 1), ("user", 3)
+        keys = [document_key(name, owner_id) for kind, owner_id in owners for name in DOCUMENT_KINDS[kind]]
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self.local.pop(key)
+            if self.backend is not None:
+                self._backend_call("delete", keys)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self.local.clear()
+
+    def stats(self):
+        stats = self.local.stats()
+        stats["backend"] = type(self.backend).__name__ if self.backend is not None else None
+        stats["invalidations"] = self.generation
+        return stats
+
+
+profile_cache = ProfileCache(
+    maxsize=cache_settings.profile_cache_size,
+    local_ttl=cache_settings.profile_cache_local_ttl,
+    ttl=cache_settings.profile_cache_ttl,
+    backend=build_cache_backend(cache_settings.profile_cache_backend),
+)
+
+
+# Changed rows are collected during flushes and their documents dropped once the
+# transaction commits. Rows written through Core statements (bulk inserts) do not
+# fire mapper events; callers mark those with mark_profile_changed().
+CHANGED_PROFILES = "changed_profiles"
+
+# Model -> (owner kind, attribute holding the owner id)
+PROFILE_OWNERS = {
+    Profile: (("profile", "id"), ("user", "user_id")),
+    Project: (("profile", "profile_id"),),
+    Experience: (("profile", "profile_id"),),
+    Certificate: (("profile", "profile_id"),),
+    ProfileSkills: (("profile", "profile_id"),),
+}
+
+
+def mark_profile_changed(db: Session, profile_id=None, user_id=None):
+    changed = db.info.setdefault(CHANGED_PROFILES, set())
+    if profile_id is not None:
+        changed.add(("profile", profile_id))
+    if user_id is not None:
+        changed.add(("user", user_id))
+
+
+def remember_changed_profile(mapper, connection, target):
+    session = object_session(target)
+    if session is None:
+        return
+    changed = session.info.setdefault(CHANGED_PROFILES, set())
+    state = inspect(target)
+    for kind, attribute in PROFILE_OWNERS[mapper.class_]:
+        # Old and new owner, so moving a row between profiles clears both
+        history = state.attrs[attribute].history
+        changed.update((kind, owner_id) for owner_id in (*history.added, *history.unchanged, *history.deleted) if owner_id is not None)
+
+
+for model in PROFILE_OWNERS:
+    for name in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, name, remember_changed_profile)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_changed_profiles(session):
+    changed = session.info.pop(CHANGED_PROFILES, None)
+    if changed:
+        profile_cache.invalidate(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_changed_profiles(session):
+    session.info.pop(CHANGED_PROFILES, None)
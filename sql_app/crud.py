@@ -0,0 +1,320 @@
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sql_app.models import Education, Experience, Institution, Profile, Project, ProjectSkills, Skills, User, touch_profile_rows
+from sql_app.cache import (
+    NameCache, document_key, institution_cache, mark_profile_changed, normalize_name, profile_cache, remember_new_names, skill_cache,
+)
+from sql_app.keyset import DEFAULT_PAGE_SIZE, PageRequest, cursor_for, keyset_page
+from sql_app.schemas import EducationResponse, Envelope, ExperienceResponse, Page, ProfileDetail, ProfileResponse, ProjectResponse
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING / DO UPDATE
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def upsert_insert(db: Session, model):
+    dialect = db.get_bind().dialect.name
+    if dialect not in UPSERT_INSERTS:
+        raise NotImplementedError("ON CONFLICT is not supported for dialect {}".format(dialect))
+    return UPSERT_INSERTS[dialect](model)
+
+
+# Map normalized names to ids in a table with a unique lower(name) index,
+# creating the missing rows. Names already in the cache cost nothing; the rest
+# take at most three statements.
+def resolve_name_ids(db: Session, model, names, cache: NameCache):
+    wanted = {}
+    for name in names:
+        key = normalize_name(name)
+        if key:
+            wanted.setdefault(key, " ".join(name.split()))
+
+    ids = {}
+    for key in wanted:
+        entry = cache.get(key)
+        if entry is not None:
+            ids[key] = entry[0]
+
+    lookup = {key: name for key, name in wanted.items() if key not in ids}
+    if not lookup:
+        return ids
+    ids.update(cache.fetch(db, lookup))
+
+    missing = [key for key in lookup if key not in ids]
+    if missing:
+        stmt = (
+            upsert_insert(db, model)
+            .values([{"name": lookup[key]} for key in missing])
+            .on_conflict_do_nothing(index_elements=[func.lower(model.name)])
+            .returning(model.id, model.name)
+        )
+        created = db.execute(stmt).all()
+        for row_id, name in created:
+            ids[normalize_name(name)] = row_id
+        remember_new_names(db, cache, created)
+
+        # Rows created by a concurrent request are skipped by DO NOTHING, read them back
+        raced = {key: lookup[key] for key in missing if key not in ids}
+        if raced:
+            ids.update(cache.fetch(db, raced))
+
+    return ids
+
+
+def resolve_skill_ids(db: Session, names, cache=skill_cache):
+    return resolve_name_ids(db, Skills, names, cache)
+
+
+def resolve_institution_ids(db: Session, names, cache=institution_cache):
+    return resolve_name_ids(db, Institution, names, cache)
+
+
+# The whole profile document in six queries whatever its size: the profile row,
+# then one SELECT ... WHERE IN per collection. Unlike chained joinedloads this
+# does not multiply projects x skills x experiences into one result set.
+def profile_detail_query(profile_id):
+    return (
+        select(Profile)
+        .options(
+            selectinload(Profile.projects).selectinload(Project.skills),
+            selectinload(Profile.job_experiences),
+            selectinload(Profile.skills),
+            selectinload(Profile.certificates),
+        )
+        .where(Profile.id == profile_id)
+    )
+
+
+def get_profile_detail(db: Session, profile_id):
+    return db.scalars(profile_detail_query(profile_id)).first()
+
+
+PROJECTS_MESSAGE = "Projects retrieved successfully for profile_id: {}"
+EXPERIENCES_MESSAGE = "experiance data fetched successfully"
+PROFILES_MESSAGE = "Profiles fetched successfully"
+EDUCATIONS_MESSAGE = "Education data fetched  successfully"
+
+# Keyset pagination keys of the list routes
+PROJECT_KEY = (Project.id,)
+EXPERIENCE_KEY = (Experience.id,)
+PROFILE_KEY = (Profile.id,)
+EDUCATION_KEY = (Education.id,)
+
+
+# Validates ORM data into Envelope[schema] and encodes it in one pydantic-core pass
+def encode_envelope(schema, data, message):
+    return Envelope[schema].model_validate({"data": data, "message": message}, from_attributes=True).model_dump_json().encode("utf-8")
+
+
+def encode_page(schema, rows, next_cursor, message):
+    content = {"data": rows, "message": message, "next_cursor": next_cursor}
+    return Page[schema].model_validate(content, from_attributes=True).model_dump_json().encode("utf-8")
+
+
+# The default first page of an eagerly loaded collection, as keyset_page would return it
+def first_page(rows, key_columns, limit=DEFAULT_PAGE_SIZE):
+    rows = sorted(rows, key=lambda row: tuple(getattr(row, column.key) for column in key_columns))
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], cursor_for(rows[limit - 1], key_columns)
+
+
+# Builds every cached document of a profile from one aggregate load. Returns
+# {key: body}, or None when the profile does not exist. The list documents hold
+# the default first page; other pages are read with the *_page functions below.
+def build_profile_documents(db: Session, profile_id, cache=profile_cache):
+    generation = cache.generation
+    profile = get_profile_detail(db, profile_id)
+    if profile is None:
+        return None
+
+    documents = {
+        document_key("profile", profile_id): encode_envelope(ProfileDetail, profile, "Profile fetched successfully"),
+        document_key("projects", profile_id): encode_page(
+            ProjectResponse, *first_page(profile.projects, PROJECT_KEY), PROJECTS_MESSAGE.format(profile_id)
+        ),
+        document_key("experiences", profile_id): encode_page(
+            ExperienceResponse, *first_page(profile.job_experiences, EXPERIENCE_KEY), EXPERIENCES_MESSAGE
+        ),
+    }
+    cache.set_many(documents, generation)
+    return documents
+
+
+# Pre-encoded response body for one of DOCUMENT_KINDS["profile"]; no queries on a hit
+def get_profile_document(db: Session, kind, profile_id, cache=profile_cache):
+    key = document_key(kind, profile_id)
+    body = cache.get(key)
+    if body is None:
+        documents = build_profile_documents(db, profile_id, cache)
+        body = documents[key] if documents else None
+    return body
+
+
+def build_user_profiles_document(db: Session, user_id, cache=profile_cache):
+    generation = cache.generation
+    result = get_user_profiles_page(db, user_id, PageRequest())
+    if result is None:
+        return None
+    profiles, next_cursor, _ = result
+    body = encode_page(ProfileResponse, profiles, next_cursor, PROFILES_MESSAGE)
+    cache.set_many({document_key("user_profiles", user_id): body}, generation)
+    return body
+
+
+def get_user_profiles_document(db: Session, user_id, cache=profile_cache):
+    body = cache.get(document_key("user_profiles", user_id))
+    if body is None:
+        body = build_user_profiles_document(db, user_id, cache)
+    return body
+
+
+# One keyset page of a list route as (rows, next_cursor, total), or None when
+# the owning profile/user does not exist.
+
+def get_projects_page(db: Session, profile_id, page: PageRequest):
+    if db.scalar(select(Profile.id).where(Profile.id == profile_id)) is None:
+        return None
+    return keyset_page(db, select(Project).where(Project.profile_id == profile_id), PROJECT_KEY, page)
+
+
+def get_experiences_page(db: Session, profile_id, page: PageRequest):
+    if db.scalar(select(Profile.id).where(Profile.id == profile_id)) is None:
+        return None
+    return keyset_page(db, select(Experience).where(Experience.profile_id == profile_id), EXPERIENCE_KEY, page)
+
+
+def get_user_profiles_page(db: Session, user_id, page: PageRequest):
+    if db.scalar(select(User.id).where(User.id == user_id)) is None:
+        return None
+    return keyset_page(db, select(Profile).where(Profile.user_id == user_id), PROFILE_KEY, page)
+
+
+def get_educations_page(db: Session, user_id, page: PageRequest):
+    if db.scalar(select(User.id).where(User.id == user_id)) is None:
+        return None
+    statement = (
+        select(Education)
+        .join(Institution)
+        .options(joinedload(Education.institution))
+        .where(Education.user_id == user_id)
+    )
+    return keyset_page(db, statement, EDUCATION_KEY, page)
+
+
+# Batch writes for imports. Owners, skills and institutions are resolved with
+# one query per kind and each table takes one multi-row INSERT ... RETURNING, so
+# a batch costs a fixed handful of round trips instead of several per item.
+# Items whose owner does not exist are reported as failed and the rest are
+# written; the caller commits them as one transaction.
+
+MAX_BATCH_SIZE = 1000
+BATCH_MESSAGE = "{} of {} {} created"
+
+
+def batch_item(index, data=None, error=None):
+    return {"index": index, "status": error is None, "data": data, "error": error}
+
+
+def batch_envelope(results, noun):
+    created = sum(result["status"] for result in results)
+    return {"data": results, "status": created == len(results), "message": BATCH_MESSAGE.format(created, len(results), noun)}
+
+
+# Splits a batch into failed results and the positions of the items to write
+def accept_owned(db: Session, items, attribute, owner_column, error):
+    owner_ids = set(db.scalars(select(owner_column).where(owner_column.in_({getattr(item, attribute) for item in items}))))
+    results = [None] * len(items)
+    accepted = []
+    for index, item in enumerate(items):
+        if getattr(item, attribute) in owner_ids:
+            accepted.append(index)
+        else:
+            results[index] = batch_item(index, error=error)
+    return results, accepted
+
+
+# Bulk INSERTs skip the mapper events that invalidate cached profile documents
+# and touch profiles.updated_at, so batches record their profiles themselves
+def record_profile_writes(db: Session, profile_ids):
+    for profile_id in profile_ids:
+        mark_profile_changed(db, profile_id)
+    touch_profile_rows(db, profile_ids)
+
+
+def insert_returning(db: Session, model, rows):
+    # sort_by_parameter_order keeps RETURNING rows aligned with the input rows
+    return db.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows).all()
+
+
+def create_projects(db: Session, items):
+    results, accepted = accept_owned(db, items, "profile_id", Profile.id, "Profile not found")
+    if not accepted:
+        return results
+
+    skill_ids = resolve_skill_ids(db, [name for index in accepted for name in items[index].skills])
+    projects = insert_returning(db, Project, [items[index].dict(exclude={"skills"}) for index in accepted])
+
+    links = []
+    for index, project in zip(accepted, projects):
+        # Validated now, since the rows expire when the caller commits
+        results[index] = batch_item(index, ProjectResponse.model_validate(project))
+        keys = {normalize_name(name) for name in items[index].skills} - {""}
+        links.extend({"project_id": project.id, "skill_id": skill_ids[key]} for key in keys)
+    if links:
+        db.execute(insert(ProjectSkills), links)
+
+    record_profile_writes(db, {items[index].profile_id for index in accepted})
+    return results
+
+
+def create_experiences(db: Session, items):
+    results, accepted = accept_owned(db, items, "profile_id", Profile.id, "User profile not found")
+    if not accepted:
+        return results
+
+    experiences = insert_returning(db, Experience, [items[index].dict() for index in accepted])
+    for index, experience in zip(accepted, experiences):
+        results[index] = batch_item(index, ExperienceResponse.model_validate(experience))
+
+    record_profile_writes(db, {items[index].profile_id for index in accepted})
+    return results
+
+
+def create_educations(db: Session, items):
+    results, accepted = accept_owned(db, items, "user_id", User.id, "User not found")
+    if not accepted:
+        return results
+
+    institution_ids = resolve_institution_ids(db, [items[index].institution_name for index in accepted])
+    rows = [
+        {**items[index].dict(exclude={"institution_name"}), "institution_id": institution_ids[normalize_name(items[index].institution_name)]}
+        for index in accepted
+    ]
+    for index, education in zip(accepted, insert_returning(db, Education, rows)):
+        results[index] = batch_item(index, EducationResponse.model_validate(education))
+    return results
+
+
+def escape_like(value):
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Substring search over institution names. On PostgreSQL the ILIKE filter and the
+# similarity() ranking are served by the pg_trgm index; other databases scan with
+# LIKE and rank shorter names first.
+def institution_search_statement(q, dialect_name, limit=10):
+    q = " ".join(q.split())
+    statement = select(Institution).where(Institution.name.ilike("%{}%".format(escape_like(q)), escape="\\"))
+    if dialect_name == "postgresql":
+        statement = statement.order_by(func.similarity(Institution.name, q).desc(), Institution.name)
+    else:
+        statement = statement.order_by(func.length(Institution.name), Institution.name)
+    return statement.limit(limit)
+
+
+def search_institutions(db: Session, q, limit=10):
+    return db.scalars(institution_search_statement(q, db.get_bind().dialect.name, limit)).all()
@@ -0,0 +1,96 @@
+# keyset.py
+#
+# Keyset pagination: pages are read with WHERE (sort_key, id) > (last values)
+# ORDER BY sort_key, id LIMIT n, so deep pages use the same index range scan as
+# the first one. Cursors are the last row's key values as base64url JSON.
+
+import base64
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# Integer cursor values beyond BIGINT cannot be bound as a key value
+MIN_INTEGER, MAX_INTEGER = -2 ** 63, 2 ** 63 - 1
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(values), separators=(",", ":")).encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise InvalidCursor("Malformed cursor")
+    if not isinstance(values, list) or not values:
+        raise InvalidCursor("Malformed cursor")
+    return tuple(values)
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    # Decoded key values of the last row already seen; None for the first page
+    after: Optional[tuple] = None
+    limit: int = DEFAULT_PAGE_SIZE
+    # Counting the whole result set costs a query, so it is only done on request
+    include_total: bool = False
+
+    @property
+    def is_default(self):
+        return self.after is None and self.limit == DEFAULT_PAGE_SIZE and not self.include_total
+
+
+def cursor_values(page: PageRequest, key_columns):
+    # Cursors come from clients, so check them against the key before they reach SQL
+    if len(page.after) != len(key_columns):
+        raise InvalidCursor("Cursor does not match this list")
+    values = []
+    for column, value in zip(key_columns, page.after):
+        python_type = column.type.python_type
+        if python_type is not str and isinstance(value, str) and hasattr(python_type, "fromisoformat"):
+            try:
+                value = python_type.fromisoformat(value)
+            except ValueError:
+                raise InvalidCursor("Cursor does not match this list")
+        if not isinstance(value, python_type) or isinstance(value, bool):
+            raise InvalidCursor("Cursor does not match this list")
+        if isinstance(value, int) and not MIN_INTEGER <= value <= MAX_INTEGER:
+            raise InvalidCursor("Cursor does not match this list")
+        values.append(value)
+    return values
+
+
+def cursor_for(row, key_columns):
+    values = [getattr(row, column.key) for column in key_columns]
+    return encode_cursor(value.isoformat() if hasattr(value, "isoformat") else value for value in values)
+
+
+# Returns (rows, next_cursor, total). key_columns must be non-null and end with a
+# unique column, e.g. (Project.id,) or (Country.name, Country.id).
+def keyset_page(db: Session, statement, key_columns, page: PageRequest):
+    total = None
+    if page.include_total:
+        total = db.scalar(select(func.count()).select_from(statement.order_by(None).subquery()))
+
+    if page.after is not None:
+        values = cursor_values(page, key_columns)
+        if len(key_columns) == 1:
+            statement = statement.where(key_columns[0] > values[0])
+        else:
+            statement = statement.where(tuple_(*key_columns) > tuple_(*values))
+
+    rows = db.scalars(statement.order_by(*key_columns).limit(page.limit + 1)).all()
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        next_cursor = cursor_for(rows[-1], key_columns)
+    return rows, next_cursor, total
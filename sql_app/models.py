@@ -1,19 +1,19 @@
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, JSON, Table, Date
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, JSON, Table, Date, DateTime, Index, event, func, inspect, update
 from sql_app.database import Base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, object_session, relationship
 
 
 class Country(Base):
     __tablename__ = "countries"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, index=True)
-    code = Column(String, index=True)
+    code = Column(String, unique=True, index=True)
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, index=True)
     email = Column(String, unique=True, index=True)
     social_type = Column(String)
@@ -28,7 +28,7 @@ class User(Base):
 class Profile(Base):
     __tablename__ = "profiles"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
     profile_type = Column(String, index=True)
     experience = Column(Integer)
@@ -42,6 +42,8 @@ class Profile(Base):
     github = Column(String)
     bitbucket = Column(String)
     gitlab = Column(String)
+    # Last change to the profile or anything it owns, see touch_profiles()
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False, index=True)
     
     user = relationship("User", back_populates="profiles")
     job_experiences = relationship("Experience", back_populates="profile")
@@ -52,8 +54,10 @@ class Profile(Base):
 
 class Project(Base):
     __tablename__ = "projects"
+    # (owner, id) indexes serve both the foreign key and keyset pages ordered by id
+    __table_args__ = (Index("ix_projects_profile_id_id", "profile_id", "id"),)
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False)
     title = Column(String, index=True)
     description = Column(String)
@@ -67,29 +71,31 @@ class Project(Base):
 class Skills(Base):
     __tablename__ = "skills"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String)
     profiles = relationship("Profile", secondary="profile_skills", back_populates="skills")
     projects = relationship("Project", secondary="project_skills", back_populates="skills")
 
+    # Names are unique ignoring case, the arbiter of the ON CONFLICT upsert in crud
+    __table_args__ = (Index("ix_skills_name_lower", func.lower(name), unique=True),)
+
 class ProfileSkills(Base):
     __tablename__ = "profile_skills"
 
-    id = Column(Integer, primary_key=True, index=True)
-    profile_id = Column(Integer, ForeignKey("profiles.id"))
-    skill_id = Column(Integer, ForeignKey("skills.id"))
-    
+    profile_id = Column(Integer, ForeignKey("profiles.id"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True, index=True)
+
 class ProjectSkills(Base):
     __tablename__ = "project_skills"
 
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id"))
-    skill_id = Column(Integer, ForeignKey("skills.id"))
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True, index=True)
 
 class Experience(Base):
     __tablename__ = "job_experiences"
+    __table_args__ = (Index("ix_job_experiences_profile_id_id", "profile_id", "id"),)
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False)
     title = Column(String, index=True)
     company = Column(String)
@@ -103,8 +109,9 @@ class Experience(Base):
 
 class Education(Base):
     __tablename__ = "educations"
+    __table_args__ = (Index("ix_educations_user_id_id", "user_id", "id"),)
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     institution_id = Column(Integer, ForeignKey("institutions.id"), nullable=False)
     degree = Column(String)
@@ -118,19 +125,68 @@ class Education(Base):
 class Institution(Base):
     __tablename__ = "institutions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True)
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
     description = Column(String)
     # Add other fields as needed
 
+    __table_args__ = (Index("ix_institutions_name_lower", func.lower(name), unique=True),)
+
 class Certificate(Base):
     __tablename__ = "certificates"
 
-    id = Column(Integer, primary_key=True, index=True)
-    profile_id = Column(Integer, ForeignKey("profiles.id"))
+    id = Column(Integer, primary_key=True)
+    profile_id = Column(Integer, ForeignKey("profiles.id"), index=True)
     name = Column(String)
     issuer = Column(String)
     issue_date = Column(Date)
     expiration_date = Column(Date)
 
     profile = relationship("Profile", back_populates="certificates")
+
+
+class ProfileSearch(Base):
+    # Denormalized search text of a profile: its own fields, project titles and
+    # descriptions, experience titles and companies, and skill names. Rebuilt by
+    # sql_app/search.py when the profile or anything it owns changes.
+    __tablename__ = "profile_search"
+
+    profile_id = Column(Integer, ForeignKey("profiles.id", ondelete="CASCADE"), primary_key=True)
+    document = Column(String, nullable=False, default="")
+
+
+# Rows owned by a profile count as a change to it for incremental exports. Their
+# profile ids (old and new) are collected during the flush and touched with one
+# UPDATE at its end; writes to the profile row itself are covered by onupdate.
+TOUCHED_PROFILES = "touched_profiles"
+
+
+def remember_touched_profile(mapper, connection, target):
+    session = object_session(target)
+    if session is None:
+        return
+    history = inspect(target).attrs.profile_id.history
+    profile_ids = {*history.added, *history.unchanged, *history.deleted} - {None}
+    session.info.setdefault(TOUCHED_PROFILES, set()).update(profile_ids)
+
+
+for model in (Project, Experience, Certificate, ProfileSkills):
+    for name in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, name, remember_touched_profile)
+
+
+# Also called directly after bulk writes, which do not fire mapper events
+def touch_profile_rows(session, profile_ids):
+    if profile_ids:
+        profiles = Profile.__table__
+        session.connection().execute(update(profiles).where(profiles.c.id.in_(sorted(profile_ids))).values(updated_at=func.now()))
+
+
+@event.listens_for(Session, "after_flush")
+def touch_profiles(session, flush_context):
+    touch_profile_rows(session, session.info.pop(TOUCHED_PROFILES, None))
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_touched_profiles(session):
+    session.info.pop(TOUCHED_PROFILES, None)
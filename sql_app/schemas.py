@@ -1,7 +1,9 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Generic, Optional, List, TypeVar
 from datetime import date
 
+DataT = TypeVar("DataT")
+
 
 
 class ProfileCreate(BaseModel):
@@ -41,7 +43,157 @@ class ExperienceCreate(BaseModel):
 
 class EducationCreate(BaseModel):
     user_id: int
-    institution_name: str
+    # Matched to institutions by normalized name (case and whitespace folded)
+    institution_name: str = Field(..., pattern=r"\S")
     degree: str
     start_year: int
     end_year: Optional[int]
+
+
+# Response models. Built with from_attributes so they validate straight from ORM
+# objects; only the listed columns are read, so no lazy loads are triggered.
+
+class Envelope(BaseModel, Generic[DataT]):
+    # The {"data", "status", "message"} wrapper shared by the routes
+    data: DataT
+    status: bool = True
+    message: str
+
+class Page(Envelope[List[DataT]], Generic[DataT]):
+    # Envelope of keyset paginated lists; send next_cursor back as ?cursor= for the next page
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class SearchPage(Page[DataT], Generic[DataT]):
+    # Facet name -> counts over all matches, e.g. {"skills": [...]}; first page only
+    facets: Dict[str, List[FacetCount]] = {}
+
+class BatchItem(BaseModel, Generic[DataT]):
+    # Outcome of one item of a batch write, by its position in the request
+    index: int
+    status: bool = True
+    data: Optional[DataT] = None
+    error: Optional[str] = None
+
+class StatusResponse(BaseModel):
+    status: bool = True
+    message: str
+
+class SkillResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: Optional[str] = None
+
+class ProjectResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    profile_id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    image: Optional[str] = None
+
+class ProjectDetail(ProjectResponse):
+    skills: List[SkillResponse] = []
+
+class ExperienceResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    profile_id: int
+    title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    description: Optional[str] = None
+
+class CertificateResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    profile_id: Optional[int] = None
+    name: Optional[str] = None
+    issuer: Optional[str] = None
+    issue_date: Optional[date] = None
+    expiration_date: Optional[date] = None
+
+class ProfileResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    profile_type: Optional[str] = None
+    experience: Optional[int] = None
+    email: Optional[str] = None
+    phone_country: Optional[str] = None
+    phone: Optional[str] = None
+    profile_image: Optional[str] = None
+    full_name: Optional[str] = None
+    address_area: Optional[str] = None
+    link: Optional[str] = None
+    github: Optional[str] = None
+    bitbucket: Optional[str] = None
+    gitlab: Optional[str] = None
+
+# Everything GET /profile/{profile_id} returns, see crud.profile_detail_query
+class ProfileDetail(ProfileResponse):
+    projects: List[ProjectDetail] = []
+    job_experiences: List[ExperienceResponse] = []
+    skills: List[SkillResponse] = []
+    certificates: List[CertificateResponse] = []
+
+class UserResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: Optional[str] = None
+    email: Optional[str] = None
+    is_verified: Optional[bool] = None
+
+class LoginUser(UserResponse):
+    profiles: List[ProfileResponse] = []
+
+class TokenResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    user: UserResponse
+    status: bool = True
+    message: str
+
+class LoginResponse(TokenResponse):
+    user: LoginUser
+
+class CountryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: Optional[str] = None
+    code: Optional[str] = None
+
+class InstitutionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+class EducationResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    institution_id: int
+    degree: Optional[str] = None
+    start_year: Optional[int] = None
+    end_year: Optional[int] = None
+
+class EducationDetail(EducationResponse):
+    institution: Optional[InstitutionResponse] = None
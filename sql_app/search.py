@@ -0,0 +1,346 @@
+# search.py
+#
+# Profile search. Every profile has a row in profile_search with its search
+# text, rebuilt in the committing transaction whenever the profile or a row it
+# owns changes (the same change set that invalidates the profile document
+# cache). PostgreSQL matches it with full-text search through a GIN index on
+# to_tsvector('simple', document); other databases (SQLite test runs) use an
+# in-process inverted index over the same documents.
+#
+#   python -m sql_app.search     rebuild every document, e.g. after seeder.bulk
+
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import reduce
+from typing import Optional, Tuple
+
+from sqlalchemy import bindparam, event, exists, func, insert, literal_column, select, update
+from sqlalchemy.orm import Session
+from sql_app.cache import CHANGED_PROFILES, normalize_name, skill_cache
+from sql_app.crud import PROFILE_KEY, escape_like
+from sql_app.keyset import PageRequest, keyset_page
+from sql_app.models import Experience, Profile, ProfileSearch, ProfileSkills, Project, ProjectSkills, Skills
+
+# No stemming or stop words, so PostgreSQL and the inverted index agree on what
+# matches. Rendered inline: the GIN indexes are on to_tsvector('simple', ...)
+# and a bound parameter would not match their expression.
+SEARCH_CONFIG = literal_column("'simple'")
+FACET_LIMIT = 20
+REBUILD_BATCH_SIZE = 10000
+
+
+def text_of(expression):
+    return func.coalesce(expression, "")
+
+
+def aggregated(expression, *where):
+    return text_of(select(func.aggregate_strings(expression, " ")).where(*where).scalar_subquery())
+
+
+def document_expression():
+    # Correlated on Profile, so one INSERT ... SELECT builds any number of documents
+    parts = [
+        text_of(Profile.full_name),
+        text_of(Profile.profile_type),
+        text_of(Profile.address_area),
+        aggregated(text_of(Project.title) + " " + text_of(Project.description), Project.profile_id == Profile.id),
+        aggregated(text_of(Experience.title) + " " + text_of(Experience.company), Experience.profile_id == Profile.id),
+        aggregated(Skills.name, Skills.id == ProfileSkills.skill_id, ProfileSkills.profile_id == Profile.id),
+        aggregated(
+            Skills.name,
+            Skills.id == ProjectSkills.skill_id, ProjectSkills.project_id == Project.id, Project.profile_id == Profile.id,
+        ),
+    ]
+    return reduce(lambda left, right: left + " " + right, parts)
+
+
+def document_statements(matches):
+    # UPDATE the existing documents, then INSERT those of profiles without one.
+    # Unlike INSERT ... ON CONFLICT (no SQL cache key in this SQLAlchemy version,
+    # so compiled again on every commit) both are compiled once and cached.
+    table = ProfileSearch.__table__
+    update_existing = (
+        update(table)
+        .where(matches(table.c.profile_id))
+        .values(document=select(document_expression()).where(Profile.id == table.c.profile_id).scalar_subquery())
+    )
+    insert_missing = insert(table).from_select(
+        ["profile_id", "document"],
+        select(Profile.id, document_expression()).where(matches(Profile.id), ~exists().where(table.c.profile_id == Profile.id)),
+    )
+    return update_existing, insert_missing
+
+
+REBUILD_BY_IDS = document_statements(lambda column: column.in_(bindparam("profile_ids", expanding=True)))
+REBUILD_BY_RANGE = document_statements(lambda column: column.between(bindparam("first_id"), bindparam("last_id")))
+
+
+def rebuild_documents(db: Session, profile_ids):
+    for statement in REBUILD_BY_IDS:
+        db.execute(statement, {"profile_ids": sorted(profile_ids)})
+
+
+def rebuild_all_documents(db: Session, batch_size=REBUILD_BATCH_SIZE):
+    # Id range batches, each committed, so a full rebuild never holds one huge transaction
+    rebuilt = 0
+    last_id = 0
+    while True:
+        ids = db.scalars(select(Profile.id).where(Profile.id > last_id).order_by(Profile.id).limit(batch_size)).all()
+        if not ids:
+            return rebuilt
+        for statement in REBUILD_BY_RANGE:
+            db.execute(statement, {"first_id": ids[0], "last_id": ids[-1]})
+        db.commit()
+        rebuilt += len(ids)
+        last_id = ids[-1]
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    return set(TOKEN_PATTERN.findall(text.casefold()))
+
+
+class InvertedIndex:
+    # token -> profile ids over the profile_search documents. Loaded on first
+    # use and patched with the profiles rebuilt by committed transactions.
+
+    def __init__(self):
+        self._postings = defaultdict(set)
+        self._tokens = {}
+        self._stale = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def mark_stale(self, profile_ids):
+        with self._lock:
+            self._stale.update(profile_ids)
+
+    def clear(self):
+        with self._lock:
+            self._postings.clear()
+            self._tokens.clear()
+            self._stale.clear()
+            self._loaded = False
+
+    def _index(self, profile_id, document):
+        for token in self._tokens.pop(profile_id, ()):
+            postings = self._postings[token]
+            postings.discard(profile_id)
+            if not postings:
+                del self._postings[token]
+        tokens = tokenize(document)
+        if tokens:
+            self._tokens[profile_id] = tokens
+        for token in tokens:
+            self._postings[token].add(profile_id)
+
+    def sync(self, db: Session):
+        statement = select(ProfileSearch.profile_id, ProfileSearch.document)
+        with self._lock:
+            if not self._loaded:
+                self._stale.clear()
+                documents = db.execute(statement).all()
+                self._loaded = True
+            elif self._stale:
+                stale, self._stale = self._stale, set()
+                documents = db.execute(statement.where(ProfileSearch.profile_id.in_(sorted(stale)))).all()
+                # Profiles without a document any more drop out of the index
+                documents += [(profile_id, "") for profile_id in stale - {row.profile_id for row in documents}]
+            else:
+                return
+            for profile_id, document in documents:
+                self._index(profile_id, document)
+
+    def match(self, text):
+        # Profiles containing every token, like plainto_tsquery
+        tokens = tokenize(text)
+        if not tokens:
+            return set()
+        with self._lock:
+            postings = sorted((self._postings.get(token, set()) for token in tokens), key=len)
+            return set.intersection(*postings)
+
+    def stats(self):
+        with self._lock:
+            return {"loaded": self._loaded, "profiles": len(self._tokens), "tokens": len(self._postings), "stale": len(self._stale)}
+
+
+search_index = InvertedIndex()
+
+
+# Documents are rebuilt just before the commit, once the last flush has run the
+# mapper events that record changed profiles (mark_profile_changed for bulk writes)
+SEARCH_REBUILT = "search_rebuilt"
+
+
+@event.listens_for(Session, "before_commit")
+def rebuild_changed_documents(session):
+    session.flush()
+    profile_ids = {owner_id for kind, owner_id in session.info.get(CHANGED_PROFILES, ()) if kind == "profile"}
+    if profile_ids:
+        rebuild_documents(session, profile_ids)
+        session.info.setdefault(SEARCH_REBUILT, set()).update(profile_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def publish_rebuilt_documents(session):
+    profile_ids = session.info.pop(SEARCH_REBUILT, None)
+    if profile_ids:
+        search_index.mark_stale(profile_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_rebuilt_documents(session):
+    session.info.pop(SEARCH_REBUILT, None)
+
+
+@dataclass(frozen=True)
+class ProfileQuery:
+    # Words to find anywhere in the profile document
+    text: Optional[str] = None
+    # Profiles must have every one of these skills
+    skills: Tuple[str, ...] = ()
+    min_experience: Optional[int] = None
+    profile_type: Optional[str] = None
+    # Words to find in the title of at least one project
+    project_title: Optional[str] = None
+
+
+def uses_full_text(db: Session):
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def full_text_match(column, text):
+    return func.to_tsvector(SEARCH_CONFIG, column).op("@@")(func.plainto_tsquery(SEARCH_CONFIG, text))
+
+
+def resolve_skill_filter(db: Session, names):
+    # Skill ids for the names, or None when one of them does not exist (no profile can match)
+    wanted = {}
+    for name in names:
+        key = normalize_name(name)
+        if key:
+            wanted.setdefault(key, " ".join(name.split()))
+    ids = {}
+    for key in wanted:
+        entry = skill_cache.get(key)
+        if entry is not None:
+            ids[key] = entry[0]
+    missing = {key: name for key, name in wanted.items() if key not in ids}
+    if missing:
+        ids.update(skill_cache.fetch(db, missing))
+    if wanted.keys() - ids.keys():
+        return None
+    return set(ids.values())
+
+
+# Condition builders, shared with benchmarks/explain_queries.py so the plans it
+# checks are those of the statements the route runs
+
+def full_text_condition(text):
+    return Profile.id.in_(select(ProfileSearch.profile_id).where(full_text_match(ProfileSearch.document, text)))
+
+
+def matching_ids_condition(profile_ids):
+    return Profile.id.in_(bindparam("matching_profile_ids", sorted(profile_ids), expanding=True, literal_execute=True))
+
+
+def every_skill_condition(skill_ids):
+    having_all = (
+        select(ProfileSkills.profile_id)
+        .where(ProfileSkills.skill_id.in_(skill_ids))
+        .group_by(ProfileSkills.profile_id)
+        .having(func.count() == len(skill_ids))
+    )
+    return Profile.id.in_(having_all)
+
+
+def project_title_condition(text, full_text):
+    if full_text:
+        title_match = full_text_match(Project.title, text)
+    else:
+        title_match = Project.title.ilike("%{}%".format(escape_like(text)), escape="\\")
+    return exists().where(Project.profile_id == Profile.id, title_match)
+
+
+def profile_conditions(db: Session, query: ProfileQuery):
+    # WHERE clauses over Profile for the query, or None when nothing can match
+    conditions = []
+    if query.text:
+        if uses_full_text(db):
+            conditions.append(full_text_condition(query.text))
+        else:
+            search_index.sync(db)
+            matches = search_index.match(query.text)
+            if not matches:
+                return None
+            conditions.append(matching_ids_condition(matches))
+
+    if query.skills:
+        skill_ids = resolve_skill_filter(db, query.skills)
+        if skill_ids is None:
+            return None
+        if skill_ids:
+            conditions.append(every_skill_condition(skill_ids))
+
+    if query.min_experience is not None:
+        conditions.append(Profile.experience >= query.min_experience)
+    if query.profile_type:
+        conditions.append(Profile.profile_type == query.profile_type)
+
+    if query.project_title:
+        conditions.append(project_title_condition(query.project_title, uses_full_text(db)))
+    return conditions
+
+
+def skill_facet_statement(statement, limit=FACET_LIMIT):
+    # Skill counts over every matching profile, not just the page, in one GROUP BY
+    matching = statement.with_only_columns(Profile.id).order_by(None)
+    count = func.count().label("count")
+    return (
+        select(Skills.name, count)
+        .join(ProfileSkills, ProfileSkills.skill_id == Skills.id)
+        .where(ProfileSkills.profile_id.in_(matching))
+        .group_by(Skills.name)
+        .order_by(count.desc(), Skills.name)
+        .limit(limit)
+    )
+
+
+def skill_facets(db: Session, statement, limit=FACET_LIMIT):
+    rows = db.execute(skill_facet_statement(statement, limit)).all()
+    return [{"value": name, "count": total} for name, total in rows]
+
+
+# Returns (profiles, next_cursor, total, facets). Results are keyset pages in
+# profile id order; facets are only counted for the first page.
+def search_profiles(db: Session, query: ProfileQuery, page: PageRequest, facets=True):
+    conditions = profile_conditions(db, query)
+    if conditions is None:
+        return [], None, 0 if page.include_total else None, {"skills": []} if facets and page.after is None else {}
+
+    statement = select(Profile).where(*conditions)
+    profiles, next_cursor, total = keyset_page(db, statement, PROFILE_KEY, page)
+    result_facets = {}
+    if facets and page.after is None:
+        result_facets["skills"] = skill_facets(db, statement)
+    return profiles, next_cursor, total, result_facets
+
+
+def main():
+    from sql_app.database import SessionLocal
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        rebuilt = rebuild_all_documents(db)
+    print("rebuilt {} profile search documents in {:.1f}s".format(rebuilt, time.perf_counter() - started), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
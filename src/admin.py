@@ -0,0 +1,20 @@
+# admin.py
+#
+# X-Admin-Token check for the operator-only routes: the monitoring endpoints
+# and, when enabled, /debug/* and ?__profile=1 (src/profiling.py). The token is
+# PROFILING_ADMIN_TOKEN; nothing is accepted while it is empty.
+
+import hmac
+
+from fastapi import Header, HTTPException
+from sql_app.config import profiling_settings
+
+
+def is_admin_token(token):
+    expected = profiling_settings.admin_token
+    return bool(expected) and token is not None and hmac.compare_digest(token.encode("utf-8"), expected.encode("utf-8"))
+
+
+def require_admin(x_admin_token: str = Header(None)):
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
@@ -0,0 +1,204 @@
+# export.py
+#
+# Bulk export of profiles with their projects and skills. Rows are read through
+# server-side cursors (yield_per) in profile id order and written out one
+# profile at a time, so memory use does not grow with the number of profiles.
+#
+#   GET /export/profiles?format=ndjson|csv&since=<X-Export-Watermark of the last run>
+
+import csv
+import io
+import zlib
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from itertools import groupby
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sql_app import database
+from sql_app.cache import Principal, encode_json
+from sql_app.models import Profile, ProfileSkills, Project, ProjectSkills, Skills
+from src.users import get_current_user, get_db
+
+
+router = APIRouter()
+
+# Rows fetched per round trip from the server-side cursor
+YIELD_PER = 1000
+# Output is written in chunks of about this size rather than one line at a time
+CHUNK_SIZE = 64 * 1024
+# updated_at is stamped when a transaction writes but only becomes visible when
+# it commits, so the watermark handed out overlaps the export by this much.
+# Consumers upsert by id, so re-exported profiles are harmless.
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+PROFILE_COLUMNS = (
+    Profile.id, Profile.user_id, Profile.profile_type, Profile.full_name, Profile.email, Profile.experience,
+    Profile.address_area, Profile.link, Profile.github, Profile.bitbucket, Profile.gitlab, Profile.updated_at,
+)
+PROJECT_COLUMNS = (Project.id, Project.title, Project.description, Project.start_date, Project.end_date, Project.image)
+
+CSV_HEADER = (
+    [column.key for column in PROFILE_COLUMNS] + ["skills"]
+    + ["project_" + column.key for column in PROJECT_COLUMNS] + ["project_skills"]
+)
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {ExportFormat.ndjson: "application/x-ndjson", ExportFormat.csv: "text/csv"}
+
+
+def plain(value):
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def changed_since(statement, since):
+    return statement.where(Profile.updated_at > since) if since is not None else statement
+
+
+def project_statement(since=None):
+    # One row per (profile, project, project skill); profiles without projects
+    # come through the outer join with NULL project columns
+    statement = (
+        select(*PROFILE_COLUMNS, *[column.label("project_" + column.key) for column in PROJECT_COLUMNS], Skills.name.label("skill"))
+        .select_from(Profile)
+        .outerjoin(Project, Project.profile_id == Profile.id)
+        .outerjoin(ProjectSkills, ProjectSkills.project_id == Project.id)
+        .outerjoin(Skills, Skills.id == ProjectSkills.skill_id)
+        .order_by(Profile.id, Project.id)
+    )
+    return changed_since(statement, since)
+
+
+def profile_skill_statement(since=None):
+    statement = (
+        select(ProfileSkills.profile_id, Skills.name)
+        .join(Skills, Skills.id == ProfileSkills.skill_id)
+        .order_by(ProfileSkills.profile_id)
+    )
+    if since is not None:
+        statement = changed_since(statement.join(Profile, Profile.id == ProfileSkills.profile_id), since)
+    return statement
+
+
+def project_rows(db: Session, since):
+    return db.execute(project_statement(since).execution_options(yield_per=YIELD_PER))
+
+
+def profile_skill_rows(db: Session, since):
+    return db.execute(profile_skill_statement(since).execution_options(yield_per=YIELD_PER))
+
+
+def iter_profiles(db: Session, since=None):
+    # Merges the two profile id ordered streams into one document per profile
+    skill_rows = iter(profile_skill_rows(db, since))
+    pending = next(skill_rows, None)
+
+    for profile_id, rows in groupby(project_rows(db, since), key=lambda row: row.id):
+        rows = list(rows)
+        skills = []
+        while pending is not None and pending.profile_id <= profile_id:
+            if pending.profile_id == profile_id:
+                skills.append(pending.name)
+            pending = next(skill_rows, None)
+
+        document = {column.key: plain(getattr(rows[0], column.key)) for column in PROFILE_COLUMNS}
+        document["skills"] = skills
+        document["projects"] = [
+            {
+                **{column.key: plain(getattr(project[0], "project_" + column.key)) for column in PROJECT_COLUMNS},
+                "skills": [row.skill for row in project if row.skill is not None],
+            }
+            for project in (list(group) for project_id, group in groupby(rows, key=lambda row: row.project_id) if project_id is not None)
+        ]
+        yield document
+
+
+def ndjson_lines(documents):
+    for document in documents:
+        yield encode_json(document) + b"\n"
+
+
+def csv_lines(documents):
+    # One line per project, or a single line with empty project columns. The
+    # header goes out on its own, so an empty export is still a valid CSV.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(CSV_HEADER)
+    yield buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate()
+    no_project = [None] * (len(PROJECT_COLUMNS) + 1)
+    for document in documents:
+        profile = [document[column.key] for column in PROFILE_COLUMNS] + [";".join(document["skills"])]
+        for project in document["projects"] or [None]:
+            if project is None:
+                writer.writerow(profile + no_project)
+            else:
+                writer.writerow(profile + [project[column.key] for column in PROJECT_COLUMNS] + [";".join(project["skills"])])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def chunked(lines, compress=False):
+    # wbits=31 writes a gzip container, so the stream is a valid .gz file
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    buffer = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            data = b"".join(buffer)
+            buffer.clear()
+            size = 0
+            if compressor is not None:
+                data = compressor.compress(data)
+            if data:
+                yield data
+
+    data = b"".join(buffer)
+    if compressor is not None:
+        data = compressor.compress(data) + compressor.flush()
+    if data:
+        yield data
+
+
+def export_stream(export_format, since, compress):
+    # The request's session is closed before the body is sent, so the stream
+    # opens its own and holds it until the last chunk
+    with database.SessionLocal() as db:
+        documents = iter_profiles(db, since)
+        lines = ndjson_lines(documents) if export_format is ExportFormat.ndjson else csv_lines(documents)
+        yield from chunked(lines, compress)
+
+
+@router.get("/export/profiles", tags=["export"])
+def export_profiles(
+    request: Request,
+    format: ExportFormat = Query(ExportFormat.ndjson),
+    since: Optional[datetime] = Query(None, description="X-Export-Watermark of the previous export, for only the profiles changed since"),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    if since is not None:
+        since = since.replace(tzinfo=timezone.utc) if since.tzinfo is None else since.astimezone(timezone.utc)
+
+    # The watermark comes from the database clock, the one that stamps updated_at
+    now = db.scalar(select(func.now()))
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    headers = {"X-Export-Watermark": (now - WATERMARK_OVERLAP).isoformat(), "Vary": "Accept-Encoding"}
+
+    compress = "gzip" in request.headers.get("accept-encoding", "")
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(export_stream(format, since, compress), media_type=MEDIA_TYPES[format], headers=headers)
@@ -0,0 +1,290 @@
+# identity.py
+#
+# Client for the Google identity provider. Calls go through one shared,
+# connection-pooled httpx.AsyncClient with timeouts, retries with backoff and a
+# circuit breaker, so a slow or failing provider costs a bounded wait and then
+# fast 503s instead of piling up requests. Access tokens are validated through
+# the userinfo endpoint and the result cached; Google ID tokens are verified
+# locally against Google's signing keys (JWKS, fetched and cached), so those
+# logins make no network call at all. RS256 verification needs the
+# `cryptography` package; without it ID tokens are refused with a 401.
+
+import asyncio
+import hashlib
+import importlib.util
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+from sql_app.cache import TTLCache
+from sql_app.config import identity_settings
+from src.tokens import b64decode, is_timestamp
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+class IdentityProviderUnavailable(Exception):
+    pass
+
+
+class InvalidIdentityToken(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class GoogleIdentity:
+    email: str
+    name: str
+
+
+class CircuitBreaker:
+    # Opens after `failures` consecutive failed calls; once `reset` seconds have
+    # passed a single trial call is let through, and its outcome closes or
+    # re-opens the circuit. Only used from the event loop, so no locking.
+
+    def __init__(self, failures, reset, timer=time.monotonic):
+        self.threshold = failures
+        self.reset = reset
+        self.timer = timer
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if self._trial or self.timer() - self.opened_at >= self.reset else "open"
+
+    def allow(self):
+        if self.opened_at is None:
+            return True
+        if not self._trial and self.timer() - self.opened_at >= self.reset:
+            self._trial = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial = False
+        if self.failures >= self.threshold:
+            self.opened_at = self.timer()
+
+
+class RS256PublicKey:
+    algorithm = "RS256"
+
+    def __init__(self, kid, jwk):
+        from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
+        self.kid = kid
+        exponent = int.from_bytes(b64decode(jwk["e"].encode("ascii")), "big")
+        modulus = int.from_bytes(b64decode(jwk["n"].encode("ascii")), "big")
+        self.public_key = RSAPublicNumbers(exponent, modulus).public_key()
+
+    def verify(self, message, signature):
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        try:
+            self.public_key.verify(signature, message, padding.PKCS1v15(), hashes.SHA256())
+        except InvalidSignature:
+            return False
+        return True
+
+
+class IdentityClient:
+
+    def __init__(self, settings, transport=None):
+        self.settings = settings
+        self.client_ids = frozenset(filter(None, (part.strip() for part in settings.google_client_ids.split(","))))
+        self.rsa_supported = importlib.util.find_spec("cryptography") is not None
+        if self.client_ids and not self.rsa_supported:
+            logger.error("GOOGLE_CLIENT_IDS is set but the cryptography package is not installed, Google ID tokens will be refused")
+        # httpx transport override, e.g. httpx.MockTransport in tests
+        self.transport = transport
+        self.breaker = CircuitBreaker(settings.breaker_failures, settings.breaker_reset)
+        # sha256 of the access token -> userinfo, so tokens are not kept in memory
+        self.userinfo_cache = TTLCache(maxsize=settings.userinfo_cache_size, ttl=settings.userinfo_cache_ttl)
+        self._http = None
+        self._keys = {}
+        self._keys_expire_at = 0.0
+        self._keys_fetched_at = None
+        self._keys_lock = asyncio.Lock()
+
+    def http(self):
+        # Created on first use, inside the worker's event loop. httpx is only
+        # imported then, as it takes longer to import than the rest of the app
+        # and most workers never sign anyone in with Google.
+        import httpx
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.settings.read_timeout_ms / 1000, connect=self.settings.connect_timeout_ms / 1000),
+                limits=httpx.Limits(
+                    max_connections=self.settings.max_connections,
+                    max_keepalive_connections=self.settings.max_connections,
+                    keepalive_expiry=self.settings.keepalive_expiry,
+                ),
+                headers={"Accept": "application/json"},
+                transport=self.transport,
+            )
+        return self._http
+
+    async def aclose(self):
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def get(self, url, headers=None):
+        # Any answer below 500 (other than 429) means the provider is healthy,
+        # including the 401 for a bad token
+        if not self.breaker.allow():
+            raise IdentityProviderUnavailable("Circuit open")
+
+        from httpx import TransportError
+        for attempt in range(self.settings.retries + 1):
+            if attempt:
+                await asyncio.sleep(self.settings.retry_backoff_ms / 1000 * 2 ** (attempt - 1))
+            try:
+                response = await self.http().get(url, headers=headers)
+            except TransportError as exc:
+                logger.warning("Identity provider request failed (attempt %d): %r", attempt + 1, exc)
+                continue
+            if response.status_code == 429 or response.status_code >= 500:
+                logger.warning("Identity provider answered %d (attempt %d)", response.status_code, attempt + 1)
+                continue
+            self.breaker.record_success()
+            return response
+
+        self.breaker.record_failure()
+        raise IdentityProviderUnavailable("Identity provider did not answer")
+
+    async def userinfo(self, access_token) -> GoogleIdentity:
+        key = hashlib.sha256(access_token.encode("utf-8")).digest()
+        identity = self.userinfo_cache.get(key)
+        if identity is not None:
+            return identity
+
+        response = await self.get(self.settings.google_userinfo_url, headers={"Authorization": "Bearer " + access_token})
+        try:
+            info = response.json() if response.status_code == 200 else {}
+        except ValueError:
+            info = {}
+        if not info.get("email") or not info.get("verified_email", False):
+            raise InvalidIdentityToken("Access token rejected")
+
+        # userinfo does not say when the token expires, and asking tokeninfo too
+        # would double the calls on a miss, so entries live for the configured
+        # TTL (USERINFO_CACHE_TTL), well inside Google's one hour access token
+        # lifetime. A token revoked early stays accepted for at most that long.
+        identity = GoogleIdentity(email=info["email"], name=info.get("name", ""))
+        self.userinfo_cache.set(key, identity)
+        return identity
+
+    async def refresh_keys(self):
+        response = await self.get(self.settings.google_jwks_url)
+        try:
+            keys = {jwk["kid"]: RS256PublicKey(jwk["kid"], jwk) for jwk in response.json()["keys"] if jwk.get("kty") == "RSA"}
+        except (ValueError, KeyError, TypeError):
+            keys = None
+        if response.status_code != 200 or not keys:
+            raise IdentityProviderUnavailable("Unusable JWKS response")
+
+        max_age = MAX_AGE_PATTERN.search(response.headers.get("cache-control", ""))
+        now = time.monotonic()
+        self._keys = keys
+        self._keys_fetched_at = now
+        self._keys_expire_at = now + (int(max_age.group(1)) if max_age else self.settings.jwks_default_ttl)
+
+    async def signing_key(self, kid):
+        if time.monotonic() < self._keys_expire_at and kid in self._keys:
+            return self._keys[kid]
+
+        async with self._keys_lock:
+            now = time.monotonic()
+            expired = now >= self._keys_expire_at
+            # An unknown kid usually means Google rotated its keys
+            rotated = kid not in self._keys and (
+                self._keys_fetched_at is None or now - self._keys_fetched_at >= self.settings.jwks_refresh_interval
+            )
+            if expired or rotated:
+                try:
+                    await self.refresh_keys()
+                except IdentityProviderUnavailable:
+                    # Keep verifying with the keys we have while Google is unreachable
+                    if not self._keys:
+                        raise
+                    logger.warning("Could not refresh the Google JWKS, using the cached keys", exc_info=True)
+        return self._keys.get(kid)
+
+    async def verify_id_token(self, id_token) -> GoogleIdentity:
+        if not self.client_ids:
+            raise InvalidIdentityToken("Google ID tokens are not accepted, GOOGLE_CLIENT_IDS is not configured")
+        if not self.rsa_supported:
+            raise InvalidIdentityToken("Google ID tokens are not accepted, the cryptography package is not installed")
+        try:
+            header_segment, payload_segment, signature = id_token.encode("ascii").split(b".")
+            header = json.loads(b64decode(header_segment))
+            signature = b64decode(signature)
+        except ValueError:
+            raise InvalidIdentityToken("Malformed ID token")
+        if not isinstance(header, dict) or header.get("alg") != RS256PublicKey.algorithm:
+            raise InvalidIdentityToken("Unsupported ID token algorithm")
+
+        key = await self.signing_key(header.get("kid"))
+        if key is None or not key.verify(header_segment + b"." + payload_segment, signature):
+            raise InvalidIdentityToken("ID token signature verification failed")
+
+        try:
+            claims = json.loads(b64decode(payload_segment))
+        except ValueError:
+            raise InvalidIdentityToken("Malformed ID token")
+        now = time.time()
+        leeway = self.settings.id_token_leeway
+        if not isinstance(claims, dict) or not isinstance(claims.get("aud"), str):
+            raise InvalidIdentityToken("ID token was not issued for this application")
+        if claims.get("iss") not in GOOGLE_ISSUERS or claims["aud"] not in self.client_ids:
+            raise InvalidIdentityToken("ID token was not issued for this application")
+        expires_at, issued_at = claims.get("exp"), claims.get("iat", 0)
+        if not is_timestamp(expires_at) or not is_timestamp(issued_at):
+            raise InvalidIdentityToken("Malformed ID token")
+        if now > expires_at + leeway or now < issued_at - leeway:
+            raise InvalidIdentityToken("ID token expired")
+        if not claims.get("email") or claims.get("email_verified") not in (True, "true"):
+            raise InvalidIdentityToken("ID token has no verified email")
+        return GoogleIdentity(email=claims["email"], name=claims.get("name", ""))
+
+    def stats(self):
+        return {
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "userinfo_cache": self.userinfo_cache.stats(),
+            "jwks_keys": len(self._keys),
+            "jwks_expires_in": max(0, round(self._keys_expire_at - time.monotonic())) if self._keys else None,
+            "id_tokens_enabled": bool(self.client_ids) and self.rsa_supported,
+        }
+
+
+identity_client = IdentityClient(identity_settings)
+
+
+async def google_identity(access_token=None, id_token=None) -> GoogleIdentity:
+    # The user a Google Sign-In credential belongs to, as HTTP errors for the routes
+    try:
+        if id_token:
+            return await identity_client.verify_id_token(id_token)
+        return await identity_client.userinfo(access_token)
+    except InvalidIdentityToken:
+        raise HTTPException(status_code=401, detail="Invalid Google Sign-In")
+    except IdentityProviderUnavailable:
+        raise HTTPException(status_code=503, detail="Google Sign-In is unavailable, please retry", headers={"Retry-After": "5"})
@@ -0,0 +1,249 @@
+# instrumentation.py
+#
+# Per-request SQL instrumentation. Cursor hooks on the engines add every
+# statement's count, time and rows to the RequestStats of the request being
+# served: a context variable, so it follows the request into the threadpool and
+# into the async engine's greenlets. SQLInstrumentationMiddleware turns them
+# into a Server-Timing header, per-route Prometheus metrics (GET /metrics) and
+# warnings for statements repeated within one request, the usual sign of an
+# N+1 query. With SQL_REPEAT_STRICT those requests fail instead, so test runs
+# catch new N+1 queries.
+#
+# Rows are the driver's cursor.rowcount: psycopg2 and asyncpg report it for
+# SELECTs too, sqlite3 only for writes.
+
+import contextvars
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from sql_app import database
+from sql_app.config import instrumentation_settings
+
+logger = logging.getLogger(__name__)
+
+REQUEST_STATS = contextvars.ContextVar("request_stats", default=None)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+# Statements kept in a request's timeline
+TIMELINE_LIMIT = 200
+
+# Placeholder and literal lists, e.g. the expanded parameters of IN (...), so
+# the same statement with a different number of values counts as a repeat
+VALUE_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|\$\d+|-?\d+(?:\.\d+)?|'(?:[^']|'')*')(?:\s*,\s*(?:\?|%\(\w+\)s|\$\d+|-?\d+(?:\.\d+)?|'(?:[^']|'')*'))*\s*\)")
+LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+class RepeatedQueryError(RuntimeError):
+    pass
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement):
+    return LITERAL.sub("?", VALUE_LIST.sub("(...)", " ".join(statement.split())))
+
+
+class RequestStats:
+    __slots__ = ("started", "queries", "db_time", "rows", "statements", "timeline")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.statements = Counter()
+        # (offset, seconds, statement) per statement, only kept when a list is
+        # put here (slow request capture, src/profiling.py)
+        self.timeline = None
+
+    def record(self, statement, started, seconds, rows):
+        self.queries += 1
+        self.db_time += seconds
+        if rows > 0:
+            self.rows += rows
+        self.statements[statement] += 1
+        if self.timeline is not None and len(self.timeline) < TIMELINE_LIMIT:
+            self.timeline.append((started - self.started, seconds, statement))
+
+    def repeated(self, threshold):
+        # (fingerprint, count) of the statements run at least threshold times
+        if threshold <= 0 or self.queries < threshold:
+            return []
+        counts = Counter()
+        for statement, count in self.statements.items():
+            counts[fingerprint(statement)] += count
+        return [(statement, count) for statement, count in counts.most_common() if count >= threshold]
+
+    def server_timing(self, total):
+        return 'db;dur={:.2f};desc="{} queries", total;dur={:.2f}'.format(self.db_time * 1000, self.queries, total * 1000)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and REQUEST_STATS.get() is not None:
+        context._instrumentation_started = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = REQUEST_STATS.get()
+    started = getattr(context, "_instrumentation_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, started, time.perf_counter() - started, cursor.rowcount)
+
+
+def instrument_engine(engine):
+    if not event.contains(engine, "before_cursor_execute", before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", after_cursor_execute)
+
+
+def instrument_engines():
+    instrument_engine(database.engine)
+    if database.async_engine is not None:
+        instrument_engine(database.async_engine.sync_engine)
+
+
+def label_value(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def labels(**values):
+    return "{" + ",".join('{}="{}"'.format(name, label_value(value)) for name, value in values.items()) + "}"
+
+
+class Histogram:
+    __slots__ = ("bounds", "buckets", "count", "sum")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.buckets = [0] * len(bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.buckets[index] += 1
+
+    def lines(self, name, label_values):
+        for bound, count in zip(self.bounds, self.buckets):
+            yield "{}_bucket{} {}".format(name, labels(**label_values, le=bound), count)
+        yield "{}_bucket{} {}".format(name, labels(**label_values, le="+Inf"), self.count)
+        yield "{}_sum{} {}".format(name, labels(**label_values), round(self.sum, 6))
+        yield "{}_count{} {}".format(name, labels(**label_values), self.count)
+
+
+class RouteMetrics:
+    __slots__ = ("duration", "queries", "db_time", "rows", "repeated")
+
+    def __init__(self):
+        self.duration = Histogram(DURATION_BUCKETS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.db_time = 0.0
+        self.rows = 0
+        self.repeated = 0
+
+
+class Metrics:
+    # Per (method, route template) totals for this worker process
+
+    def __init__(self):
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method, route, duration, stats: RequestStats, repeated):
+        with self._lock:
+            metrics = self._routes.get((method, route))
+            if metrics is None:
+                metrics = self._routes[(method, route)] = RouteMetrics()
+            metrics.duration.observe(duration)
+            metrics.queries.observe(stats.queries)
+            metrics.db_time += stats.db_time
+            metrics.rows += stats.rows
+            metrics.repeated += bool(repeated)
+
+    def render(self):
+        with self._lock:
+            routes = sorted(self._routes.items())
+            lines = [
+                "# HELP app_request_duration_seconds Time to handle a request, by route",
+                "# TYPE app_request_duration_seconds histogram",
+            ]
+            for (method, route), metrics in routes:
+                lines.extend(metrics.duration.lines("app_request_duration_seconds", {"method": method, "route": route}))
+            lines += [
+                "# HELP app_db_queries_per_request SQL statements executed per request, by route",
+                "# TYPE app_db_queries_per_request histogram",
+            ]
+            for (method, route), metrics in routes:
+                lines.extend(metrics.queries.lines("app_db_queries_per_request", {"method": method, "route": route}))
+            counters = (
+                ("app_db_time_seconds_total", "Time spent executing SQL statements, by route", lambda metrics: round(metrics.db_time, 6)),
+                ("app_db_rows_total", "Rows returned or affected as reported by the driver, by route", lambda metrics: metrics.rows),
+                ("app_db_repeated_statement_requests_total", "Requests that repeated a statement SQL_REPEAT_THRESHOLD times or more, by route", lambda metrics: metrics.repeated),
+            )
+            for name, description, value in counters:
+                lines += ["# HELP {} {}".format(name, description), "# TYPE {} counter".format(name)]
+                for (method, route), metrics in routes:
+                    lines.append("{}{} {}".format(name, labels(method=method, route=route), value(metrics)))
+
+        lines += ["# HELP app_db_pool_connections Connections of the engine's pool, by state", "# TYPE app_db_pool_connections gauge"]
+        for engine_name, status in database.pool_status().items():
+            for state in ("checked_in", "checked_out", "overflow"):
+                if state in status:
+                    lines.append("app_db_pool_connections{} {}".format(labels(engine=engine_name, state=state), status[state]))
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+def route_of(scope):
+    # The route template keeps label cardinality bounded; unmatched paths share one label
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class SQLInstrumentationMiddleware:
+
+    def __init__(self, app, settings=instrumentation_settings, registry=metrics):
+        self.app = app
+        self.settings = settings
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = REQUEST_STATS.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                if self.settings.repeat_strict:
+                    repeated = stats.repeated(self.settings.repeat_threshold)
+                    if repeated:
+                        raise RepeatedQueryError("{} {} ran {!r} {} times".format(scope["method"], route_of(scope), *repeated[0]))
+                if self.settings.server_timing:
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing(time.perf_counter() - stats.started))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            REQUEST_STATS.reset(token)
+            route = route_of(scope)
+            # Checked again once streamed bodies have run their statements too
+            repeated = stats.repeated(self.settings.repeat_threshold)
+            for statement, count in repeated:
+                logger.warning("Possible N+1 query: %s %s ran %d times: %s", scope["method"], route, count, statement)
+            self.registry.observe(scope["method"], route, time.perf_counter() - stats.started, stats, repeated)
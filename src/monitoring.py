@@ -0,0 +1,62 @@
+# monitoring.py
+#
+# Operator endpoints. Everything but /metrics needs the X-Admin-Token header
+# (src/admin.py); /metrics is left open for Prometheus to scrape and exposes
+# counters only.
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from sql_app import database
+from sql_app.cache import institution_cache, principal_cache, profile_cache, skill_cache
+from sql_app.schemas import Envelope
+from sql_app.search import search_index
+from src.admin import require_admin
+from src.identity import identity_client
+from src.instrumentation import PROMETHEUS_CONTENT_TYPE, metrics
+from src.passwords import hashing_status
+from src.startup import startup_report
+
+
+router = APIRouter()
+admin_router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@admin_router.get("/db_pool", tags=["monitoring"], response_model=Envelope[dict])
+def get_db_pool():
+    # Pool gauges for sizing pool_size/max_overflow per uvicorn worker
+    return { "data": database.pool_status(), "status": True, "message": "Pool status fetched successfully"}
+
+
+@router.get("/metrics", tags=["monitoring"], response_class=Response)
+def get_metrics():
+    # Prometheus text format; every worker process keeps its own totals
+    return Response(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@admin_router.get("/cache_stats", tags=["monitoring"], response_model=Envelope[dict])
+def get_cache_stats():
+    caches = {
+        "skills": skill_cache.entries.stats(),
+        "institutions": institution_cache.entries.stats(),
+        "principals": principal_cache.stats(),
+        "profiles": profile_cache.stats(),
+        "search_index": search_index.stats(),
+    }
+    return { "data": caches, "status": True, "message": "Cache stats fetched successfully"}
+
+
+@admin_router.get("/password_hashing", tags=["monitoring"], response_model=Envelope[dict])
+def get_password_hashing():
+    return { "data": hashing_status(), "status": True, "message": "Password hashing status fetched successfully"}
+
+
+@admin_router.get("/identity_provider", tags=["monitoring"], response_model=Envelope[dict])
+def get_identity_provider():
+    # Circuit breaker state, userinfo cache and Google signing keys
+    return { "data": identity_client.stats(), "status": True, "message": "Identity provider status fetched successfully"}
+
+
+@admin_router.get("/startup", tags=["monitoring"], response_model=Envelope[dict])
+def get_startup():
+    # Milliseconds spent importing the app and in each warm-up phase
+    return { "data": startup_report, "status": True, "message": "Startup report fetched successfully"}
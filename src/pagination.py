@@ -0,0 +1,33 @@
+# pagination.py
+
+from typing import Optional
+
+from fastapi import Query
+from fastapi.responses import JSONResponse
+from sql_app.keyset import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor, PageRequest, decode_cursor
+
+
+class Pagination:
+    # Dependency for keyset paginated list routes: ?cursor=&limit=&include_total=
+    # Limits above max_limit are capped rather than rejected. __call__ is async
+    # only so FastAPI runs it inline instead of in the threadpool.
+
+    def __init__(self, default_limit=DEFAULT_PAGE_SIZE, max_limit=MAX_PAGE_SIZE):
+        self.default_limit = default_limit
+        self.max_limit = max_limit
+
+    async def __call__(
+        self,
+        cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+        limit: Optional[int] = Query(None, ge=1, description="Page size"),
+        include_total: bool = Query(False, description="Also count all matching rows"),
+    ) -> PageRequest:
+        return PageRequest(
+            after=decode_cursor(cursor) if cursor else None,
+            limit=min(limit or self.default_limit, self.max_limit),
+            include_total=include_total,
+        )
+
+
+async def invalid_cursor_handler(request, exc: InvalidCursor):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
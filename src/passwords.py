@@ -0,0 +1,59 @@
+# passwords.py
+#
+# bcrypt hashing runs in a dedicated, size-limited thread pool so a burst of
+# logins cannot starve the event loop or Starlette's threadpool. Once more
+# than hash_max_pending calls are queued, new ones fail fast with a 503.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from fastapi import HTTPException
+from sql_app.config import auth_settings
+
+
+# Password hashing; hashes with fewer rounds than configured count as deprecated.
+# Built on first use: importing passlib and loading the bcrypt backend would
+# otherwise add to every worker's start, most of which only verify JWTs.
+@lru_cache(maxsize=None)
+def get_password_hashing():
+    from passlib.context import CryptContext
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=auth_settings.bcrypt_rounds,
+        bcrypt__min_rounds=auth_settings.bcrypt_rounds,
+    )
+
+
+hash_executor = ThreadPoolExecutor(max_workers=auth_settings.hash_workers, thread_name_prefix="password-hash")
+
+# Hash/verify calls submitted and not yet finished; only touched on the event loop
+pending = 0
+
+
+async def run_hashing(func, *args):
+    global pending
+    if pending >= auth_settings.hash_max_pending:
+        raise HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
+
+    pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(hash_executor, func, *args)
+    finally:
+        pending -= 1
+
+
+async def hash_password(password):
+    return await run_hashing(get_password_hashing().hash, password)
+
+
+# Returns (valid, new_hash); new_hash is set when the stored hash should be upgraded
+async def verify_password(password, hashed_password):
+    if not hashed_password:
+        return False, None
+    return await run_hashing(get_password_hashing().verify_and_update, password, hashed_password)
+
+
+def hashing_status():
+    return {"pending": pending, "max_pending": auth_settings.hash_max_pending, "workers": auth_settings.hash_workers}
@@ -0,0 +1,298 @@
+# profiling.py
+#
+# Opt-in profiling for a running worker (PROFILING_ENABLED, see
+# ProfilingSettings), all of it behind the X-Admin-Token header:
+#
+#   GET /debug/profile?seconds=10&format=collapsed|svg
+#       samples the stacks of every thread for a fixed time and returns them
+#       as collapsed stacks (flamegraph.pl / speedscope input) or an SVG flamegraph
+#   GET /debug/slow_requests
+#       the latest requests slower than SLOW_REQUEST_MS, slowest first, with
+#       route, query parameters and the SQL timeline
+#   any route with ?__profile=1 (or __profile=svg)
+#       runs the request under the sampler and answers with its profile
+#       instead of the response
+#
+# The sampler is a thread reading sys._current_frames() every few
+# milliseconds, so nothing is paid between samples and nothing at all when no
+# profile is running. With profiling disabled neither the middleware nor the
+# routes are installed.
+
+import asyncio
+import html
+import sys
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from datetime import datetime, timezone
+from enum import Enum
+from urllib.parse import parse_qsl
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+from sql_app.config import profiling_settings
+from sql_app.schemas import Envelope
+from src.admin import is_admin_token, require_admin
+from src.instrumentation import REQUEST_STATS, fingerprint, route_of
+
+# Query parameters shown as *** in the slow request log
+SENSITIVE_PARAMETERS = ("token", "password", "secret", "code")
+
+# ?__profile=1 requests are short, so they are sampled more often
+REQUEST_SAMPLE_INTERVAL = 0.001
+
+FLAMEGRAPH_WIDTH = 1200
+FLAMEGRAPH_ROW = 16
+
+
+class ProfileFormat(str, Enum):
+    collapsed = "collapsed"
+    svg = "svg"
+
+
+# Innermost frames of threads blocked waiting for work; their samples are left
+# out unless include_idle is set
+IDLE_FRAMES = frozenset({"threading:wait", "selectors:select", "concurrent.futures.thread:_worker"})
+
+
+class Sampler:
+    # Counts "thread;outer;...;inner" stacks of every thread but its own
+
+    def __init__(self, interval, include_idle=False):
+        self.interval = interval
+        self.include_idle = include_idle
+        self.samples = 0
+        self.stacks = Counter()
+        self._labels = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def label(self, frame):
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = "{}:{}".format(frame.f_globals.get("__name__", "?"), code.co_name)
+        return label
+
+    def sample(self):
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            if not self.include_idle and self.label(frame) in IDLE_FRAMES:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self.label(frame))
+                frame = frame.f_back
+            stack.append(names.get(ident, str(ident)))
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def run(self):
+        # Sample straight away, so even a request shorter than the interval gets one
+        while True:
+            self.sample()
+            if self._stop.wait(self.interval):
+                return
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+
+def collapsed(stacks):
+    return "".join("{} {}\n".format(stack, count) for stack, count in stacks.most_common())
+
+
+def flamegraph(stacks, title):
+    # Minimal SVG flamegraph: frames as boxes as wide as their sample count,
+    # callers below callees, hover for the full name and count
+    root = {"count": 0, "children": {}}
+    for stack, count in stacks.items():
+        root["count"] += count
+        node = root
+        for name in stack.split(";"):
+            node = node["children"].setdefault(name, {"count": 0, "children": {}})
+            node["count"] += count
+
+    boxes = []
+    depth_reached = [0]
+
+    def layout(node, x, depth):
+        for name, child in sorted(node["children"].items()):
+            width = child["count"] / root["count"] * FLAMEGRAPH_WIDTH
+            if width >= 0.5:
+                boxes.append((name, child["count"], x, depth, width))
+                depth_reached[0] = max(depth_reached[0], depth)
+                layout(child, x, depth + 1)
+            x += width
+
+    if root["count"]:
+        layout(root, 0.0, 0)
+    height = (depth_reached[0] + 2) * FLAMEGRAPH_ROW + 24
+    parts = [
+        '<svg xmlns="http://www.w3.org/2000/svg" width="{}" height="{}" font-family="monospace" font-size="11">'.format(FLAMEGRAPH_WIDTH, height),
+        '<text x="4" y="14">{}</text>'.format(html.escape(title)),
+    ]
+    for name, count, x, depth, width in boxes:
+        y = height - (depth + 1) * FLAMEGRAPH_ROW
+        hue = zlib.crc32(name.encode("utf-8")) % 60
+        label = html.escape(name)
+        parts.append('<g><title>{} ({} samples, {:.1f}%)</title><rect x="{:.1f}" y="{}" width="{:.1f}" height="{}" fill="hsl({},80%,60%)" stroke="white"/>'.format(
+            label, count, count / root["count"] * 100, x, y, width, FLAMEGRAPH_ROW - 1, hue,
+        ))
+        if width > 40:
+            parts.append('<text x="{:.1f}" y="{}">{}</text>'.format(x + 3, y + 12, html.escape(name[:int(width / 7)])))
+        parts.append("</g>")
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def render_profile(stacks, profile_format, title):
+    if profile_format is ProfileFormat.svg:
+        return Response(flamegraph(stacks, title), media_type="image/svg+xml")
+    return Response(collapsed(stacks), media_type="text/plain")
+
+
+class SlowRequestLog:
+    # The latest `size` requests slower than the threshold
+
+    def __init__(self, threshold, size):
+        self.threshold = threshold
+        self._entries = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.threshold > 0
+
+    def record(self, scope, status, duration, stats):
+        query = {
+            name: "***" if any(word in name.lower() for word in SENSITIVE_PARAMETERS) else value
+            for name, value in parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+        }
+        entry = {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "method": scope["method"],
+            "route": route_of(scope),
+            "path": scope["path"],
+            "path_params": {name: str(value) for name, value in scope.get("path_params", {}).items()},
+            "query": query,
+            "status": status,
+            "duration_ms": round(duration * 1000, 2),
+        }
+        if stats is not None:
+            entry.update(
+                db_ms=round(stats.db_time * 1000, 2),
+                queries=stats.queries,
+                sql=[
+                    {"offset_ms": round(offset * 1000, 2), "duration_ms": round(seconds * 1000, 2), "statement": fingerprint(statement)}
+                    for offset, seconds, statement in stats.timeline or ()
+                ],
+            )
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self):
+        with self._lock:
+            entries = list(self._entries)
+        return sorted(entries, key=lambda entry: entry["duration_ms"], reverse=True)
+
+
+slow_requests = SlowRequestLog(profiling_settings.slow_request_ms / 1000, profiling_settings.slow_request_count)
+
+
+class ProfilingMiddleware:
+    # Slow request capture and ?__profile=1. Sits inside
+    # SQLInstrumentationMiddleware so the request's SQL stats are available.
+
+    def __init__(self, app, recorder=slow_requests):
+        self.app = app
+        self.recorder = recorder
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if b"__profile=" in scope["query_string"]:
+            profile_format = dict(parse_qsl(scope["query_string"].decode("latin-1"))).get("__profile")
+            token = dict(scope["headers"]).get(b"x-admin-token")
+            if profile_format in ("1", "collapsed", "svg") and token is not None and is_admin_token(token.decode("latin-1")):
+                await self.profile_request(scope, receive, send, ProfileFormat.svg if profile_format == "svg" else ProfileFormat.collapsed)
+                return
+
+        stats = REQUEST_STATS.get()
+        if stats is not None and self.recorder.enabled:
+            stats.timeline = []
+        started = time.perf_counter()
+        status = None
+
+        async def send_and_keep_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_keep_status)
+        finally:
+            duration = time.perf_counter() - started
+            if self.recorder.enabled and duration >= self.recorder.threshold:
+                self.recorder.record(scope, status, duration, stats)
+
+    async def profile_request(self, scope, receive, send, profile_format):
+        status = None
+
+        async def discard(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        sampler = Sampler(REQUEST_SAMPLE_INTERVAL).start()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            stacks = sampler.stop()
+        title = "{} {} -> {} in {:.1f} ms, {} samples".format(scope["method"], scope["path"], status, (time.perf_counter() - started) * 1000, sampler.samples)
+        response = render_profile(stacks, profile_format, title)
+        response.headers["X-Profiled-Status"] = str(status)
+        await response(scope, receive, send)
+
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+# One whole-process profile at a time
+profile_lock = asyncio.Lock()
+
+
+@router.get("/debug/profile", tags=["monitoring"], response_class=Response)
+async def get_profile(
+    seconds: float = Query(10, gt=0),
+    format: ProfileFormat = Query(ProfileFormat.collapsed),
+    include_idle: bool = Query(False, description="Also count threads waiting for work"),
+):
+    if profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    seconds = min(seconds, profiling_settings.max_seconds)
+    async with profile_lock:
+        sampler = Sampler(profiling_settings.sample_interval_ms / 1000, include_idle).start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            stacks = sampler.stop()
+    return render_profile(stacks, format, "{:g}s, {} samples".format(seconds, sampler.samples))
+
+
+@router.get("/debug/slow_requests", tags=["monitoring"], response_model=Envelope[list])
+def get_slow_requests():
+    return {"data": slow_requests.entries(), "status": True, "message": "Slow requests fetched successfully"}
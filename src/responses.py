@@ -0,0 +1,18 @@
+# responses.py
+#
+# Default response class for the app (see main.py). Routes declare a
+# response_model, so FastAPI hands render() plain data already serialized by
+# pydantic-core; that is written out by orjson instead of json.dumps. Models
+# passed in directly are encoded with model_dump_json in one step.
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sql_app.cache import encode_json
+
+
+class FastJSONResponse(JSONResponse):
+
+    def render(self, content) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return encode_json(content)
@@ -0,0 +1,38 @@
+# search.py
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from sql_app.cache import Principal
+from sql_app.crud import PROFILES_MESSAGE
+from sql_app.keyset import PageRequest
+from sql_app.schemas import ProfileResponse, SearchPage
+from sql_app.search import ProfileQuery, search_profiles
+from src.pagination import Pagination
+from src.users import get_current_user, get_db
+
+
+router = APIRouter()
+
+
+@router.get("/search/profiles", tags=["search"], response_model=SearchPage[ProfileResponse])
+def profile_search(
+    q: Optional[str] = Query(None, description="Words to find in the profile, its projects, experiences and skills"),
+    skills: List[str] = Query([], description="Profiles must have every one of these skills"),
+    min_experience: Optional[int] = Query(None, ge=0),
+    profile_type: Optional[str] = None,
+    project_title: Optional[str] = Query(None, description="Words to find in a project title"),
+    facets: bool = Query(True, description="Count skills over all matches (first page only)"),
+    page: PageRequest = Depends(Pagination()),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    query = ProfileQuery(
+        text=q, skills=tuple(skills), min_experience=min_experience, profile_type=profile_type, project_title=project_title,
+    )
+    profiles, next_cursor, total, counts = search_profiles(db, query, page, facets)
+    return {
+        "data": profiles, "status": True, "message": PROFILES_MESSAGE,
+        "next_cursor": next_cursor, "total": total, "facets": counts,
+    }
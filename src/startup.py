@@ -0,0 +1,122 @@
+# startup.py
+#
+# Warm-up run by main.py's lifespan before a worker takes traffic, so the
+# first requests of a freshly scaled worker do not pay for it:
+#
+#   pool     give a forked worker pools of its own, then open the pool's
+#            connections up front (STARTUP_POOL_CONNECTIONS)
+#   caches   load the skill, institution and country caches
+#   queries  run the hot read queries once, so SQLAlchemy has compiled and
+#            cached them (STARTUP_COMPILE_QUERIES)
+#
+# Every phase is timed; the report is logged and served at GET /startup. A
+# failing phase is logged and skipped, whatever it warms is filled lazily.
+
+import logging
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import Session
+from sql_app import database
+from sql_app.cache import country_cache, institution_cache, skill_cache
+from sql_app.config import settings, startup_settings
+from sql_app.crud import get_educations_page, get_experiences_page, get_profile_detail, get_projects_page, get_user_profiles_page
+from sql_app.keyset import PageRequest
+from sql_app.models import Profile, User
+
+logger = logging.getLogger(__name__)
+
+# Phase -> milliseconds, plus "import" (main.py) and "total"
+startup_report = {}
+
+
+def pool_connections(engine):
+    if isinstance(engine.pool, NullPool):
+        return 0
+    if startup_settings.pool_connections >= 0:
+        return startup_settings.pool_connections
+    return settings.pool_size
+
+
+def prefill_pool(engine):
+    # All checked out at once, so the pool has to open each of them
+    connections = []
+    try:
+        for _ in range(pool_connections(engine)):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+async def prefill_async_pool(engine):
+    connections = []
+    try:
+        for _ in range(pool_connections(engine.sync_engine)):
+            connections.append(await engine.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
+
+
+def warm_caches(db: Session):
+    skill_cache.warm(db)
+    institution_cache.warm(db)
+    country_cache.load(db)
+
+
+def compile_hot_queries(db: Session):
+    # The statements behind the busiest routes, run read-only against the first
+    # profile and user so the relationship loaders run as well
+    db.query(User).filter(User.email == "").first()
+    profile_id = db.scalar(select(func.min(Profile.id)))
+    if profile_id is not None:
+        get_profile_detail(db, profile_id)
+        get_projects_page(db, profile_id, PageRequest())
+        get_experiences_page(db, profile_id, PageRequest())
+    user_id = db.scalar(select(func.min(User.id)))
+    if user_id is not None:
+        get_user_profiles_page(db, user_id, PageRequest())
+        get_educations_page(db, user_id, PageRequest())
+    db.rollback()
+
+
+async def run_phase(name, phase):
+    started = time.perf_counter()
+    try:
+        await phase()
+    except SQLAlchemyError:
+        logger.warning("Startup phase %r failed, it will be filled lazily", name, exc_info=True)
+    startup_report[name] = round((time.perf_counter() - started) * 1000, 2)
+
+
+async def warm_up():
+    started = time.perf_counter()
+
+    async def pool():
+        if database.ensure_process_pools():
+            logger.info("Replaced the database pools inherited from the parent process")
+        prefill_pool(database.engine)
+        if database.async_engine is not None:
+            await prefill_async_pool(database.async_engine)
+
+    async def caches():
+        with database.SessionLocal() as db:
+            warm_caches(db)
+
+    async def queries():
+        with database.SessionLocal() as db:
+            compile_hot_queries(db)
+        # The async engine compiles into a cache of its own
+        if database.AsyncSessionLocal is not None:
+            async with database.AsyncSessionLocal() as db:
+                await db.run_sync(compile_hot_queries)
+
+    await run_phase("pool", pool)
+    await run_phase("caches", caches)
+    if startup_settings.compile_queries:
+        await run_phase("queries", queries)
+    startup_report["total"] = round((time.perf_counter() - started) * 1000, 2)
+    logger.info("Worker warm-up done: %s", startup_report)
@@ -0,0 +1,224 @@
+# tokens.py
+#
+# Compact JWT signing and verification for access tokens. Key objects are
+# built once: HMAC keys keep a keyed hash state that is copied per token, and
+# every key's encoded JWS header is precomputed. Tokens carry a "kid" header so
+# several keys can be active while secrets are rotated. EdDSA and ES256 keys
+# need the optional `cryptography` package and let other services verify
+# tokens from the published JWKS without knowing any secret.
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from calendar import timegm
+from datetime import datetime
+
+from sql_app.config import auth_settings
+
+
+class TokenError(Exception):
+    pass
+
+
+def b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def encode_segment(content: dict) -> bytes:
+    return b64encode(json.dumps(content, separators=(",", ":")).encode("utf-8"))
+
+
+class HMACKey:
+    algorithm = "HS256"
+
+    def __init__(self, kid, secret):
+        self.kid = kid
+        if isinstance(secret, str):
+            secret = secret.encode("utf-8")
+        self._mac = hmac.new(secret, digestmod=hashlib.sha256)
+
+    def sign(self, message):
+        mac = self._mac.copy()
+        mac.update(message)
+        return mac.digest()
+
+    def verify(self, message, signature):
+        return hmac.compare_digest(self.sign(message), signature)
+
+    def public_jwk(self):
+        # Shared secrets are never published
+        return None
+
+
+class Ed25519Key:
+    algorithm = "EdDSA"
+
+    def __init__(self, kid, private_key=None, public_key=None):
+        self.kid = kid
+        self.private_key = private_key
+        self.public_key = public_key or private_key.public_key()
+
+    def sign(self, message):
+        return self.private_key.sign(message)
+
+    def verify(self, message, signature):
+        from cryptography.exceptions import InvalidSignature
+        try:
+            self.public_key.verify(signature, message)
+        except InvalidSignature:
+            return False
+        return True
+
+    def public_jwk(self):
+        from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+        raw = self.public_key.public_bytes(Encoding.Raw, PublicFormat.Raw)
+        return {"kty": "OKP", "crv": "Ed25519", "kid": self.kid, "alg": self.algorithm, "use": "sig", "x": b64encode(raw).decode("ascii")}
+
+
+class ES256Key:
+    algorithm = "ES256"
+
+    def __init__(self, kid, private_key=None, public_key=None):
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import ec
+        self.kid = kid
+        self.private_key = private_key
+        self.public_key = public_key or private_key.public_key()
+        self._signature_algorithm = ec.ECDSA(hashes.SHA256())
+
+    def sign(self, message):
+        from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+        # JWS wants the raw 64 byte r || s form rather than DER
+        r, s = decode_dss_signature(self.private_key.sign(message, self._signature_algorithm))
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+    def verify(self, message, signature):
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+        if len(signature) != 64:
+            return False
+        der = encode_dss_signature(int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:], "big"))
+        try:
+            self.public_key.verify(der, message, self._signature_algorithm)
+        except InvalidSignature:
+            return False
+        return True
+
+    def public_jwk(self):
+        numbers = self.public_key.public_numbers()
+        return {
+            "kty": "EC", "crv": "P-256", "kid": self.kid, "alg": self.algorithm, "use": "sig",
+            "x": b64encode(numbers.x.to_bytes(32, "big")).decode("ascii"),
+            "y": b64encode(numbers.y.to_bytes(32, "big")).decode("ascii"),
+        }
+
+
+ASYMMETRIC_KEYS = {"EdDSA": Ed25519Key, "ES256": ES256Key}
+
+
+def load_private_key(kid, algorithm, pem):
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+    return ASYMMETRIC_KEYS[algorithm](kid, private_key=load_pem_private_key(pem, password=None))
+
+
+def to_timestamp(value):
+    if isinstance(value, datetime):
+        return timegm(value.utctimetuple())
+    return value
+
+
+def is_timestamp(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class TokenService:
+
+    def __init__(self, signing_key, verification_keys=(), leeway=0):
+        self.signing_key = signing_key
+        self.keys = {key.kid: key for key in (signing_key, *verification_keys)}
+        self.leeway = leeway
+        self._signing_header = encode_segment({"alg": signing_key.algorithm, "typ": "JWT", "kid": signing_key.kid})
+        # Header segment -> key; tokens only ever carry a handful of distinct headers
+        self._header_keys = {}
+
+    def encode(self, claims: dict) -> str:
+        payload = {name: to_timestamp(value) for name, value in claims.items()}
+        signing_input = self._signing_header + b"." + encode_segment(payload)
+        return (signing_input + b"." + b64encode(self.signing_key.sign(signing_input))).decode("ascii")
+
+    def key_for_header(self, segment):
+        key = self._header_keys.get(segment)
+        if key is not None:
+            return key
+
+        header = json.loads(b64decode(segment))
+        if not isinstance(header, dict):
+            raise TokenError("Malformed token")
+        # Tokens issued before key ids existed are HS256 without a kid
+        kid = header.get("kid", self.signing_key.kid)
+        if not isinstance(kid, str):
+            raise TokenError("Malformed token")
+        key = self.keys.get(kid)
+        if key is None or header.get("alg") != key.algorithm:
+            raise TokenError("Unknown signing key")
+        if len(self._header_keys) < 64:
+            self._header_keys[segment] = key
+        return key
+
+    def decode(self, token) -> dict:
+        try:
+            if isinstance(token, str):
+                token = token.encode("ascii")
+            header, payload, signature = token.split(b".")
+            key = self.key_for_header(header)
+            if not key.verify(header + b"." + payload, b64decode(signature)):
+                raise TokenError("Signature verification failed")
+            claims = json.loads(b64decode(payload))
+        except ValueError:
+            raise TokenError("Malformed token")
+        if not isinstance(claims, dict) or not all(is_timestamp(claims[name]) for name in ("exp", "nbf") if name in claims):
+            raise TokenError("Malformed token")
+
+        now = time.time()
+        if "exp" in claims and now > claims["exp"] + self.leeway:
+            raise TokenError("Token expired")
+        if "nbf" in claims and now < claims["nbf"] - self.leeway:
+            raise TokenError("Token not yet valid")
+        return claims
+
+    def jwks(self):
+        return {"keys": [jwk for jwk in (key.public_jwk() for key in self.keys.values()) if jwk]}
+
+
+def parse_key_list(value):
+    # "kid1:value1,kid2:value2" -> [(kid1, value1), (kid2, value2)]
+    pairs = []
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        kid, _, secret = item.partition(":")
+        pairs.append((kid, secret))
+    return pairs
+
+
+def build_token_service(settings):
+    if settings.jwt_algorithm == "HS256":
+        keys = [HMACKey(kid, secret) for kid, secret in parse_key_list(settings.jwt_secret_keys)]
+    else:
+        keys = []
+        for kid, path in parse_key_list(settings.jwt_private_keys):
+            with open(path, "rb") as key_file:
+                keys.append(load_private_key(kid, settings.jwt_algorithm, key_file.read()))
+    if not keys:
+        raise ValueError("No {} signing keys configured".format(settings.jwt_algorithm))
+
+    by_kid = {key.kid: key for key in keys}
+    signing_key = by_kid.get(settings.jwt_signing_kid) or keys[0]
+    return TokenService(signing_key, [key for key in keys if key is not signing_key], leeway=settings.jwt_leeway)
+
+
+token_service = build_token_service(auth_settings)
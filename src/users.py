@@ -1,21 +1,37 @@
 # users.py
 
-from fastapi import Depends, HTTPException, APIRouter, Header, Body, Path, File, UploadFile
+from fastapi import Depends, HTTPException, APIRouter, Header, Body, Path, Query, File, UploadFile, Request
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sql_app import database
 from sql_app.models import Profile, User, Country, Project, Experience, ProfileSkills, Skills, ProjectSkills, Institution, Education
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+from src.passwords import hash_password, verify_password
+from starlette.concurrency import run_in_threadpool
+from src.tokens import TokenError, token_service
+from src.identity import google_identity
 from datetime import datetime, timedelta
 # import PyPDF2
 import random
-import requests
-from typing import List, Dict
-from sql_app.schemas import ProfileCreate, ProjectCreate, ProfileUpdate, ExperienceCreate, EducationCreate
+from typing import List, Dict, Optional
+from sql_app.schemas import (
+    ProfileCreate, ProjectCreate, ProfileUpdate, ExperienceCreate, EducationCreate,
+    BatchItem, Envelope, Page, StatusResponse, TokenResponse, LoginResponse, ProfileResponse, ProfileDetail, ProjectResponse, ProjectDetail,
+    ExperienceResponse, EducationResponse, EducationDetail, InstitutionResponse, SkillResponse, CountryResponse,
+)
+from sql_app.crud import (
+    get_profile_document, get_user_profiles_document, resolve_skill_ids,
+    batch_envelope, create_projects, create_experiences, create_educations, search_institutions, MAX_BATCH_SIZE,
+    get_projects_page, get_experiences_page, get_user_profiles_page, get_educations_page,
+    PROJECTS_MESSAGE, EXPERIENCES_MESSAGE, PROFILES_MESSAGE, EDUCATIONS_MESSAGE,
+)
+from sql_app.keyset import PageRequest
+from src.pagination import Pagination
+from sql_app.cache import Principal, country_cache, principal_cache, skill_cache
+from sql_app.config import auth_settings, cache_settings
 # import fitz
 import re
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 
 
@@ -27,14 +43,9 @@ from fastapi.responses import JSONResponse
 router = APIRouter()
 
 
-# Secret key to sign JWT tokens (replace this with a secure random key in production)
-SECRET_KEY = "your_secret_key"
-ALGORITHM = "HS256"
+# Signing keys for JWT tokens are configured in sql_app/config.py (AuthSettings)
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
-# Password hashing
-password_hashing = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="Authorization")
 
 
@@ -46,33 +57,55 @@ def get_db():
     finally:
         db.close()
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
-        status_code=401,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+credentials_exception = HTTPException(
+    status_code=401,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+def decode_token(token: str):
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        print(email)
-        if email is None:
-            raise credentials_exception
-    except JWTError:
+        payload = token_service.decode(token)
+    except TokenError:
+        raise credentials_exception
+    if payload.get("sub") is None:
         raise credentials_exception
+    return payload
 
-    user = db.query(User).filter(User.email == email).first()
+# Principal for a decoded token without touching the DB: from embedded claims,
+# or from the principal cache. None means the user has to be looked up.
+def cached_principal(payload: dict):
+    if "uid" in payload:
+        return Principal(id=payload["uid"], email=payload["sub"], is_verified=payload.get("verified"))
+    return principal_cache.get(payload["sub"])
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    payload = decode_token(token)
+    principal = cached_principal(payload)
+    if principal is not None:
+        return principal
+
+    user = db.query(User).filter(User.email == payload["sub"]).first()
     if user is None:
         raise credentials_exception
 
-    return user
+    principal = Principal.from_user(user)
+    principal_cache.set(user.email, principal)
+    return principal
+
+# Claims identifying the user in an access token
+def user_claims(user: User):
+    claims = {"sub": user.email}
+    if auth_settings.embed_user_claims:
+        claims.update(uid=user.id, verified=bool(user.is_verified))
+    return claims
 
 # Function to create JWT token
 def create_access_token(data: dict, expires_delta: timedelta):
     to_encode = data.copy()
     expire = datetime.utcnow() + expires_delta
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = token_service.encode(to_encode)
     return encoded_jwt
 
 # Function to generate a random verification code
@@ -85,39 +118,54 @@ def home():
     return {"message": "API working"}
 
 
-@router.post("/register", tags=["auth"])
-def register_user(email: str = Body(...), password: str = Body(...), name: str = Body(...), db: Session = Depends(get_db)):
+# Public keys for verifying access tokens (empty with HS256 shared secrets)
+@router.get("/.well-known/jwks.json", tags=["auth"])
+def get_jwks():
+    return token_service.jwks()
+
+
+@router.post("/register", tags=["auth"], response_model=StatusResponse)
+async def register_user(email: str = Body(...), password: str = Body(...), name: str = Body(...), db: Session = Depends(get_db)):
     # Check if the username already exists
-    if db.query(User).filter(User.email == email).first():
+    if await run_in_threadpool(lambda: db.query(User).filter(User.email == email).first()):
         raise HTTPException(status_code=400, detail="User already registered")
 
-    # Hash the password (you should use a proper password hashing library)
-    hashed_password = password_hashing.hash(password)
+    # Hash the password in the bounded bcrypt pool
+    hashed_password = await hash_password(password)
 
     # Generate a random verification code (for demonstration purposes)
     # verification_code = generate_verification_code()
     verification_code = 111111
 
     # Create a new user in the database
-    new_user = User(email=email, password=hashed_password, name=name, verification_code=verification_code)
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    def create_user():
+        new_user = User(email=email, password=hashed_password, name=name, verification_code=verification_code)
+        db.add(new_user)
+        db.commit()
 
+    await run_in_threadpool(create_user)
     return {"message": "User registered successfully, Please check your mail for Verification", "status": True}
 
-@router.post("/login", tags=["auth"])
-def login_user(email: str = Body(...), password: str = Body(...), db: Session = Depends(get_db)):
+@router.post("/login", tags=["auth"], response_model=LoginResponse)
+async def login_user(email: str = Body(...), password: str = Body(...), db: Session = Depends(get_db)):
     # Check if the user exists
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not password_hashing.verify(password, user.password):
+    user = await run_in_threadpool(lambda: db.query(User).filter(User.email == email).first())
+    valid, new_hash = await verify_password(password, user.password) if user else (False, None)
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    profiles = db.query(Profile).filter(Profile.user_id == user.id).all()
+    def load_profiles():
+        # Transparently upgrade hashes made with an outdated work factor
+        if new_hash:
+            user.password = new_hash
+            db.commit()
+        return db.query(Profile).filter(Profile.user_id == user.id).all()
+
+    profiles = await run_in_threadpool(load_profiles)
 
     # Generate JWT token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(data={"sub": user.email}, expires_delta=access_token_expires)
+    access_token = create_access_token(data=user_claims(user), expires_delta=access_token_expires)
     return {
         "access_token": access_token, 
         "token_type": "bearer",
@@ -133,7 +181,7 @@ def login_user(email: str = Body(...), password: str = Body(...), db: Session =
     }
 
 
-@router.post("/verify-email", tags=["auth"])
+@router.post("/verify-email", tags=["auth"], response_model=TokenResponse)
 def verify_email(email: str = Body(...), verification_code: str = Body(...), db: Session = Depends(get_db)):
     # Retrieve the user by email
     user = db.query(User).filter(User.email == email).first()
@@ -151,44 +199,45 @@ def verify_email(email: str = Body(...), verification_code: str = Body(...), db:
 
     # Generate JWT token for the verified user
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(data={"sub": user.email}, expires_delta=access_token_expires)
+    access_token = create_access_token(data=user_claims(user), expires_delta=access_token_expires)
 
     return {"access_token": access_token, "token_type": "bearer", "user": user, "status": True, "message": "Email verified successfully"}
 
 
-# Endpoint to validate Google Sign-In token
-@router.post("/validate-google-token", tags=["auth"])
-def validate_google_token(access_token: str = Body(...), email: str = Body(...), db: Session = Depends(get_db)):
-    headers = {"Authorization": f"Bearer {access_token}"}
-    google_response = requests.get(
-        "https://www.googleapis.com/oauth2/v2/userinfo",
-        headers=headers,
-    )
-    google_data = google_response.json()
+# Endpoint to validate Google Sign-In: an OAuth access token (checked with
+# Google's userinfo endpoint) or an ID token (verified locally, see src/identity.py)
+@router.post("/validate-google-token", tags=["auth"], response_model=TokenResponse)
+async def validate_google_token(
+    access_token: Optional[str] = Body(None),
+    id_token: Optional[str] = Body(None),
+    email: Optional[str] = Body(None),
+    db: Session = Depends(get_db),
+):
+    if not access_token and not id_token:
+        raise HTTPException(status_code=400, detail="access_token or id_token is required")
+    identity = await google_identity(access_token=access_token, id_token=id_token)
+
+    def login_user():
+        # Check if the user already exists in the database
+        user = db.query(User).filter(User.email == identity.email).first()
+        if not user:
+            # Create a new user in the database
+            user = User(email=identity.email, name=identity.name, is_verified=True, social_type='GOOGLE')
+            db.add(user)
+            db.commit()
+            db.refresh(user)
+        return user
 
-    print(google_data, access_token)
-    if "error" in google_data:
-        raise HTTPException(status_code=401, detail="Invalid Google Sign-In")
-
-    email = google_data.get("email")
-     # Check if the user already exists in the database
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        # Create a new user in the database
-        new_user = User(email=email, name=google_data.get("name", ""), is_verified=True, social_type='GOOGLE')  
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
-        user = new_user
+    user = await run_in_threadpool(login_user)
 
     # Generate JWT token for the verified user
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(data={"sub": user.email}, expires_delta=access_token_expires)
+    access_token = create_access_token(data=user_claims(user), expires_delta=access_token_expires)
 
     return {"message": "User login successfully", "access_token": access_token, "user": user, "status": True}
 
 
-@router.post("/create_profile/", tags=["profile"])
+@router.post("/create_profile/", tags=["profile"], response_model=Envelope[ProfileResponse])
 def create_profile(profile_data: ProfileCreate, db: Session = Depends(get_db)):
     user_id = profile_data.user_id  # Adjust this based on your authentication mechanism
     skills_data = profile_data.skills  # Remove skills from the profile data
@@ -200,28 +249,22 @@ def create_profile(profile_data: ProfileCreate, db: Session = Depends(get_db)):
     # Create a new profile
     new_profile = Profile(**profile_data.dict(exclude={'skills'}))
     db.add(new_profile)
-    db.commit()
-
-    for skill in skills_data:
-        skill_db = db.query(Skills).filter(Skills.name == skill).first()
-        if not skill_db:
-            skill_db = Skills(**skill.dict())
-            db.add(skill_db)
-            db.commit()
+    db.flush()
 
-        profile_skill = ProfileSkills(profile_id=new_profile.id, skill_id=skill_db.id)
-        db.add(profile_skill)
+    # Resolve all skills at once and link them in the same transaction
+    skill_ids = resolve_skill_ids(db, skills_data or [])
+    if skill_ids:
+        db.execute(insert(ProfileSkills), [{"profile_id": new_profile.id, "skill_id": skill_id} for skill_id in skill_ids.values()])
 
     db.commit()
     db.refresh(new_profile)
-    new_profile.skills = profile_skill
     return { "data": new_profile, "status": True, "message": "Profile created successfully"}
 
-@router.put("/update_profile", tags=["profile"])
+@router.put("/update_profile", tags=["profile"], response_model=Envelope[ProfileResponse])
 def update_profile(
     profile_update: ProfileUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     
     # Get the user's profile
@@ -238,27 +281,32 @@ def update_profile(
     db.refresh(user_profile)
     return { "data": user_profile, "status": True, "message": "User profile updated successfully"} 
 
-@router.get("/user_profiles/{user_id}", tags=["profile"])
-def get_user_profiles(user_id: int, db: Session = Depends(get_db)):
-    # Check if the user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+@router.get("/user_profiles/{user_id}", tags=["profile"], response_model=Page[ProfileResponse])
+def get_user_profiles(user_id: int, page: PageRequest = Depends(Pagination()), db: Session = Depends(get_db)):
+    # The default first page is served from the profile document cache
+    if page.is_default:
+        body = get_user_profiles_document(db, user_id)
+        if body is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        return Response(content=body, media_type="application/json")
+
+    result = get_user_profiles_page(db, user_id, page)
+    if result is None:
         raise HTTPException(status_code=404, detail="User not found")
+    profiles, next_cursor, total = result
+    return {"data": profiles, "status": True, "message": PROFILES_MESSAGE, "next_cursor": next_cursor, "total": total}
 
-    profiles = db.query(Profile).filter(Profile.user_id == user_id).all()
-    return { "data": profiles, "status": True, "message": "Profiles fetched successfully"} 
-
-@router.get("/profile/{profile_id}", tags=["profile"])
+@router.get("/profile/{profile_id}", tags=["profile"], response_model=Envelope[ProfileDetail])
 def get_profile(profile_id: int, db: Session = Depends(get_db)):
-    # Get the profile by ID
-    profile = db.query(Profile).options(joinedload(Profile.projects).joinedload(Project.skills), joinedload(Profile.job_experiences)).filter(Profile.id == profile_id).first()
-    if not profile:
+    # Served from the profile document cache, built with all collections in a fixed number of queries
+    body = get_profile_document(db, "profile", profile_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="Profile not found")
 
-    return { "data": profile, "status": True, "message": "Profile fetched successfully"} 
+    return Response(content=body, media_type="application/json")
 
 
-@router.post("/add_project", tags=["project"])
+@router.post("/add_project", tags=["project"], response_model=Envelope[ProjectResponse])
 def add_project(
     project_create: ProjectCreate,
     db: Session = Depends(get_db)
@@ -276,58 +324,62 @@ def add_project(
     new_project = Project(**project_create.dict(exclude={'skills'}))
     # Add the new project to the database
     db.add(new_project)
-    db.commit()
-    # db.refresh(new_project)
-
-    for skill in skills_data:
-        skill_db = db.query(Skills).filter(Skills.name == skill).first()
-        if not skill_db:
-            skill_db = Skills(name=skill)
-            db.add(skill_db)
-            db.commit()
+    db.flush()
 
-        project_skill = ProjectSkills(project_id=new_project.id, skill_id=skill_db.id)
-        db.add(project_skill)
+    # Resolve all skills at once and link them in the same transaction
+    skill_ids = resolve_skill_ids(db, skills_data)
+    if skill_ids:
+        db.execute(insert(ProjectSkills), [{"project_id": new_project.id, "skill_id": skill_id} for skill_id in skill_ids.values()])
 
     db.commit()
     db.refresh(new_project)
     return { "data": new_project, "status": True, "message": "Project created successfully"} 
 
-@router.get("/projects/{project_id}", tags=["project"])
+@router.get("/projects/{project_id}", tags=["project"], response_model=ProjectDetail)
 def get_project_details(
     project_id: int = Path(..., title="The ID of the project to get details", gt=0),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     # Check if the project exists
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.query(Project).options(selectinload(Project.skills)).filter(Project.id == project_id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Convert the project data to a Pydantic model
-    project_details = ProjectDetail(**project.__dict__)
+    return project
 
-    return project_details
+@router.post("/add_projects", tags=["project"], response_model=Envelope[List[BatchItem[ProjectResponse]]])
+def add_projects(projects: List[ProjectCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE), db: Session = Depends(get_db)):
+    # Batch /add_project for imports: one transaction, a result per item
+    results = create_projects(db, projects)
+    db.commit()
+    return batch_envelope(results, "projects")
 
-@router.get("/projects", tags=["project"])
+@router.get("/projects", tags=["project"], response_model=Page[ProjectResponse])
 def get_projects(
     profile_id: int,
-    current_user: User = Depends(get_current_user),
+    page: PageRequest = Depends(Pagination()),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    # Check if the current user has access to the specified profile
-    profile = db.query(Profile).filter(Profile.id == profile_id).first()
-    if not profile:
+    # The default first page is served from the profile document cache
+    if page.is_default:
+        body = get_profile_document(db, "projects", profile_id)
+        if body is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return Response(content=body, media_type="application/json")
+
+    # Retrieve one page of projects for the specified profile
+    result = get_projects_page(db, profile_id, page)
+    if result is None:
         raise HTTPException(status_code=404, detail="Profile not found")
-
-    # Retrieve the list of projects for the specified profile
-    projects = db.query(Project).filter(Project.profile_id == profile_id).all()
-    return {"data": projects, "status": True, "message": "Projects retrieved successfully for profile_id: {}".format(profile_id)}
+    projects, next_cursor, total = result
+    return {"data": projects, "status": True, "message": PROJECTS_MESSAGE.format(profile_id), "next_cursor": next_cursor, "total": total}
 
 
     # current_user: User = Depends(get_current_user),
 
-@router.post("/add_experience")
+@router.post("/add_experience", response_model=ExperienceResponse)
 def add_experience(
     experience_create: ExperienceCreate,
     db: Session = Depends(get_db)
@@ -346,63 +398,55 @@ def add_experience(
     db.refresh(new_experience)
     return new_experience
 
-@router.get("/experiences/{profile_id}")
-def get_experiences(profile_id: int, db: Session = Depends(get_db)):
-    # Check if the profile exists
-    profile = db.query(Profile).filter(Profile.id == profile_id).first()
-    if not profile:
+@router.post("/add_experiences", response_model=Envelope[List[BatchItem[ExperienceResponse]]])
+def add_experiences(experiences: List[ExperienceCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE), db: Session = Depends(get_db)):
+    # Batch /add_experience for imports: one transaction, a result per item
+    results = create_experiences(db, experiences)
+    db.commit()
+    return batch_envelope(results, "experiences")
+
+@router.get("/experiences/{profile_id}", response_model=Page[ExperienceResponse])
+def get_experiences(profile_id: int, page: PageRequest = Depends(Pagination()), db: Session = Depends(get_db)):
+    # The default first page is served from the profile document cache
+    if page.is_default:
+        body = get_profile_document(db, "experiences", profile_id)
+        if body is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return Response(content=body, media_type="application/json")
+
+    # Get one page of experiences for the given profile ID
+    result = get_experiences_page(db, profile_id, page)
+    if result is None:
         raise HTTPException(status_code=404, detail="Profile not found")
-
-    # Get the experiences for the given profile ID
-    experiences = db.query(Experience).filter(Experience.profile_id == profile_id).all()
-    return { "data": experiences, "status": True, "message": "experiance data fetched successfully"} 
+    experiences, next_cursor, total = result
+    return {"data": experiences, "status": True, "message": EXPERIENCES_MESSAGE, "next_cursor": next_cursor, "total": total}
 
 
-@router.post("/add_education")
+@router.post("/add_education", response_model=Envelope[EducationResponse])
 def add_education(education_create: EducationCreate, db: Session = Depends(get_db)):
-    # Check if the user exists
-    user = db.query(User).filter(User.id == education_create.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    # The user check, the institution lookup (cached, or INSERT ... ON CONFLICT DO
+    # NOTHING for a new one) and the insert share one transaction
+    (result,) = create_educations(db, [education_create])
+    if not result["status"]:
+        raise HTTPException(status_code=404, detail=result["error"])
 
-    # Check if the institution exists or create a new one
-    institution = db.query(Institution).filter(Institution.name == education_create.institution_name).first()
-    if not institution:
-        institution = Institution(name=education_create.institution_name)
-        db.add(institution)
-        db.commit()
-        db.refresh(institution)
-
-    # Create a new education record
-    new_education = Education(
-        user_id=education_create.user_id,
-        institution_id=institution.id,
-        degree=education_create.degree,
-        start_year=education_create.start_year,
-        end_year=education_create.end_year,
-    )
-
-    # Add the new education record to the database
-    db.add(new_education)
     db.commit()
-    db.refresh(new_education)
-    return {"data": new_education, "status": True, "message": "Education details added  successfully"}
+    return {"data": result["data"], "status": True, "message": "Education details added  successfully"}
 
-@router.get("/get_educations/{user_id}")
-def get_educations(user_id: int, db: Session = Depends(get_db)):
-    # Check if the user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+@router.post("/add_educations", response_model=Envelope[List[BatchItem[EducationResponse]]])
+def add_educations(educations: List[EducationCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE), db: Session = Depends(get_db)):
+    # Batch /add_education for imports: one transaction, a result per item
+    results = create_educations(db, educations)
+    db.commit()
+    return batch_envelope(results, "educations")
 
-    # Retrieve the list of education details with joined institution data
-    educations = (
-        db.query(Education)
-        .join(Institution)
-        .options(joinedload(Education.institution))
-        .filter(Education.user_id == user_id)
-        .all()
-    )
+@router.get("/get_educations/{user_id}", response_model=Page[EducationDetail])
+def get_educations(user_id: int, page: PageRequest = Depends(Pagination()), db: Session = Depends(get_db)):
+    # Retrieve one page of education details with joined institution data
+    result = get_educations_page(db, user_id, page)
+    if result is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    educations, next_cursor, total = result
 
     # Map the results to the response model
     # education_response_list = [
@@ -416,12 +460,50 @@ def get_educations(user_id: int, db: Session = Depends(get_db)):
     #     )
     #     for edu in educations
     # ]
-    return {"data": educations, "status": True, "message": "Education data fetched  successfully"}
-
-@router.get("/countries/")
-def get_countries(db: Session = Depends(get_db)):
-    countries = db.query(Country).all()
-    return { "data": countries, "status": True, "message": "Countries fetched successfully"} 
-
-
-
+    return {"data": educations, "status": True, "message": EDUCATIONS_MESSAGE, "next_cursor": next_cursor, "total": total}
+
+@router.get("/institutions/autocomplete", tags=["institutions"], response_model=Envelope[List[InstitutionResponse]])
+def autocomplete_institutions(q: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=50), db: Session = Depends(get_db)):
+    # Substring match ranked by trigram similarity on PostgreSQL, see search_institutions()
+    institutions = search_institutions(db, q, limit)
+    return {"data": institutions, "status": True, "message": "Institutions fetched successfully"}
+
+@router.get("/skills/autocomplete", tags=["skills"], response_model=Envelope[List[SkillResponse]])
+def autocomplete_skills(q: str, limit: int = Query(10, ge=1, le=50), db: Session = Depends(get_db)):
+    # Served from the in-process skill cache; the DB is only read when it is cold
+    skill_cache.ensure_warm(db)
+    return {"data": skill_cache.autocomplete(q, limit), "status": True, "message": "Skills fetched successfully"}
+
+def etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or "W/" + etag in candidates
+
+@router.get("/countries/", response_model=Page[CountryResponse])
+def get_countries(
+    request: Request,
+    code: Optional[str] = Query(None, description="Country code prefix"),
+    name: Optional[str] = Query(None, description="Country name prefix"),
+    # The default page holds the whole reference list
+    page: PageRequest = Depends(Pagination(default_limit=300, max_limit=300)),
+    db: Session = Depends(get_db)
+):
+    # Served from a pre-encoded in-memory copy; the DB is only read on first use
+    body, gzip_body, etag = country_cache.render(db, code, name, page)
+    # The gzip representation carries its own strong validator
+    if gzip_body is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        body, etag = gzip_body, etag[:-1] + '-gzip"'
+        headers = {"Content-Encoding": "gzip"}
+    else:
+        headers = {}
+    headers.update({
+        "ETag": etag,
+        "Cache-Control": "public, max-age={}".format(cache_settings.countries_max_age),
+        "Vary": "Accept-Encoding",
+    })
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,252 @@
+# users_async.py
+#
+# Async versions of the profile/project/experience/education routes in
+# src/users.py. main.py mounts this router in front of the sync one when
+# DATABASE_ASYNC is set, so both modes serve the same paths and payloads.
+
+from typing import List
+
+from fastapi import Body, Depends, HTTPException, APIRouter, Query
+from fastapi.responses import Response
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sql_app import database
+from sql_app.models import Profile, User, Project, Experience, ProfileSkills, Skills, ProjectSkills, Institution, Education
+from sql_app.schemas import (
+    ProfileCreate, ProjectCreate, ProfileUpdate, ExperienceCreate, EducationCreate,
+    BatchItem, Envelope, Page, ProfileResponse, ProfileDetail, ProjectResponse, ExperienceResponse, EducationResponse, EducationDetail,
+    InstitutionResponse,
+)
+from sql_app.crud import (
+    build_profile_documents, build_user_profiles_document, resolve_skill_ids,
+    batch_envelope, create_projects, create_experiences, create_educations, search_institutions, MAX_BATCH_SIZE,
+    get_projects_page, get_experiences_page, get_user_profiles_page, get_educations_page,
+    PROJECTS_MESSAGE, EXPERIENCES_MESSAGE, PROFILES_MESSAGE, EDUCATIONS_MESSAGE,
+)
+from sql_app.keyset import PageRequest
+from src.pagination import Pagination
+from sql_app.cache import Principal, document_key, principal_cache, profile_cache
+from src.users import oauth2_scheme, credentials_exception, decode_token, cached_principal
+
+
+router = APIRouter()
+
+
+# Dependency to get the async database session
+async def get_db():
+    async with database.AsyncSessionLocal() as db:
+        yield db
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
+    payload = decode_token(token)
+    principal = cached_principal(payload)
+    if principal is not None:
+        return principal
+
+    user = await db.scalar(select(User).where(User.email == payload["sub"]))
+    if user is None:
+        raise credentials_exception
+
+    principal = Principal.from_user(user)
+    principal_cache.set(user.email, principal)
+    return principal
+
+# Cache hits never leave the event loop; misses build the documents with the
+# shared sync helper on the session's connection.
+async def get_profile_document(db: AsyncSession, kind, profile_id):
+    key = document_key(kind, profile_id)
+    body = profile_cache.get(key)
+    if body is None:
+        documents = await db.run_sync(build_profile_documents, profile_id)
+        body = documents[key] if documents else None
+    return body
+
+
+@router.post("/create_profile/", tags=["profile"], response_model=Envelope[ProfileResponse])
+async def create_profile(profile_data: ProfileCreate, db: AsyncSession = Depends(get_db)):
+    user_id = profile_data.user_id
+    skills_data = profile_data.skills or []
+
+    # Check if the user exists
+    user = await db.scalar(select(User).where(User.id == user_id))
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    # Create a new profile
+    new_profile = Profile(**profile_data.dict(exclude={'skills'}))
+    db.add(new_profile)
+    await db.flush()
+
+    # Resolve all skills at once and link them in the same transaction
+    skill_ids = await db.run_sync(resolve_skill_ids, skills_data)
+    if skill_ids:
+        await db.execute(insert(ProfileSkills), [{"profile_id": new_profile.id, "skill_id": skill_id} for skill_id in skill_ids.values()])
+
+    await db.commit()
+    await db.refresh(new_profile)
+    return { "data": new_profile, "status": True, "message": "Profile created successfully"}
+
+@router.put("/update_profile", tags=["profile"], response_model=Envelope[ProfileResponse])
+async def update_profile(
+    profile_update: ProfileUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    # Get the user's profile
+    user_profile = await db.scalar(select(Profile).where(Profile.user_id == current_user.id))
+    if not user_profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    # Update profile fields
+    for field, value in profile_update.dict(exclude_unset=True).items():
+        setattr(user_profile, field, value)
+
+    await db.commit()
+    await db.refresh(user_profile)
+    return { "data": user_profile, "status": True, "message": "User profile updated successfully"}
+
+@router.get("/user_profiles/{user_id}", tags=["profile"], response_model=Page[ProfileResponse])
+async def get_user_profiles(user_id: int, page: PageRequest = Depends(Pagination()), db: AsyncSession = Depends(get_db)):
+    # The default first page is served from the profile document cache
+    if page.is_default:
+        body = profile_cache.get(document_key("user_profiles", user_id))
+        if body is None:
+            body = await db.run_sync(build_user_profiles_document, user_id)
+        if body is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        return Response(content=body, media_type="application/json")
+
+    result = await db.run_sync(get_user_profiles_page, user_id, page)
+    if result is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    profiles, next_cursor, total = result
+    return {"data": profiles, "status": True, "message": PROFILES_MESSAGE, "next_cursor": next_cursor, "total": total}
+
+@router.get("/profile/{profile_id}", tags=["profile"], response_model=Envelope[ProfileDetail])
+async def get_profile(profile_id: int, db: AsyncSession = Depends(get_db)):
+    # Served from the profile document cache, built with all collections in a fixed number of queries
+    body = await get_profile_document(db, "profile", profile_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.post("/add_project", tags=["project"], response_model=Envelope[ProjectResponse])
+async def add_project(project_create: ProjectCreate, db: AsyncSession = Depends(get_db)):
+    profile_id = project_create.profile_id
+    skills_data = project_create.skills
+
+    # Check if the profile exists
+    profile = await db.scalar(select(Profile).where(Profile.id == profile_id))
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    # Create a new project
+    new_project = Project(**project_create.dict(exclude={'skills'}))
+    db.add(new_project)
+    await db.flush()
+
+    # Resolve all skills at once and link them in the same transaction
+    skill_ids = await db.run_sync(resolve_skill_ids, skills_data)
+    if skill_ids:
+        await db.execute(insert(ProjectSkills), [{"project_id": new_project.id, "skill_id": skill_id} for skill_id in skill_ids.values()])
+
+    await db.commit()
+    await db.refresh(new_project)
+    return { "data": new_project, "status": True, "message": "Project created successfully"}
+
+@router.post("/add_projects", tags=["project"], response_model=Envelope[List[BatchItem[ProjectResponse]]])
+async def add_projects(projects: List[ProjectCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE), db: AsyncSession = Depends(get_db)):
+    # Batch /add_project for imports: one transaction, a result per item
+    results = await db.run_sync(create_projects, projects)
+    await db.commit()
+    return batch_envelope(results, "projects")
+
+@router.get("/projects", tags=["project"], response_model=Page[ProjectResponse])
+async def get_projects(
+    profile_id: int,
+    page: PageRequest = Depends(Pagination()),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    # The default first page is served from the profile document cache
+    if page.is_default:
+        body = await get_profile_document(db, "projects", profile_id)
+        if body is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return Response(content=body, media_type="application/json")
+
+    # Retrieve one page of projects for the specified profile
+    result = await db.run_sync(get_projects_page, profile_id, page)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    projects, next_cursor, total = result
+    return {"data": projects, "status": True, "message": PROJECTS_MESSAGE.format(profile_id), "next_cursor": next_cursor, "total": total}
+
+
+@router.post("/add_experience", response_model=ExperienceResponse)
+async def add_experience(experience_create: ExperienceCreate, db: AsyncSession = Depends(get_db)):
+    # Check if the user has a profile
+    user_profile = await db.scalar(select(Profile).where(Profile.id == experience_create.profile_id))
+    if not user_profile:
+        raise HTTPException(status_code=404, detail="User profile not found")
+
+    new_experience = Experience(**experience_create.dict())
+    db.add(new_experience)
+    await db.commit()
+    await db.refresh(new_experience)
+    return new_experience
+
+@router.post("/add_experiences", response_model=Envelope[List[BatchItem[ExperienceResponse]]])
+async def add_experiences(experiences: List[ExperienceCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE), db: AsyncSession = Depends(get_db)):
+    # Batch /add_experience for imports: one transaction, a result per item
+    results = await db.run_sync(create_experiences, experiences)
+    await db.commit()
+    return batch_envelope(results, "experiences")
+
+@router.get("/experiences/{profile_id}", response_model=Page[ExperienceResponse])
+async def get_experiences(profile_id: int, page: PageRequest = Depends(Pagination()), db: AsyncSession = Depends(get_db)):
+    # The default first page is served from the profile document cache
+    if page.is_default:
+        body = await get_profile_document(db, "experiences", profile_id)
+        if body is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return Response(content=body, media_type="application/json")
+
+    result = await db.run_sync(get_experiences_page, profile_id, page)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    experiences, next_cursor, total = result
+    return {"data": experiences, "status": True, "message": EXPERIENCES_MESSAGE, "next_cursor": next_cursor, "total": total}
+
+
+@router.post("/add_education", response_model=Envelope[EducationResponse])
+async def add_education(education_create: EducationCreate, db: AsyncSession = Depends(get_db)):
+    # The user check, the institution lookup and the insert share one transaction
+    (result,) = await db.run_sync(create_educations, [education_create])
+    if not result["status"]:
+        raise HTTPException(status_code=404, detail=result["error"])
+
+    await db.commit()
+    return {"data": result["data"], "status": True, "message": "Education details added  successfully"}
+
+@router.post("/add_educations", response_model=Envelope[List[BatchItem[EducationResponse]]])
+async def add_educations(educations: List[EducationCreate] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE), db: AsyncSession = Depends(get_db)):
+    # Batch /add_education for imports: one transaction, a result per item
+    results = await db.run_sync(create_educations, educations)
+    await db.commit()
+    return batch_envelope(results, "educations")
+
+@router.get("/get_educations/{user_id}", response_model=Page[EducationDetail])
+async def get_educations(user_id: int, page: PageRequest = Depends(Pagination()), db: AsyncSession = Depends(get_db)):
+    # Retrieve one page of education details with joined institution data
+    result = await db.run_sync(get_educations_page, user_id, page)
+    if result is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    educations, next_cursor, total = result
+    return {"data": educations, "status": True, "message": EDUCATIONS_MESSAGE, "next_cursor": next_cursor, "total": total}
+
+@router.get("/institutions/autocomplete", tags=["institutions"], response_model=Envelope[List[InstitutionResponse]])
+async def autocomplete_institutions(q: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=50), db: AsyncSession = Depends(get_db)):
+    institutions = await db.run_sync(search_institutions, q, limit)
+    return {"data": institutions, "status": True, "message": "Institutions fetched successfully"}
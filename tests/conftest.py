@@ -0,0 +1,61 @@
+# conftest.py
+#
+# Settings are read when sql_app is imported, so the test database is picked
+# here first: a throwaway SQLite file for the whole run, with the schema
+# created from sql_app.models. Every test starts from empty tables and caches,
+# and a request repeating a statement SQL_REPEAT_THRESHOLD times fails (N+1).
+
+import os
+import shutil
+import tempfile
+
+TEST_DIR = tempfile.mkdtemp(prefix="fastapi-tests-")
+os.environ["DATABASE_URL"] = "sqlite:///{}".format(os.path.join(TEST_DIR, "test.db"))
+os.environ["DATABASE_ASYNC"] = "0"
+os.environ["SQL_REPEAT_STRICT"] = "1"
+
+import pytest
+from sql_app import database, models  # noqa: F401
+from sql_app.cache import country_cache, institution_cache, profile_cache, skill_cache
+from sql_app.models import Profile, User
+from sql_app.search import search_index
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema():
+    database.Base.metadata.create_all(database.engine)
+    yield
+    database.engine.dispose()
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def empty_tables(schema):
+    yield
+    with database.engine.begin() as connection:
+        for table in reversed(database.Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    for cache in (skill_cache, institution_cache):
+        cache.invalidate()
+    country_cache.invalidate()
+    profile_cache.clear()
+    # SQLite hands out the ids of deleted rows again
+    search_index.clear()
+
+
+@pytest.fixture
+def db():
+    with database.SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def make_profile(db):
+    # A user with a committed profile; keyword arguments are Profile columns
+    def make(email="user@example.com", **columns):
+        columns = {"profile_type": "developer", "experience": 3, **columns}
+        profile = Profile(user=User(email=email, name=email.split("@")[0], is_verified=True), **columns)
+        db.add(profile)
+        db.commit()
+        return profile
+    return make
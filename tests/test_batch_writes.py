@@ -0,0 +1,115 @@
+import re
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, select
+
+import main
+from sql_app import database
+from sql_app.cache import skill_cache
+from sql_app.models import Education, Experience, Institution, Project, ProjectSkills, Skills
+
+MISSING_ID = 999999
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+@contextmanager
+def statements_on(table):
+    # Lookups of and inserts into `table` while the block runs (not the
+    # subqueries of other statements, e.g. the search document rebuild)
+    pattern = re.compile(r"^(SELECT {0}\.|INSERT INTO {0} )".format(table))
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if pattern.search(statement):
+            seen.append(statement.split()[0])
+
+    event.listen(database.engine, "before_cursor_execute", record)
+    try:
+        yield seen
+    finally:
+        event.remove(database.engine, "before_cursor_execute", record)
+
+
+def project(profile_id, title, skills):
+    return {
+        "profile_id": profile_id, "title": title, "description": "d", "start_date": "2023-01-01",
+        "end_date": "2023-06-01", "image": "image.png", "skills": skills,
+    }
+
+
+def experience(profile_id, title):
+    return {
+        "profile_id": profile_id, "title": title, "company": "Acme", "location": None,
+        "start_date": "2022-01-01", "end_date": None, "description": None,
+    }
+
+
+def education(user_id, institution_name):
+    return {"user_id": user_id, "institution_name": institution_name, "degree": "BSc", "start_year": 2015, "end_year": 2019}
+
+
+def outcomes(response):
+    return [(item["index"], item["status"], item["error"]) for item in response.json()["data"]]
+
+
+def test_mixed_project_batch(client, db, make_profile):
+    profile = make_profile()
+    items = [project(profile.id, "One", ["Python", "SQL"]), project(MISSING_ID, "Lost", ["Go"]), project(profile.id, "Two", ["python", "Rust"])]
+
+    with statements_on("skills") as skill_statements:
+        response = client.post("/add_projects", json=items)
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["status"] is False
+    assert outcomes(response) == [(0, True, None), (1, False, "Profile not found"), (2, True, None)]
+    assert [item["data"]["title"] for item in body["data"] if item["status"]] == ["One", "Two"]
+
+    # Every name of the batch in one lookup and one insert, whatever the batch size
+    assert skill_statements == ["SELECT", "INSERT"]
+    assert sorted(db.scalars(select(Skills.name))) == ["Python", "Rust", "SQL"]
+    assert db.scalars(select(Project.title).order_by(Project.id)).all() == ["One", "Two"]
+    assert db.scalar(select(func.count()).select_from(ProjectSkills)) == 4
+
+    # Known names are served from the cache without touching the table
+    with statements_on("skills") as skill_statements:
+        client.post("/add_projects", json=[project(profile.id, "Three", ["SQL", "RUST"])])
+    assert skill_statements == []
+    assert skill_cache.get("rust") is not None
+
+
+def test_mixed_experience_batch(client, db, make_profile):
+    profile = make_profile()
+    response = client.post("/add_experiences", json=[experience(MISSING_ID, "Lost"), experience(profile.id, "Engineer")])
+
+    assert outcomes(response) == [(0, False, "User profile not found"), (1, True, None)]
+    assert response.json()["data"][1]["data"]["profile_id"] == profile.id
+    assert db.scalars(select(Experience.title)).all() == ["Engineer"]
+
+
+def test_mixed_education_batch(client, db, make_profile):
+    user_id = make_profile().user_id
+    items = [education(user_id, "MIT"), education(MISSING_ID, "Stanford"), education(user_id, " mit "), education(user_id, "ETH Zurich")]
+
+    with statements_on("institutions") as institution_statements:
+        response = client.post("/add_educations", json=items)
+
+    assert outcomes(response) == [(0, True, None), (1, False, "User not found"), (2, True, None), (3, True, None)]
+    assert institution_statements == ["SELECT", "INSERT"]
+    assert sorted(db.scalars(select(Institution.name))) == ["ETH Zurich", "MIT"]
+    rows = db.execute(select(Education.user_id, Institution.name).join(Institution).order_by(Education.id)).all()
+    assert rows == [(user_id, "MIT"), (user_id, "MIT"), (user_id, "ETH Zurich")]
+
+
+def test_batch_of_only_bad_items_writes_nothing(client, db):
+    response = client.post("/add_experiences", json=[experience(MISSING_ID, "Lost")])
+
+    assert response.status_code == 200
+    assert response.json()["status"] is False
+    assert db.scalar(select(func.count()).select_from(Experience)) == 0
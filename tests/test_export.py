@@ -0,0 +1,132 @@
+import csv
+import gzip
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+import main
+from sql_app.models import Profile, ProfileSkills, Project, ProjectSkills, Skills
+from src import export
+from src.tokens import token_service
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # One row per cursor round trip and tiny chunks, so the merging and chunking
+    # run across many fetches
+    monkeypatch.setattr(export, "YIELD_PER", 1)
+    monkeypatch.setattr(export, "CHUNK_SIZE", 16)
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def auth(make_profile):
+    owner = make_profile("exporter@example.com")
+    return {"Authorization": "Bearer " + token_service.encode({"sub": owner.user.email})}, owner.id
+
+
+@pytest.fixture
+def profiles(db, make_profile, auth):
+    python, sql, rust = Skills(name="Python"), Skills(name="SQL"), Skills(name="Rust")
+    first, second, third = make_profile("a@example.com"), make_profile("b@example.com"), make_profile("c@example.com")
+    projects = [
+        Project(profile_id=first.id, title="Compiler", start_date=date(2023, 1, 1), skills=[rust, python]),
+        Project(profile_id=first.id, title="Database", skills=[sql]),
+        Project(profile_id=third.id, title="Website"),
+    ]
+    db.add_all([python, sql, rust, *projects])
+    db.flush()
+    db.add_all([ProfileSkills(profile_id=first.id, skill_id=python.id), ProfileSkills(profile_id=first.id, skill_id=sql.id),
+                ProfileSkills(profile_id=second.id, skill_id=rust.id)])
+    db.commit()
+    return first.id, second.id, third.id
+
+
+def ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_empty_export(client, auth, db):
+    headers, owner_id = auth
+    db.execute(update(Profile).values(updated_at=datetime(2020, 1, 1, tzinfo=timezone.utc)))
+    db.commit()
+
+    response = client.get("/export/profiles", params={"since": "2021-01-01T00:00:00Z"}, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.text == ""
+
+    response = client.get("/export/profiles", params={"format": "csv", "since": "2021-01-01T00:00:00Z"}, headers=headers)
+    assert response.text.splitlines() == [",".join(export.CSV_HEADER)]
+
+
+def test_ndjson_merges_projects_and_skills_per_profile(client, auth, profiles):
+    headers, owner_id = auth
+    first, second, third = profiles
+
+    documents = ndjson(client.get("/export/profiles", headers=headers))
+
+    assert [document["id"] for document in documents] == [owner_id, first, second, third]
+    by_id = {document["id"]: document for document in documents}
+    assert sorted(by_id[first]["skills"]) == ["Python", "SQL"]
+    assert [(project["title"], sorted(project["skills"])) for project in by_id[first]["projects"]] == [
+        ("Compiler", ["Python", "Rust"]), ("Database", ["SQL"]),
+    ]
+    assert by_id[first]["projects"][0]["start_date"] == "2023-01-01"
+    assert (by_id[second]["skills"], by_id[second]["projects"]) == (["Rust"], [])
+    assert (by_id[third]["skills"], [project["title"] for project in by_id[third]["projects"]]) == ([], ["Website"])
+    assert (by_id[owner_id]["skills"], by_id[owner_id]["projects"]) == ([], [])
+
+
+def test_csv_has_a_line_per_project(client, auth, profiles):
+    headers, owner_id = auth
+    first, second, third = profiles
+
+    response = client.get("/export/profiles", params={"format": "csv"}, headers=headers)
+
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(int(row["id"]), row["project_title"]) for row in rows] == [
+        (owner_id, ""), (first, "Compiler"), (first, "Database"), (second, ""), (third, "Website"),
+    ]
+    assert sorted(rows[1]["project_skills"].split(";")) == ["Python", "Rust"]
+    assert rows[3]["skills"] == "Rust"
+
+
+def test_since_and_watermark(client, auth, db, profiles):
+    headers, owner_id = auth
+    first, second, third = profiles
+    db.execute(update(Profile).where(Profile.id != second).values(updated_at=datetime(2020, 1, 1, tzinfo=timezone.utc)))
+    db.commit()
+
+    response = client.get("/export/profiles", params={"since": "2021-01-01T00:00:00Z"}, headers=headers)
+    assert [document["id"] for document in ndjson(response)] == [second]
+    assert ndjson(response)[0]["skills"] == ["Rust"]
+
+    # The watermark trails the database clock by the overlap, so rows committed
+    # while the export ran are exported again next time
+    watermark = datetime.fromisoformat(response.headers["x-export-watermark"])
+    assert timedelta(0) <= datetime.now(timezone.utc) - export.WATERMARK_OVERLAP - watermark < timedelta(minutes=1)
+    assert [document["id"] for document in ndjson(client.get("/export/profiles", params={"since": watermark.isoformat()}, headers=headers))] == [second]
+
+    future = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    assert client.get("/export/profiles", params={"since": future}, headers=headers).text == ""
+
+
+def test_gzip_stream(client, auth, profiles):
+    headers, owner_id = auth
+    plain = client.get("/export/profiles", headers=headers).content
+
+    response = client.get("/export/profiles", headers={**headers, "Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == plain
+    assert gzip.decompress(b"".join(export.chunked([plain[:10], plain[10:]], compress=True))) == plain
+
+
+def test_export_needs_a_user(client):
+    assert client.get("/export/profiles").status_code == 401
@@ -0,0 +1,216 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from sql_app.config import IdentitySettings
+from src.identity import IdentityClient, IdentityProviderUnavailable, InvalidIdentityToken
+from src.tokens import b64encode, encode_segment
+
+USERINFO_URL = "https://idp.test/userinfo"
+JWKS_URL = "https://idp.test/certs"
+CLIENT_ID = "client-1.apps.googleusercontent.com"
+
+
+class StubProvider:
+    # Userinfo and JWKS endpoints answering from queues of scripted responses
+
+    def __init__(self):
+        self.calls = {USERINFO_URL: 0, JWKS_URL: 0}
+        self.responses = {USERINFO_URL: [], JWKS_URL: []}
+
+    def handler(self, request):
+        url = str(request.url)
+        self.calls[url] += 1
+        queue = self.responses[url]
+        return queue.pop(0) if len(queue) > 1 else queue[0]
+
+
+def rsa_key(kid):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    numbers = private_key.public_key().public_numbers()
+    jwk = {
+        "kty": "RSA", "kid": kid, "alg": "RS256", "use": "sig",
+        "n": b64encode(numbers.n.to_bytes((numbers.n.bit_length() + 7) // 8, "big")).decode("ascii"),
+        "e": b64encode(numbers.e.to_bytes(3, "big")).decode("ascii"),
+    }
+    return private_key, jwk
+
+
+def id_token(private_key, kid, **claims):
+    now = int(time.time())
+    payload = {"iss": "https://accounts.google.com", "aud": CLIENT_ID, "iat": now, "exp": now + 600,
+               "email": "user@example.com", "email_verified": True, **claims}
+    signing_input = encode_segment({"alg": "RS256", "kid": kid, "typ": "JWT"}) + b"." + encode_segment(payload)
+    signature = private_key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+    return (signing_input + b"." + b64encode(signature)).decode("ascii")
+
+
+def jwks_response(*jwks, max_age=3600):
+    return httpx.Response(200, json={"keys": list(jwks)}, headers={"Cache-Control": "public, max-age={}".format(max_age)})
+
+
+@pytest.fixture
+def provider():
+    return StubProvider()
+
+
+@pytest.fixture
+def client(provider):
+    settings = IdentitySettings(
+        google_client_ids=CLIENT_ID, google_userinfo_url=USERINFO_URL, google_jwks_url=JWKS_URL,
+        retries=2, retry_backoff_ms=0, breaker_failures=2, breaker_reset=30, jwks_refresh_interval=0,
+    )
+    return IdentityClient(settings, transport=httpx.MockTransport(provider.handler))
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_userinfo_is_cached(client, provider):
+    provider.responses[USERINFO_URL] = [httpx.Response(200, json={"email": "user@example.com", "verified_email": True, "name": "User"})]
+
+    async def scenario():
+        first = await client.userinfo("token-1")
+        second = await client.userinfo("token-1")
+        await client.aclose()
+        return first, second
+
+    first, second = run(scenario())
+    assert first == second and first.email == "user@example.com"
+    assert provider.calls[USERINFO_URL] == 1
+
+
+def test_rejected_access_token_is_not_cached(client, provider):
+    provider.responses[USERINFO_URL] = [httpx.Response(401, json={"error": "invalid_token"})]
+
+    async def scenario():
+        for _ in range(2):
+            with pytest.raises(InvalidIdentityToken):
+                await client.userinfo("bad-token")
+        await client.aclose()
+
+    run(scenario())
+    assert provider.calls[USERINFO_URL] == 2
+    assert client.breaker.state == "closed"
+
+
+@pytest.mark.parametrize("status", [500, 503, 429])
+def test_retries_on_server_errors_and_rate_limits(client, provider, status):
+    provider.responses[USERINFO_URL] = [
+        httpx.Response(status), httpx.Response(status),
+        httpx.Response(200, json={"email": "user@example.com", "verified_email": True}),
+    ]
+
+    async def scenario():
+        identity = await client.userinfo("token-1")
+        await client.aclose()
+        return identity
+
+    assert run(scenario()).email == "user@example.com"
+    assert provider.calls[USERINFO_URL] == 3
+    assert client.breaker.state == "closed"
+
+
+def test_circuit_opens_then_half_opens(client, provider):
+    now = [1000.0]
+    client.breaker.timer = lambda: now[0]
+    provider.responses[USERINFO_URL] = [httpx.Response(503)]
+
+    async def scenario():
+        # Two calls of three failed attempts each open the circuit
+        for _ in range(2):
+            with pytest.raises(IdentityProviderUnavailable):
+                await client.userinfo("token-1")
+        assert client.breaker.state == "open"
+        calls = provider.calls[USERINFO_URL]
+        with pytest.raises(IdentityProviderUnavailable):
+            await client.userinfo("token-1")
+        assert provider.calls[USERINFO_URL] == calls
+
+        # After the reset period one trial call goes through, and its success closes the circuit
+        now[0] += 30
+        assert client.breaker.state == "half_open"
+        provider.responses[USERINFO_URL] = [httpx.Response(200, json={"email": "user@example.com", "verified_email": True})]
+        await client.userinfo("token-1")
+        assert client.breaker.state == "closed"
+        await client.aclose()
+
+    run(scenario())
+
+
+def test_failed_trial_reopens_the_circuit(client, provider):
+    now = [1000.0]
+    client.breaker.timer = lambda: now[0]
+    provider.responses[USERINFO_URL] = [httpx.Response(500)]
+
+    async def scenario():
+        for _ in range(3):
+            with pytest.raises(IdentityProviderUnavailable):
+                await client.userinfo("token-1")
+        now[0] += 30
+        with pytest.raises(IdentityProviderUnavailable):
+            await client.userinfo("token-1")
+        assert client.breaker.state == "open"
+        await client.aclose()
+
+    run(scenario())
+
+
+def test_id_token_verified_with_cached_jwks(client, provider):
+    private_key, jwk = rsa_key("kid-1")
+    provider.responses[JWKS_URL] = [jwks_response(jwk)]
+
+    async def scenario():
+        for _ in range(3):
+            identity = await client.verify_id_token(id_token(private_key, "kid-1"))
+        await client.aclose()
+        return identity
+
+    assert run(scenario()).email == "user@example.com"
+    assert provider.calls[JWKS_URL] == 1
+
+
+def test_jwks_refetched_when_the_kid_rotates(client, provider):
+    old_key, old_jwk = rsa_key("kid-1")
+    new_key, new_jwk = rsa_key("kid-2")
+    provider.responses[JWKS_URL] = [jwks_response(old_jwk), jwks_response(old_jwk, new_jwk)]
+
+    async def scenario():
+        await client.verify_id_token(id_token(old_key, "kid-1"))
+        identity = await client.verify_id_token(id_token(new_key, "kid-2"))
+        await client.aclose()
+        return identity
+
+    assert run(scenario()).email == "user@example.com"
+    assert provider.calls[JWKS_URL] == 2
+
+
+@pytest.mark.parametrize("claims", [
+    {"aud": "someone-else"}, {"aud": [CLIENT_ID]}, {"exp": 1}, {"exp": "later"}, {"iat": "now"}, {"iat": None},
+    {"email_verified": False}, {"iss": "https://evil.test"},
+])
+def test_id_token_claims_are_checked(client, provider, claims):
+    private_key, jwk = rsa_key("kid-1")
+    provider.responses[JWKS_URL] = [jwks_response(jwk)]
+
+    async def scenario():
+        with pytest.raises(InvalidIdentityToken):
+            await client.verify_id_token(id_token(private_key, "kid-1", **claims))
+        await client.aclose()
+
+    run(scenario())
+
+
+def test_id_tokens_refused_without_cryptography(client, provider):
+    client.rsa_supported = False
+
+    with pytest.raises(InvalidIdentityToken):
+        run(client.verify_id_token("a.b.c"))
+    assert provider.calls[JWKS_URL] == 0
+    assert client.stats()["id_tokens_enabled"] is False
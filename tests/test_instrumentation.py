@@ -0,0 +1,92 @@
+import re
+from dataclasses import replace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select, text
+
+import main
+from sql_app import database
+from sql_app.config import instrumentation_settings
+from sql_app.models import Skills
+from src.instrumentation import RepeatedQueryError, SQLInstrumentationMiddleware, instrument_engine
+
+SERVER_TIMING = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries", total;dur=[\d.]+')
+
+
+class Recorder:
+    # Stands in for the Prometheus registry and keeps each request's stats
+
+    def __init__(self):
+        self.requests = []
+
+    def observe(self, method, route, duration, stats, repeated):
+        self.requests.append((method, route, stats, repeated))
+
+
+def build_app(registry, **settings):
+    app = FastAPI()
+
+    @app.get("/skills/{count}")
+    def create_skills(count: int):
+        with database.SessionLocal() as db:
+            db.execute(insert(Skills).values([{"name": "Skill {}".format(i)} for i in range(count)]))
+            db.commit()
+            return db.scalars(select(Skills.name).order_by(Skills.id)).all()
+
+    @app.get("/n_plus_one")
+    def n_plus_one():
+        # One lookup per row, the pattern the strict mode is there to catch
+        with database.SessionLocal() as db:
+            return [db.scalar(select(Skills.name).where(Skills.id == skill_id)) for skill_id in db.scalars(select(Skills.id)).all()]
+
+    instrument_engine(database.engine)
+    app.add_middleware(SQLInstrumentationMiddleware, settings=replace(instrumentation_settings, **settings), registry=registry)
+    return app
+
+
+def test_statements_rows_and_server_timing_are_recorded():
+    recorder = Recorder()
+    client = TestClient(build_app(recorder, repeat_strict=True, repeat_threshold=3))
+
+    response = client.get("/skills/4")
+
+    assert response.status_code == 200 and len(response.json()) == 4
+    assert SERVER_TIMING.fullmatch(response.headers["server-timing"]).group(1) == "2"
+    method, route, stats, repeated = recorder.requests[-1]
+    assert (method, route, repeated) == ("GET", "/skills/{count}", [])
+    assert stats.queries == 2
+    # sqlite3 reports rowcount for writes only: the four inserted rows
+    assert stats.rows == 4
+    assert stats.db_time > 0
+
+
+def test_strict_mode_fails_an_n_plus_one_request():
+    client = TestClient(build_app(Recorder(), repeat_strict=True, repeat_threshold=3))
+    client.get("/skills/5")
+
+    with pytest.raises(RepeatedQueryError, match="GET /n_plus_one"):
+        client.get("/n_plus_one")
+
+
+def test_repeats_are_only_logged_when_not_strict(caplog):
+    recorder = Recorder()
+    client = TestClient(build_app(recorder, repeat_strict=False, repeat_threshold=3))
+    client.get("/skills/5")
+
+    assert client.get("/n_plus_one").status_code == 200
+    _, _, stats, repeated = recorder.requests[-1]
+    assert stats.queries == 6
+    assert repeated[0][1] == 5
+    assert "Possible N+1 query: GET /n_plus_one ran 5 times" in caplog.text
+
+
+def test_app_routes_send_server_timing():
+    with database.engine.begin() as connection:
+        connection.execute(text("INSERT INTO countries (name, code) VALUES ('India', 'IN')"))
+
+    response = TestClient(main.app).get("/countries/")
+
+    assert response.status_code == 200
+    assert SERVER_TIMING.fullmatch(response.headers["server-timing"])
@@ -0,0 +1,68 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from sql_app.crud import EXPERIENCE_KEY
+from sql_app.keyset import InvalidCursor, PageRequest, cursor_values, decode_cursor, encode_cursor
+from sql_app.models import Experience
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def experiences(db, make_profile):
+    profile = make_profile()
+    db.add_all(Experience(profile_id=profile.id, title="Job {}".format(i)) for i in range(5))
+    db.commit()
+    return profile.id
+
+
+def test_pages_follow_the_cursor_to_the_end(client, experiences):
+    titles, cursor, totals = [], None, []
+    for _ in range(3):
+        params = {"limit": 2, "include_total": True, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/experiences/{}".format(experiences), params=params).json()
+        titles += [item["title"] for item in body["data"]]
+        totals.append(body["total"])
+        cursor = body["next_cursor"]
+
+    assert titles == ["Job {}".format(i) for i in range(5)]
+    assert cursor is None
+    assert totals == [5, 5, 5]
+
+
+def test_total_only_on_request(client, experiences):
+    body = client.get("/experiences/{}".format(experiences), params={"limit": 2}).json()
+    assert body["total"] is None
+    assert decode_cursor(body["next_cursor"]) == (body["data"][-1]["id"],)
+
+
+def test_empty_cursor_is_the_first_page(client, experiences):
+    response = client.get("/experiences/{}".format(experiences), params={"cursor": "", "limit": 2})
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()["data"]] == ["Job 0", "Job 1"]
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    "W10",  # []
+    "e30",  # {}
+    encode_cursor(["1"]),
+    encode_cursor([1.5]),
+    encode_cursor([True]),
+    encode_cursor([1, 2]),
+    encode_cursor([10 ** 25]),
+    encode_cursor([-(2 ** 63) - 1]),
+])
+def test_tampered_cursors_are_rejected(client, experiences, cursor):
+    response = client.get("/experiences/{}".format(experiences), params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_cursor_values_accept_the_bigint_range():
+    assert cursor_values(PageRequest(after=(2 ** 63 - 1,)), EXPERIENCE_KEY) == [2 ** 63 - 1]
+    with pytest.raises(InvalidCursor):
+        cursor_values(PageRequest(after=(2 ** 63,)), EXPERIENCE_KEY)
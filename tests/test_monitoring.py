@@ -0,0 +1,34 @@
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from src import admin
+
+ADMIN_ROUTES = ["/db_pool", "/cache_stats", "/password_hashing", "/identity_provider", "/startup"]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(admin, "profiling_settings", replace(admin.profiling_settings, admin_token="s3cret"))
+    return TestClient(main.app)
+
+
+@pytest.mark.parametrize("path", ADMIN_ROUTES)
+def test_admin_routes_need_the_token(client, path):
+    assert client.get(path).status_code == 403
+    assert client.get(path, headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+    response = client.get(path, headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert response.json()["status"] is True
+
+
+def test_nothing_is_accepted_without_a_configured_token(monkeypatch):
+    monkeypatch.setattr(admin, "profiling_settings", replace(admin.profiling_settings, admin_token=""))
+    assert TestClient(main.app).get("/db_pool", headers={"X-Admin-Token": ""}).status_code == 403
+
+
+def test_metrics_stay_open_for_scraping(client):
+    assert client.get("/metrics").status_code == 200
@@ -0,0 +1,46 @@
+from sqlalchemy import func, select
+from sql_app.cache import institution_cache, skill_cache
+from sql_app.crud import resolve_institution_ids, resolve_skill_ids
+from sql_app.models import Institution, Skills
+from sql_app.search import resolve_skill_filter
+
+
+def test_case_variants_resolve_to_one_skill_with_a_cold_cache(db):
+    first = resolve_skill_ids(db, ["Python"])
+    db.commit()
+    skill_cache.invalidate()
+
+    again = resolve_skill_ids(db, ["python", "  PYTHON "])
+    db.commit()
+
+    assert again == {"python": first["python"]}
+    assert db.scalars(select(Skills.name)).all() == ["Python"]
+
+
+def test_case_variants_resolve_to_one_skill_with_a_warm_cache(db):
+    first = resolve_skill_ids(db, ["Python"])
+    db.commit()
+    skill_cache.warm(db)
+
+    assert resolve_skill_ids(db, ["PYTHON"]) == first
+    assert db.scalar(select(func.count()).select_from(Skills)) == 1
+    assert skill_cache.autocomplete("py") == [{"id": first["python"], "name": "Python"}]
+
+
+def test_institution_names_ignore_case(db):
+    first = resolve_institution_ids(db, ["MIT"])
+    db.commit()
+    institution_cache.invalidate()
+
+    assert resolve_institution_ids(db, ["mit"]) == first
+    db.commit()
+    assert db.scalars(select(Institution.name)).all() == ["MIT"]
+
+
+def test_skill_filter_matches_any_case(db):
+    ids = resolve_skill_ids(db, ["Python", "SQL"])
+    db.commit()
+    skill_cache.invalidate()
+
+    assert resolve_skill_filter(db, ["python", "sql"]) == set(ids.values())
+    assert resolve_skill_filter(db, ["python", "rust"]) is None
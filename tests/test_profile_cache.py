@@ -0,0 +1,74 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from sql_app.cache import MemoryBackend, ProfileCache, document_key, profile_cache
+from sql_app.models import Experience
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    # The shared tier as the in-memory fake
+    backend = MemoryBackend()
+    monkeypatch.setattr(profile_cache, "backend", backend)
+    return backend
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def titles(response):
+    return [item["title"] for item in response.json()["data"]]
+
+
+def test_batch_writes_invalidate_at_commit(client, backend, make_profile):
+    profile = make_profile()
+    assert titles(client.get("/experiences/{}".format(profile.id))) == []
+    assert client.get("/profile/{}".format(profile.id)).json()["data"]["projects"] == []
+    assert backend.get(document_key("experiences", profile.id)) is not None
+
+    response = client.post("/add_experiences", json=[{
+        "profile_id": profile.id, "title": "Engineer", "company": "Acme", "location": None,
+        "start_date": "2022-01-01", "end_date": None, "description": None,
+    }])
+    assert response.status_code == 200
+    assert backend.get(document_key("experiences", profile.id)) is None
+    assert titles(client.get("/experiences/{}".format(profile.id))) == ["Engineer"]
+
+    response = client.post("/add_projects", json=[{
+        "profile_id": profile.id, "title": "Compiler", "description": "d", "start_date": "2023-01-01",
+        "end_date": "2023-06-01", "image": "compiler.png", "skills": ["Rust"],
+    }])
+    assert response.status_code == 200
+    document = client.get("/profile/{}".format(profile.id)).json()["data"]
+    assert [project["title"] for project in document["projects"]] == ["Compiler"]
+
+
+def test_rollback_keeps_cached_documents(client, backend, db, make_profile):
+    profile = make_profile()
+    cached = client.get("/experiences/{}".format(profile.id)).content
+    generation = profile_cache.generation
+
+    db.add(Experience(profile_id=profile.id, title="Never committed"))
+    db.flush()
+    db.rollback()
+
+    assert profile_cache.generation == generation
+    assert profile_cache.local.get(document_key("experiences", profile.id)) == cached
+    assert backend.get(document_key("experiences", profile.id)) == cached
+
+
+def test_documents_built_before_an_invalidation_are_dropped():
+    cache = ProfileCache(maxsize=10, local_ttl=30, ttl=60, backend=MemoryBackend())
+    generation = cache.generation
+    # A commit invalidates the profile while its stale document is being built
+    cache.invalidate([("profile", 1)])
+
+    assert cache.set_many({document_key("profile", 1): b"stale"}, generation) is False
+    assert cache.get(document_key("profile", 1)) is None
+    assert cache.backend.get(document_key("profile", 1)) is None
+
+    assert cache.set_many({document_key("profile", 1): b"fresh"}, cache.generation) is True
+    assert cache.get(document_key("profile", 1)) == b"fresh"
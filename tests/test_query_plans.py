@@ -0,0 +1,58 @@
+# The router's lookups must be served by indexes (benchmarks/explain_queries.py).
+# SQLite checks the schema sql_app.models creates; PostgreSQL runs against the
+# migrated database in TEST_POSTGRES_URL, and is skipped without one.
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+from benchmarks.explain_queries import router_queries, unindexed_queries
+from sql_app import database
+
+
+def assert_indexed(plans):
+    assert {name: scans for name, scans in plans.items() if scans} == {}
+
+
+def test_sqlite_plans_use_indexes():
+    assert_indexed(unindexed_queries(database.engine))
+
+
+def test_dropped_index_is_reported(tmp_path):
+    engine = create_engine("sqlite:///{}".format(tmp_path / "plans.db"))
+    database.Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_profile_skills_skill_id"))
+    plans = unindexed_queries(engine)
+    engine.dispose()
+    assert plans["search by skills"] == ["full scan of profile_skills"]
+    assert plans["profiles by skill"] == ["full scan of profile_skills"]
+
+
+def test_postgresql_queries_compile():
+    # The PostgreSQL-only search and autocomplete statements, without a server
+    queries = router_queries("postgresql")
+    assert {"search by text", "search by project title", "institution autocomplete"} <= queries.keys()
+    for query in queries.values():
+        query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+
+@pytest.fixture
+def postgres_engine():
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_engine(url)
+    try:
+        engine.connect().close()
+    except OperationalError as exc:
+        pytest.skip("PostgreSQL is unavailable: {}".format(exc))
+    yield engine
+    engine.dispose()
+
+
+def test_postgresql_plans_use_indexes(postgres_engine):
+    assert_indexed(unindexed_queries(postgres_engine))
@@ -0,0 +1,136 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+import main
+from sql_app.models import ProfileSearch, Project, Skills, User
+from sql_app.search import search_index
+from src.tokens import token_service
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def auth(db):
+    # A searching user without a profile of their own, so it never shows up in results
+    user = User(email="searcher@example.com", name="searcher", is_verified=True)
+    db.add(user)
+    db.commit()
+    return {"Authorization": "Bearer " + token_service.encode({"sub": user.email})}
+
+
+@pytest.fixture
+def skills(db):
+    python, sql, rust = Skills(name="Python"), Skills(name="SQL"), Skills(name="Rust")
+    db.add_all([python, sql, rust])
+    db.commit()
+    return python, sql, rust
+
+
+def search(client, auth, **params):
+    response = client.get("/search/profiles", params=params, headers=auth)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def names(body):
+    return [profile["full_name"] for profile in body["data"]]
+
+
+def document(db, profile_id):
+    db.expire_all()
+    return db.scalar(select(ProfileSearch.document).where(ProfileSearch.profile_id == profile_id))
+
+
+def test_documents_are_rebuilt_on_commit(client, auth, db, make_profile):
+    profile = make_profile(full_name="Ada Lovelace", address_area="London")
+    assert document(db, profile.id).split()[:4] == ["Ada", "Lovelace", "developer", "London"]
+    assert names(search(client, auth, q="lovelace")) == ["Ada Lovelace"]
+    assert search(client, auth, q="engine")["data"] == []
+
+    # A batch insert through Core marks the profile; the document and the index follow the commit
+    response = client.post("/add_experiences", json=[{
+        "profile_id": profile.id, "title": "Analyst", "company": "Analytical Engine", "location": None,
+        "start_date": "1842-01-01", "end_date": None, "description": None,
+    }])
+    assert response.status_code == 200
+    assert "Analytical Engine" in document(db, profile.id)
+    assert names(search(client, auth, q="engine")) == ["Ada Lovelace"]
+
+    db.add(Project(profile_id=profile.id, title="Never committed"))
+    db.flush()
+    db.rollback()
+    assert "committed" not in document(db, profile.id)
+    assert search(client, auth, q="committed")["data"] == []
+
+
+def test_text_search_uses_the_inverted_index(client, auth, make_profile, skills):
+    python, sql, _ = skills
+    make_profile("a@example.com", full_name="Grace Hopper", skills=[python])
+    make_profile("b@example.com", full_name="Grace Kelly", skills=[sql])
+
+    assert names(search(client, auth, q="GRACE")) == ["Grace Hopper", "Grace Kelly"]
+    assert search_index.stats()["loaded"]
+    # Every word must match, in any field of the document
+    assert names(search(client, auth, q="grace python")) == ["Grace Hopper"]
+    assert search(client, auth, q="grace rust")["data"] == []
+    assert search(client, auth, q="!!")["data"] == []
+
+
+def test_renamed_profiles_leave_the_index(client, auth, make_profile):
+    profile = make_profile(full_name="Alan Turing")
+    assert names(search(client, auth, q="turing")) == ["Alan Turing"]
+
+    owner = {"Authorization": "Bearer " + token_service.encode({"sub": "user@example.com"})}
+    response = client.put("/update_profile", json={"profile_id": profile.id, "full_name": "Alonzo Church"}, headers=owner)
+    assert response.status_code == 200
+    assert search(client, auth, q="turing")["data"] == []
+    assert names(search(client, auth, q="church")) == ["Alonzo Church"]
+
+
+def test_skill_filters_require_every_skill(client, auth, make_profile, skills):
+    python, sql, rust = skills
+    make_profile("a@example.com", full_name="Both", skills=[python, sql])
+    make_profile("b@example.com", full_name="Python only", skills=[python])
+    make_profile("c@example.com", full_name="All three", skills=[python, sql, rust])
+
+    assert names(search(client, auth, skills=["python", "Sql"])) == ["Both", "All three"]
+    assert names(search(client, auth, skills=["PYTHON", " python "])) == ["Both", "Python only", "All three"]
+    assert search(client, auth, skills=["Python", "Cobol"])["data"] == []
+
+
+def test_min_experience(client, auth, make_profile):
+    make_profile("a@example.com", full_name="Junior", experience=1)
+    make_profile("b@example.com", full_name="Mid", experience=3)
+    make_profile("c@example.com", full_name="Senior", experience=8)
+
+    assert names(search(client, auth, min_experience=3)) == ["Mid", "Senior"]
+    assert names(search(client, auth, min_experience=0)) == ["Junior", "Mid", "Senior"]
+    assert names(search(client, auth, q="senior", min_experience=10)) == []
+    assert client.get("/search/profiles", params={"min_experience": -1}, headers=auth).status_code == 422
+
+
+def test_facets_count_every_match_on_the_first_page(client, auth, make_profile, skills):
+    python, sql, rust = skills
+    make_profile("a@example.com", full_name="First", skills=[python, sql])
+    make_profile("b@example.com", full_name="Second", skills=[python])
+    make_profile("c@example.com", full_name="Third", skills=[python, rust], experience=9)
+
+    body = search(client, auth, limit=1, include_total=True)
+    assert names(body) == ["First"]
+    assert body["total"] == 3
+    assert body["facets"]["skills"] == [
+        {"value": "Python", "count": 3}, {"value": "Rust", "count": 1}, {"value": "SQL", "count": 1},
+    ]
+
+    second = search(client, auth, limit=1, cursor=body["next_cursor"])
+    assert names(second) == ["Second"]
+    assert second["facets"] == {}
+
+    filtered = search(client, auth, min_experience=5)
+    assert filtered["facets"]["skills"] == [{"value": "Python", "count": 1}, {"value": "Rust", "count": 1}]
+    assert search(client, auth, skills=["Cobol"])["facets"] == {"skills": []}
+    assert search(client, auth, facets=False)["facets"] == {}
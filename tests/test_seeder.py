@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine, func, select
+
+from sql_app import database
+from sql_app.models import Profile, Project, Skills, User
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_bulk_cli_seeds_rows(tmp_path):
+    url = "sqlite:///{}".format(tmp_path / "seed.db")
+    engine = create_engine(url)
+    database.Base.metadata.create_all(engine)
+
+    result = subprocess.run(
+        [sys.executable, "-m", "seeder.bulk", "--users", "5", "--projects-per-profile", "2", "--skills", "10"],
+        cwd=ROOT, env={**os.environ, "DATABASE_URL": url}, capture_output=True, text=True, check=True,
+    )
+
+    with engine.connect() as connection:
+        counts = {model.__tablename__: connection.scalar(select(func.count()).select_from(model)) for model in (User, Profile, Project, Skills)}
+    engine.dispose()
+    assert counts == {"users": 5, "profiles": 5, "projects": 10, "skills": 10}
+    assert result.stdout.splitlines()[-1].split()[1] != "0"
@@ -0,0 +1,46 @@
+import json
+import os
+from dataclasses import replace
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+import main
+from benchmarks import cold_start
+from sql_app import database
+from sql_app.cache import institution_cache, skill_cache
+from src import admin
+
+# Generous default, for slow CI machines; the benchmark's own budget is tighter
+COLD_START_BUDGET_MS = float(os.getenv("COLD_START_BUDGET_MS", "10000"))
+
+
+def test_lifespan_warms_up_and_reports_phases(monkeypatch):
+    monkeypatch.setattr(admin, "profiling_settings", replace(admin.profiling_settings, admin_token="s3cret"))
+    with database.engine.begin() as connection:
+        connection.execute(text("INSERT INTO skills (name) VALUES ('Python')"))
+        connection.execute(text("INSERT INTO institutions (name) VALUES ('MIT')"))
+        connection.execute(text("INSERT INTO countries (name, code) VALUES ('India', 'IN')"))
+
+    with TestClient(main.app) as client:
+        response = client.get("/startup", headers={"X-Admin-Token": "s3cret"})
+        assert skill_cache.get("python")[1] == "Python"
+        assert institution_cache.get("mit")[1] == "MIT"
+        # Served from the warmed country cache without a statement
+        countries = client.get("/countries/")
+        assert countries.json()["data"][0]["code"] == "IN"
+        assert 'desc="0 queries"' in countries.headers["server-timing"]
+
+    assert response.status_code == 200
+    report = response.json()["data"]
+    assert {"import", "pool", "caches", "queries", "total"} <= report.keys()
+    assert all(value >= 0 for value in report.values())
+
+
+def test_cold_start_within_budget(tmp_path):
+    out = tmp_path / "cold_start.json"
+    cold_start.main(["--runs", "1", "--budget-ms", str(COLD_START_BUDGET_MS), "--out", str(out)])
+
+    report = json.loads(out.read_text())
+    assert report["cold_start_ms"]["median"] <= COLD_START_BUDGET_MS
+    assert {"import", "pool", "caches"} <= report["phases_median_ms"].keys()
@@ -0,0 +1,40 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from src.tokens import HMACKey, TokenError, TokenService, b64encode, encode_segment
+
+service = TokenService(HMACKey("k1", "secret"))
+
+
+def signed(header, payload):
+    # A correctly signed token with arbitrary JSON in its header and payload
+    signing_input = encode_segment(header) + b"." + encode_segment(payload)
+    return (signing_input + b"." + b64encode(service.signing_key.sign(signing_input))).decode("ascii")
+
+
+def test_round_trip():
+    token = service.encode({"sub": "user@example.com", "exp": int(time.time()) + 60})
+    assert service.decode(token)["sub"] == "user@example.com"
+
+
+@pytest.mark.parametrize("token", [
+    "W10.e30.AA",  # header is a JSON array
+    "MQ.e30.AA",  # header is a JSON number
+    signed({"alg": "HS256", "kid": ["k1"]}, {}),
+    signed({"alg": "HS256", "kid": {"k": 1}}, {}),
+    signed({"alg": "HS256", "kid": "k1"}, ["sub"]),
+    signed({"alg": "HS256", "kid": "k1"}, {"sub": "user@example.com", "exp": "tomorrow"}),
+    "not-a-token",
+])
+def test_malformed_tokens_raise_token_error(token):
+    with pytest.raises(TokenError):
+        service.decode(token)
+
+
+def test_malformed_bearer_token_is_unauthorized():
+    client = TestClient(main.app)
+    response = client.get("/projects/1", headers={"Authorization": "Bearer W10.e30.AA"})
+    assert response.status_code == 401